@@ -7,9 +7,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, List
 
-from pmm.core.event_log import EventLog
+from pmm.core.event_log import EventLog, open_cursor
 from pmm.core.semantic_extractor import extract_claims
 
 
@@ -21,26 +21,46 @@ class ParsedClaim:
     value: str
 
 
+def claims_from_event(event: Dict[str, Any]) -> List[ParsedClaim]:
+    """Parse the structured claims carried by one event's content."""
+    lines = (event.get("content") or "").splitlines()
+    try:
+        parsed = extract_claims(lines)
+    except ValueError:
+        return []  # Invalid JSON, skip
+    claims = []
+    for claim_type, data in parsed:
+        if isinstance(data, dict) and "domain" in data and "value" in data:
+            claims.append(
+                ParsedClaim(
+                    event_id=event["id"],
+                    claim_type=claim_type,
+                    domain=data["domain"],
+                    value=data["value"],
+                )
+            )
+    return claims
+
+
+class ClaimTracker:
+    """Incremental claim projection advanced through a ledger cursor."""
+
+    def __init__(self, log: EventLog) -> None:
+        self._claims: List[ParsedClaim] = []
+        self._cursor = open_cursor(log, "coherence.claims")
+
+    def claims(self) -> List[ParsedClaim]:
+        self._cursor.fold(self._observe)
+        return list(self._claims)
+
+    def _observe(self, event: Dict[str, Any]) -> None:
+        self._claims.extend(claims_from_event(event))
+
+
 def extract_all_claims(log: EventLog) -> List[ParsedClaim]:
     """Extract all claims from event log using structured parsing.
 
-    Maps to ParsedClaim if data contains 'domain' and 'value'.
+    Maps to ParsedClaim if data contains 'domain' and 'value'. Long-lived
+    callers should hold a ClaimTracker instead of rescanning the ledger.
     """
-    claims = []
-    for event in log.read_all():
-        lines = (event.get("content") or "").splitlines()
-        try:
-            parsed = extract_claims(lines)
-        except ValueError:
-            continue  # Invalid JSON, skip
-        for claim_type, data in parsed:
-            if isinstance(data, dict) and "domain" in data and "value" in data:
-                claims.append(
-                    ParsedClaim(
-                        event_id=event["id"],
-                        claim_type=claim_type,
-                        domain=data["domain"],
-                        value=data["value"],
-                    )
-                )
-    return claims
+    return ClaimTracker(log).claims()
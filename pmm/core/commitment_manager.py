@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Tuple
 from hashlib import sha1
 
-from .event_log import EventLog
+from .event_log import EventLog, open_cursor
 from .schemas import (
     INTERNAL_COMMITMENT_ORIGIN,
     generate_internal_cid,
@@ -23,6 +23,8 @@ class CommitmentManager:
 
     def __init__(self, eventlog: EventLog) -> None:
         self.eventlog = eventlog
+        self._opens: Dict[str, Dict[str, Any]] = {}
+        self._cursor = open_cursor(eventlog, "commitment_manager.open")
 
     def open_internal(self, goal: str, reason: str = "") -> str:
         """Open an autonomy_kernel commitment; idempotent by (origin, goal)."""
@@ -206,9 +208,7 @@ class CommitmentManager:
         cid = (cid or "").strip()
         if not cid:
             return None
-        open_event = self._open_commitment_map().get(cid)
-        meta = (open_event or {}).get("meta") or {}
-        if meta.get("origin") != INTERNAL_COMMITMENT_ORIGIN:
+        if not self._open_commitments(cid=cid, origin=INTERNAL_COMMITMENT_ORIGIN):
             return None
         return self.close_commitment(
             cid,
@@ -221,38 +221,46 @@ class CommitmentManager:
         self, origin: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Return deterministic list of currently open commitments."""
-        opens = list(self._open_commitment_map().values())
-        if origin is not None:
-            opens = [
-                ev for ev in opens if (ev.get("meta") or {}).get("origin") == origin
-            ]
+        return self._open_commitments(origin=origin)
+
+    def _open_commitments(self, **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """Query the EventLog open-commitment table, or replay for bare logs."""
+        if isinstance(self.eventlog, EventLog):
+            return self.eventlog.open_commitments(**filters)
+        opens = [
+            ev
+            for ev in self._open_commitment_map().values()
+            if all(
+                value is None or (ev.get("meta") or {}).get(field) == value
+                for field, value in filters.items()
+            )
+        ]
         opens.sort(key=lambda ev: ev.get("id", 0))
         return opens
 
     def _open_commitment_map(self) -> Dict[str, Dict[str, Any]]:
         """Return map of open commitment events keyed by cid."""
-        events = self.eventlog.read_all()
-        opens: Dict[str, Dict[str, Any]] = {}
-        for event in events:
-            kind = event.get("kind")
-            meta = event.get("meta") or {}
-            cid = meta.get("cid")
-            if not isinstance(cid, str) or not cid:
-                continue
-            if kind == "commitment_open":
-                opens[cid] = event
-            elif kind == "commitment_close":
-                opens.pop(cid, None)
-        return opens
+        self._cursor.fold(self._apply_lifecycle_event)
+        return dict(self._opens)
+
+    def _apply_lifecycle_event(self, event: Dict[str, Any]) -> None:
+        kind = event.get("kind")
+        if kind not in ("commitment_open", "commitment_close"):
+            return
+        meta = event.get("meta") or {}
+        cid = meta.get("cid")
+        if not isinstance(cid, str) or not cid:
+            return
+        if kind == "commitment_open":
+            self._opens[cid] = event
+        else:
+            self._opens.pop(cid, None)
 
     def _find_open_commitment(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
         """Locate open commitment by (origin, goal) pair."""
         origin, goal = key
-        for event in self.get_open_commitments(origin=origin):
-            meta = event.get("meta") or {}
-            if meta.get("goal") == goal:
-                return event
-        return None
+        opens = self._open_commitments(origin=origin, goal=goal)
+        return opens[0] if opens else None
 
     def _next_event_id(self) -> int:
         """Return the next event id that will be allocated by EventLog."""
@@ -0,0 +1,353 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/core/compact_graph.py
+"""Array-backed directed graph for ledger-shaped projections.
+
+Nodes are event ids kept in one sorted ``array('i')`` with parallel per-node
+buffers, plus a dense id -> position slot array for O(1) lookup. Per-node
+buffers hold an interned kind code, an interned turn-protocol code, and the
+head/tail of that node's successor and predecessor chains. Edges live in
+parallel ``array`` buffers (source, target, interned label, next-out,
+next-in), so each adjacency walk touches only contiguous machine integers.
+Uncommon per-node attributes are kept in a sparse dict.
+
+The class implements the subset of the ``networkx.DiGraph`` surface that
+MemeGraph and its callers use (``nodes``/``edges`` views, ``successors``,
+``predecessors``, ``has_edge``, ``get_edge_data``...), at a fraction of the
+memory.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_NONE = -1
+_ZERO = array("i", [0])
+
+
+class _Interner:
+    """Bidirectional value <-> small-int table; code 0 is ``None``."""
+
+    def __init__(self) -> None:
+        self.values: List[Any] = [None]
+        self.codes: Dict[Any, int] = {None: 0}
+
+    def code(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            if code > 0xFFFF:
+                raise ValueError("too many distinct interned values")
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class NodeView:
+    """``G.nodes`` compatible view: iterable, indexable and callable."""
+
+    def __init__(self, graph: "CompactDiGraph") -> None:
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph._ids)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._graph._ids)
+
+    def __len__(self) -> int:
+        return len(self._graph._ids)
+
+    def __contains__(self, node: object) -> bool:
+        return self._graph.has_node(node)
+
+    def __getitem__(self, node: int) -> Dict[str, Any]:
+        return self._graph.attributes(node)
+
+    def __call__(self, data: bool = False):
+        if not data:
+            return list(self._graph._ids)
+        return [(node, self._graph.attributes(node)) for node in self._graph._ids]
+
+
+class EdgeView:
+    """``G.edges`` compatible view ordered by source id, then insertion."""
+
+    def __init__(self, graph: "CompactDiGraph") -> None:
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for source, target, _ in self._graph._iter_edges():
+            yield source, target
+
+    def __len__(self) -> int:
+        return len(self._graph._edge_src)
+
+    def __call__(self, data: Any = False):
+        labels = self._graph._labels.values
+        if data is True:
+            return [
+                (source, target, {"label": labels[code]})
+                for source, target, code in self._graph._iter_edges()
+            ]
+        if data == "label":
+            return [
+                (source, target, labels[code])
+                for source, target, code in self._graph._iter_edges()
+            ]
+        if data:
+            return [
+                (source, target, None)
+                for source, target, _ in self._graph._iter_edges()
+            ]
+        return list(self)
+
+
+class CompactDiGraph:
+    """Compact directed graph keyed by positive int32 event ids.
+
+    Each node carries ``kind`` and ``turn_protocol`` plus optional extra
+    attributes; each edge carries a single ``label``.
+    """
+
+    def __init__(self) -> None:
+        self._kinds = _Interner()
+        self._protocols = _Interner()
+        self._labels = _Interner()
+        self.nodes = NodeView(self)
+        self.edges = EdgeView(self)
+        self.clear()
+
+    def clear(self) -> None:
+        self._ids = array("i")
+        self._slot = array("i")
+        self._kind = array("H")
+        self._protocol = array("H")
+        self._out_head = array("i")
+        self._out_tail = array("i")
+        self._in_head = array("i")
+        self._in_tail = array("i")
+        self._extra: Dict[int, Dict[str, Any]] = {}
+        self._edge_src = array("i")
+        self._edge_dst = array("i")
+        self._edge_label = array("H")
+        self._edge_next_out = array("i")
+        self._edge_next_in = array("i")
+
+    # Nodes
+    def _position(self, node: object) -> int:
+        # ``_slot[event_id]`` holds position + 1, so 0 means absent.
+        if type(node) is not int or node < 0:
+            return _NONE
+        slot = self._slot
+        return slot[node] - 1 if node < len(slot) else _NONE
+
+    def _require(self, node: object) -> int:
+        position = self._position(node)
+        if position == _NONE:
+            raise KeyError(f"node {node!r} is not in the graph")
+        return position
+
+    def has_node(self, node: object) -> bool:
+        return self._position(node) != _NONE
+
+    def __contains__(self, node: object) -> bool:
+        return self.has_node(node)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, node: int) -> Dict[int, Dict[str, Any]]:
+        """Return ``{successor: {"label": ...}}`` like ``DiGraph[node]``."""
+        return {
+            target: {"label": label} for target, label in self.labeled_successors(node)
+        }
+
+    def add_node(self, node: int, **attrs: Any) -> None:
+        """Insert ``node`` (or update its attributes, as networkx does)."""
+        node = int(node)
+        if node < 0:
+            raise ValueError("node ids must be non-negative event ids")
+        position = self._position(node)
+        if position == _NONE:
+            ids, slot = self._ids, self._slot
+            if node >= len(slot):
+                # Grow geometrically so dense ledger ids append in amortized O(1).
+                slot.extend(_ZERO * max(node + 1 - len(slot), len(slot)))
+            if not ids or node > ids[-1]:
+                position = len(ids)
+                ids.append(node)
+                self._kind.append(0)
+                self._protocol.append(0)
+                self._out_head.append(_NONE)
+                self._out_tail.append(_NONE)
+                self._in_head.append(_NONE)
+                self._in_tail.append(_NONE)
+                slot[node] = position + 1
+            else:
+                # Out-of-order insert: shift the tail and renumber its slots.
+                position = bisect_left(ids, node)
+                for buffer, value in (
+                    (ids, node),
+                    (self._kind, 0),
+                    (self._protocol, 0),
+                    (self._out_head, _NONE),
+                    (self._out_tail, _NONE),
+                    (self._in_head, _NONE),
+                    (self._in_tail, _NONE),
+                ):
+                    buffer.insert(position, value)
+                for index in range(position, len(ids)):
+                    slot[ids[index]] = index + 1
+        if "kind" in attrs:
+            self._kind[position] = self._kinds.code(attrs.pop("kind"))
+        if "turn_protocol" in attrs:
+            self._protocol[position] = self._protocols.code(attrs.pop("turn_protocol"))
+        if attrs:
+            self._extra.setdefault(node, {}).update(attrs)
+
+    def kind(self, node: int) -> Optional[str]:
+        position = self._position(node)
+        if position == _NONE:
+            return None
+        return self._kinds.values[self._kind[position]]
+
+    def attributes(self, node: int) -> Dict[str, Any]:
+        """Return a fresh attribute dict for ``node``."""
+        position = self._require(node)
+        attrs = {
+            "kind": self._kinds.values[self._kind[position]],
+            "turn_protocol": self._protocols.values[self._protocol[position]],
+        }
+        extra = self._extra.get(node)
+        if extra:
+            attrs.update(extra)
+        return attrs
+
+    def number_of_nodes(self) -> int:
+        return len(self._ids)
+
+    def count_by_kind(self) -> Dict[str, int]:
+        counts = [0] * len(self._kinds.values)
+        for code in self._kind:
+            counts[code] += 1
+        return {
+            kind: count
+            for kind, count in zip(self._kinds.values, counts)
+            if kind and count
+        }
+
+    # Edges
+    def _find_edge(self, source: int, target: int) -> int:
+        position = self._position(source)
+        if position == _NONE:
+            return _NONE
+        dst, next_out = self._edge_dst, self._edge_next_out
+        edge = self._out_head[position]
+        while edge != _NONE:
+            if dst[edge] == target:
+                return edge
+            edge = next_out[edge]
+        return _NONE
+
+    def add_edge(self, source: int, target: int, *, label: Any = None) -> None:
+        """Add ``source -> target``; both nodes must already exist."""
+        source, target = int(source), int(target)
+        src_pos = self._require(source)
+        dst_pos = self._require(target)
+        existing = self._find_edge(source, target)
+        if existing != _NONE:
+            self._edge_label[existing] = self._labels.code(label)
+            return
+        edge = len(self._edge_src)
+        self._edge_src.append(source)
+        self._edge_dst.append(target)
+        self._edge_label.append(self._labels.code(label))
+        self._edge_next_out.append(_NONE)
+        self._edge_next_in.append(_NONE)
+        if self._out_tail[src_pos] == _NONE:
+            self._out_head[src_pos] = edge
+        else:
+            self._edge_next_out[self._out_tail[src_pos]] = edge
+        self._out_tail[src_pos] = edge
+        if self._in_tail[dst_pos] == _NONE:
+            self._in_head[dst_pos] = edge
+        else:
+            self._edge_next_in[self._in_tail[dst_pos]] = edge
+        self._in_tail[dst_pos] = edge
+
+    def has_edge(self, source: int, target: int) -> bool:
+        return self._find_edge(source, target) != _NONE
+
+    def get_edge_data(self, source: int, target: int) -> Optional[Dict[str, Any]]:
+        edge = self._find_edge(source, target)
+        if edge == _NONE:
+            return None
+        return {"label": self._labels.values[self._edge_label[edge]]}
+
+    def edge_label(self, source: int, target: int) -> Any:
+        edge = self._find_edge(source, target)
+        return None if edge == _NONE else self._labels.values[self._edge_label[edge]]
+
+    def number_of_edges(self) -> int:
+        return len(self._edge_src)
+
+    def successors(self, node: int) -> Iterator[int]:
+        dst, next_out = self._edge_dst, self._edge_next_out
+        edge = self._out_head[self._require(node)]
+        found = []
+        while edge != _NONE:
+            found.append(dst[edge])
+            edge = next_out[edge]
+        return iter(found)
+
+    def predecessors(self, node: int) -> Iterator[int]:
+        src, next_in = self._edge_src, self._edge_next_in
+        edge = self._in_head[self._require(node)]
+        found = []
+        while edge != _NONE:
+            found.append(src[edge])
+            edge = next_in[edge]
+        return iter(found)
+
+    def labeled_successors(self, node: int) -> List[Tuple[int, Any]]:
+        """Return ``[(successor, label), ...]`` in insertion order."""
+        dst, codes, next_out = self._edge_dst, self._edge_label, self._edge_next_out
+        labels = self._labels.values
+        edge = self._out_head[self._require(node)]
+        found = []
+        while edge != _NONE:
+            found.append((dst[edge], labels[codes[edge]]))
+            edge = next_out[edge]
+        return found
+
+    def labeled_predecessors(self, node: int) -> List[Tuple[int, Any]]:
+        """Return ``[(predecessor, label), ...]`` in insertion order."""
+        src, codes, next_in = self._edge_src, self._edge_label, self._edge_next_in
+        labels = self._labels.values
+        edge = self._in_head[self._require(node)]
+        found = []
+        while edge != _NONE:
+            found.append((src[edge], labels[codes[edge]]))
+            edge = next_in[edge]
+        return found
+
+    def out_edges(self, node: int, data: bool = False):
+        if data:
+            return [
+                (node, target, {"label": label})
+                for target, label in self.labeled_successors(node)
+            ]
+        return [(node, target) for target in self.successors(node)]
+
+    def _iter_edges(self) -> Iterator[Tuple[int, int, int]]:
+        dst, label, next_out = self._edge_dst, self._edge_label, self._edge_next_out
+        out_head = self._out_head
+        for position, source in enumerate(self._ids):
+            edge = out_head[position]
+            while edge != _NONE:
+                yield source, dst[edge], label[edge]
+                edge = next_out[edge]
@@ -13,7 +13,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
-from .event_log import EventLog
+from .event_log import EventLog, ProjectionSnapshot
 from .binding_attribution import projected_binding_origin
 from .identity_adoption import is_v1_authoritative_identity_adoption
 
@@ -68,6 +68,8 @@ class ConceptGraph:
             {}
         )  # token -> all versions
         self.aliases: Dict[str, str] = {}  # alias_token -> canonical_token
+        # Bumped whenever aliases change so canonicalized views can be reused.
+        self.alias_version: int = 0
         self.concept_edges: Set[Tuple[str, str, str]] = (
             set()
         )  # (from_token, to_token, relation)
@@ -77,11 +79,20 @@ class ConceptGraph:
         self.event_to_concepts: Dict[int, Set[str]] = {}  # event_id -> set of tokens
         # Track relations for event bindings: (token, event_id, relation)
         self.event_binding_relations: Set[Tuple[str, int, str]] = set()
+        # Query indexes derived from concept_edges / event_binding_relations:
+        # token -> relation -> neighbor tokens, and (token, relation) -> event_ids
+        self._outgoing: Dict[str, Dict[str, Set[str]]] = {}
+        self._incoming: Dict[str, Dict[str, Set[str]]] = {}
+        self._relation_events: Dict[Tuple[str, str], Set[int]] = {}
         # Thread bindings (concept -> cid, cid -> concepts)
         self.concept_cid_bindings: Dict[str, Set[str]] = {}
         self.cid_to_concepts: Dict[str, Set[str]] = {}
-        self.event_binding_attributions: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
-        self.thread_binding_attributions: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.event_binding_attributions: Dict[Tuple[str, int], List[Dict[str, Any]]] = (
+            {}
+        )
+        self.thread_binding_attributions: Dict[
+            Tuple[str, str], List[Dict[str, Any]]
+        ] = {}
 
         # Topological metadata for concepts (all rebuildable)
         # - concept_roots: earliest evidence binding for a concept token
@@ -99,10 +110,14 @@ class ConceptGraph:
         self.concepts.clear()
         self.concept_history.clear()
         self.aliases.clear()
+        self.alias_version += 1
         self.concept_edges.clear()
         self.concept_event_bindings.clear()
         self.event_to_concepts.clear()
         self.event_binding_relations.clear()
+        self._outgoing.clear()
+        self._incoming.clear()
+        self._relation_events.clear()
         self.concept_cid_bindings.clear()
         self.cid_to_concepts.clear()
         self.event_binding_attributions.clear()
@@ -117,6 +132,92 @@ class ConceptGraph:
             self._process_event(event)
             self.last_event_id = event["id"]
 
+    def projection_snapshot(self) -> ProjectionSnapshot:
+        """Snapshot hooks for ``EventLog.rebuild_and_register_listener``."""
+        return ProjectionSnapshot(
+            version=1, dump=self._dump_state, load=self._load_state
+        )
+
+    def _dump_state(self) -> Dict[str, Any]:
+        return {
+            "concept_history": {
+                token: [definition.to_dict() for definition in history]
+                for token, history in self.concept_history.items()
+            },
+            "aliases": self.aliases,
+            "concept_edges": sorted(self.concept_edges),
+            "concept_event_bindings": [
+                [token, sorted(ids)]
+                for token, ids in self.concept_event_bindings.items()
+            ],
+            "event_to_concepts": [
+                [event_id, sorted(tokens)]
+                for event_id, tokens in self.event_to_concepts.items()
+            ],
+            "event_binding_relations": sorted(self.event_binding_relations),
+            "concept_cid_bindings": [
+                [token, sorted(cids, key=str)]
+                for token, cids in self.concept_cid_bindings.items()
+            ],
+            "cid_to_concepts": [
+                [cid, sorted(tokens)] for cid, tokens in self.cid_to_concepts.items()
+            ],
+            "event_binding_attributions": [
+                [list(key), records]
+                for key, records in self.event_binding_attributions.items()
+            ],
+            "thread_binding_attributions": [
+                [list(key), records]
+                for key, records in self.thread_binding_attributions.items()
+            ],
+            "concept_roots": self.concept_roots,
+            "concept_tails": self.concept_tails,
+            "concept_kinds": self.concept_kinds,
+            "last_event_id": self.last_event_id,
+        }
+
+    def _load_state(self, state: Dict[str, Any]) -> None:
+        self.rebuild([])
+        for token, history in state["concept_history"].items():
+            versions: List[ConceptDefinition] = []
+            for data in history:
+                definition = ConceptDefinition(
+                    token=data["token"],
+                    concept_kind=data["concept_kind"],
+                    definition=data["definition"],
+                    attributes=data["attributes"],
+                    version=data["version"],
+                    concept_id=data["concept_id"],
+                    event_id=data["event_id"],
+                )
+                definition.supersedes = data["supersedes"]
+                versions.append(definition)
+            self.concept_history[token] = versions
+            if versions:
+                self.concepts[token] = versions[-1]
+        self.aliases.update(state["aliases"])
+        self.alias_version += 1
+        for from_tok, to_tok, relation in state["concept_edges"]:
+            self._add_edge(from_tok, to_tok, relation)
+        for token, ids in state["concept_event_bindings"]:
+            self.concept_event_bindings[token] = set(ids)
+        for event_id, tokens in state["event_to_concepts"]:
+            self.event_to_concepts[event_id] = set(tokens)
+        for token, event_id, relation in state["event_binding_relations"]:
+            self._add_binding_relation(token, event_id, relation)
+        for token, cids in state["concept_cid_bindings"]:
+            self.concept_cid_bindings[token] = set(cids)
+        for cid, tokens in state["cid_to_concepts"]:
+            self.cid_to_concepts[cid] = set(tokens)
+        for key, records in state["event_binding_attributions"]:
+            self.event_binding_attributions[tuple(key)] = list(records)
+        for key, records in state["thread_binding_attributions"]:
+            self.thread_binding_attributions[tuple(key)] = list(records)
+        self.concept_roots.update(state["concept_roots"])
+        self.concept_tails.update(state["concept_tails"])
+        self.concept_kinds.update(state["concept_kinds"])
+        self.last_event_id = int(state["last_event_id"])
+
     def sync(self, event: Dict[str, Any]) -> None:
         """Incrementally update ConceptGraph with a new event (idempotent)."""
         event_id = event.get("id")
@@ -245,6 +346,7 @@ class ConceptGraph:
 
         if from_token and to_token:
             self.aliases[from_token] = to_token
+            self.alias_version += 1
 
     def _process_concept_bind_event(self, event: Dict[str, Any]) -> None:
         """Process concept_bind_event event."""
@@ -291,7 +393,7 @@ class ConceptGraph:
 
             # Track relation if present
             if relation:
-                self.event_binding_relations.add((canonical, event_id, relation))
+                self._add_binding_relation(canonical, event_id, relation)
 
     def _process_concept_relate(self, event: Dict[str, Any]) -> None:
         """Process concept_relate event."""
@@ -312,7 +414,16 @@ class ConceptGraph:
         to_canonical = self.canonical_token(to_token)
 
         # Add edge (deduplicated by set)
-        self.concept_edges.add((from_canonical, to_canonical, relation))
+        self._add_edge(from_canonical, to_canonical, relation)
+
+    def _add_edge(self, from_tok: str, to_tok: str, relation: str) -> None:
+        self.concept_edges.add((from_tok, to_tok, relation))
+        self._outgoing.setdefault(from_tok, {}).setdefault(relation, set()).add(to_tok)
+        self._incoming.setdefault(to_tok, {}).setdefault(relation, set()).add(from_tok)
+
+    def _add_binding_relation(self, token: str, event_id: int, relation: str) -> None:
+        self.event_binding_relations.add((token, event_id, relation))
+        self._relation_events.setdefault((token, relation), set()).add(event_id)
 
     def _process_concept_bind_thread(self, event: Dict[str, Any]) -> None:
         """Process concept_bind_thread event."""
@@ -346,7 +457,7 @@ class ConceptGraph:
 
             if relation:
                 # Track relation in event_binding_relations for symmetry with event bindings
-                self.event_binding_relations.add((canonical, -1, relation))
+                self._add_binding_relation(canonical, -1, relation)
 
     # --- Query API ---
 
@@ -418,9 +529,7 @@ class ConceptGraph:
             "binding_protocol": meta.get("binding_protocol"),
             "attribution_id": meta.get("attribution_id"),
             "origin_event_id": meta.get("origin_event_id"),
-            "derived_from_binding_event_id": meta.get(
-                "derived_from_binding_event_id"
-            ),
+            "derived_from_binding_event_id": meta.get("derived_from_binding_event_id"),
         }
         records = target.setdefault(key, [])
         identity = record.get("attribution_id") or (
@@ -456,11 +565,7 @@ class ConceptGraph:
             return sorted(event_ids)
 
         # Filter by relation
-        filtered_ids: Set[int] = set()
-        for tok, eid, rel in self.event_binding_relations:
-            if tok == canonical and rel == relation:
-                filtered_ids.add(eid)
-        return sorted(filtered_ids)
+        return sorted(self._relation_events.get((canonical, relation), ()))
 
     def concepts_for_event(self, event_id: int) -> List[str]:
         """Get sorted list of concept tokens bound to an event."""
@@ -478,17 +583,8 @@ class ConceptGraph:
             Sorted list of neighbor tokens (both incoming and outgoing)
         """
         canonical = self.canonical_token(token)
-        neighbors_set: Set[str] = set()
-
-        for from_tok, to_tok, rel in self.concept_edges:
-            if relation is not None and rel != relation:
-                continue
-
-            if from_tok == canonical:
-                neighbors_set.add(to_tok)
-            elif to_tok == canonical:
-                neighbors_set.add(from_tok)
-
+        neighbors_set = self._adjacent(self._outgoing, canonical, relation)
+        neighbors_set |= self._adjacent(self._incoming, canonical, relation)
         return sorted(neighbors_set)
 
     def outgoing_neighbors(
@@ -496,28 +592,30 @@ class ConceptGraph:
     ) -> List[str]:
         """Get outgoing concept neighbors (token -> neighbor)."""
         canonical = self.canonical_token(token)
-        neighbors_set: Set[str] = set()
-
-        for from_tok, to_tok, rel in self.concept_edges:
-            if from_tok == canonical:
-                if relation is None or rel == relation:
-                    neighbors_set.add(to_tok)
-
-        return sorted(neighbors_set)
+        return sorted(self._adjacent(self._outgoing, canonical, relation))
 
     def incoming_neighbors(
         self, token: str, relation: Optional[str] = None
     ) -> List[str]:
         """Get incoming concept neighbors (neighbor -> token)."""
         canonical = self.canonical_token(token)
-        neighbors_set: Set[str] = set()
+        return sorted(self._adjacent(self._incoming, canonical, relation))
 
-        for from_tok, to_tok, rel in self.concept_edges:
-            if to_tok == canonical:
-                if relation is None or rel == relation:
-                    neighbors_set.add(from_tok)
-
-        return sorted(neighbors_set)
+    @staticmethod
+    def _adjacent(
+        adjacency: Dict[str, Dict[str, Set[str]]],
+        token: str,
+        relation: Optional[str],
+    ) -> Set[str]:
+        by_relation = adjacency.get(token)
+        if not by_relation:
+            return set()
+        if relation is not None:
+            return set(by_relation.get(relation, ()))
+        out: Set[str] = set()
+        for tokens in by_relation.values():
+            out |= tokens
+        return out
 
     def concepts_for_thread(self, meme_graph: MemeGraph, cid: str) -> List[str]:
         """Get sorted list of concepts associated with a thread (via MemeGraph).
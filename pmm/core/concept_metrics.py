@@ -5,14 +5,28 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pmm.core.event_log import EventLog
 from pmm.core.concept_graph import ConceptGraph
 
 
-def compute_concept_metrics(eventlog: EventLog) -> Dict[str, any]:
+def _concept_graph(
+    eventlog: EventLog, concept_graph: Optional[ConceptGraph]
+) -> ConceptGraph:
+    if concept_graph is not None:
+        return concept_graph
+    cg = ConceptGraph(eventlog)
+    cg.rebuild(eventlog.read_all())
+    return cg
+
+
+def compute_concept_metrics(
+    eventlog: EventLog, concept_graph: Optional[ConceptGraph] = None
+) -> Dict[str, any]:
     """Compute concept-level metrics for RSM integration.
 
+    Pass an already-synced ``concept_graph`` to skip the ledger rebuild.
+
     Returns:
         Dictionary with:
         - concepts_used: Dict[token, count] - concept usage counts
@@ -20,8 +34,7 @@ def compute_concept_metrics(eventlog: EventLog) -> Dict[str, any]:
         - concept_conflicts: List[token] - concepts with conflicting relations
         - hot_concepts: List[token] - recently active concepts
     """
-    cg = ConceptGraph(eventlog)
-    cg.rebuild(eventlog.read_all())
+    cg = _concept_graph(eventlog, concept_graph)
 
     # Compute usage counts
     concepts_used: Dict[str, int] = {}
@@ -59,14 +72,15 @@ def compute_concept_metrics(eventlog: EventLog) -> Dict[str, any]:
     }
 
 
-def get_governance_concepts(eventlog: EventLog) -> List[str]:
+def get_governance_concepts(
+    eventlog: EventLog, concept_graph: Optional[ConceptGraph] = None
+) -> List[str]:
     """Get list of governance/policy concept tokens.
 
     Returns:
         Sorted list of governance-related concept tokens
     """
-    cg = ConceptGraph(eventlog)
-    cg.rebuild(eventlog.read_all())
+    cg = _concept_graph(eventlog, concept_graph)
 
     governance_tokens: List[str] = []
     for token in cg.concepts.keys():
@@ -77,7 +91,9 @@ def get_governance_concepts(eventlog: EventLog) -> List[str]:
     return sorted(governance_tokens)
 
 
-def check_concept_health(eventlog: EventLog) -> Dict[str, any]:
+def check_concept_health(
+    eventlog: EventLog, concept_graph: Optional[ConceptGraph] = None
+) -> Dict[str, any]:
     """Check health of concept layer for autonomy decisions.
 
     Returns:
@@ -90,8 +106,9 @@ def check_concept_health(eventlog: EventLog) -> Dict[str, any]:
         - conflict_count: int
         - health_score: float (0.0-1.0)
     """
-    metrics = compute_concept_metrics(eventlog)
-    governance = get_governance_concepts(eventlog)
+    cg = _concept_graph(eventlog, concept_graph)
+    metrics = compute_concept_metrics(eventlog, cg)
+    governance = get_governance_concepts(eventlog, cg)
 
     total_concepts = len(metrics["concepts_used"])
     total_bindings = sum(metrics["concepts_used"].values())
@@ -15,11 +15,15 @@ import os
 import sqlite3
 import threading
 import weakref
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from hashlib import sha256
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from pmm.core import merkle
 from pmm.core.semantic_extractor import extract_closures, extract_commitments
 from pmm.core.writer_session import (
     WriterOwnershipBusy,
@@ -172,6 +176,300 @@ class _ListenerRegistration:
     callback: Callable[[Dict[str, Any]], None]
     required: bool
     applied_through: int = 0
+    snapshot: Optional["ProjectionSnapshot"] = None
+    snapshot_through: int = 0
+    # Instance shared through ``EventLog.projection`` under ``name``
+    projection: Any = None
+
+
+@dataclass(frozen=True)
+class ProjectionSnapshot:
+    """Dump/load hooks that let a projection resume from a persisted watermark.
+
+    ``dump`` returns JSON-serializable state covering exactly the events the
+    listener has been delivered; ``load`` restores it into an empty
+    projection. Bump ``version`` whenever the dumped shape changes.
+    """
+
+    version: int
+    dump: Callable[[], Dict[str, Any]]
+    load: Callable[[Dict[str, Any]], None]
+
+
+@dataclass
+class _AppendState:
+    """Writer-side chain head and latest-config-by-type index."""
+
+    stamp: tuple
+    head_id: int = 0
+    head_hash: Optional[str] = None
+    configs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def observe_config(self, content: Optional[str]) -> None:
+        try:
+            data = json.loads(content or "{}")
+        except Exception:
+            return
+        if isinstance(data, dict) and isinstance(data.get("type"), str):
+            self.configs[data["type"]] = data
+
+
+@dataclass
+class _AppendBatch:
+    """Open ``EventLog.batch`` transaction and its deferred listener deliveries."""
+
+    asserted_at: float
+    committed_through: int = 0
+    pending: List[tuple] = field(default_factory=list)
+    savepoint_open: bool = False
+
+
+class ProjectionCursor:
+    """Consumer-held ledger position that hands back only unapplied events.
+
+    ``fold`` advances ``applied_through`` after each callback returns, so an
+    event whose application raised is offered again on the next call.
+    """
+
+    def __init__(
+        self,
+        eventlog: "EventLog",
+        *,
+        name: str,
+        applied_through: int = 0,
+        batch_size: int = 512,
+    ) -> None:
+        if int(batch_size) < 1:
+            raise ValueError("batch_size must be positive")
+        self.eventlog = eventlog
+        self.name = name
+        self.applied_through = max(0, int(applied_through))
+        self.batch_size = int(batch_size)
+
+    def fold(self, apply: Callable[[Dict[str, Any]], None]) -> int:
+        """Apply every event after the cursor in id order; return the watermark."""
+        read_since = getattr(self.eventlog, "read_since", None)
+        if read_since is None:
+            # Duck-typed ledgers without ranged reads: one full pass.
+            for event in self.eventlog.read_all():
+                event_id = event.get("id")
+                if isinstance(event_id, int) and event_id > self.applied_through:
+                    apply(event)
+                    self.applied_through = event_id
+            return self.applied_through
+        while True:
+            events = read_since(self.applied_through, self.batch_size)
+            for event in events:
+                apply(event)
+                self.applied_through = int(event["id"])
+            if len(events) < self.batch_size:
+                return self.applied_through
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Return every event after the cursor and advance past them."""
+        out: List[Dict[str, Any]] = []
+        self.fold(out.append)
+        return out
+
+    def reset(self, applied_through: int = 0) -> None:
+        self.applied_through = max(0, int(applied_through))
+
+
+def open_cursor(
+    eventlog: Any, name: str, *, applied_through: int = 0, batch_size: int = 512
+) -> ProjectionCursor:
+    """Open a cursor on ``eventlog``, registering it when the log supports it."""
+    opener = getattr(eventlog, "open_cursor", None)
+    if callable(opener):
+        return opener(name, applied_through=applied_through, batch_size=batch_size)
+    return ProjectionCursor(
+        eventlog, name=name, applied_through=applied_through, batch_size=batch_size
+    )
+
+
+EVENT_COLUMNS = ("id", "ts", "kind", "content", "meta", "prev_hash", "hash")
+# Ids per ``WHERE id IN (...)`` statement in get_many/exists_many; well under
+# SQLite's bound-parameter limit.
+_BULK_FETCH_CHUNK = 500
+# Committed rows kept in front of get_many. Rows never change once committed.
+_HOT_EVENT_CAPACITY = 1024
+_UNDECODED = object()
+
+
+class EventRow(Mapping):
+    """Read-only event view over a SQLite row; ``meta`` is decoded on first access.
+
+    Rows from ``iter_events(columns=...)`` only carry the selected columns;
+    reading any other key raises ``KeyError`` (``get`` returns the default).
+    """
+
+    __slots__ = ("_row", "_meta")
+
+    def __init__(self, row: sqlite3.Row) -> None:
+        self._row = row
+        self._meta: Any = _UNDECODED
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "meta":
+            if self._meta is _UNDECODED:
+                try:
+                    raw = self._row["meta"]
+                except IndexError:
+                    raise KeyError(key) from None
+                self._meta = json.loads(raw or "{}")
+            return self._meta
+        try:
+            return self._row[key]
+        except IndexError:
+            raise KeyError(key) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._row.keys())
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __repr__(self) -> str:
+        return f"EventRow(id={self._row['id']!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self._row.keys()}
+
+
+_JOURNAL_MODES = frozenset({"wal", "delete", "truncate", "persist"})
+_SYNCHRONOUS_LEVELS = frozenset({"off", "normal", "full", "extra"})
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """Opt-in SQLite tuning and read-connection pool for file-backed ledgers.
+
+    ``journal_mode``/``synchronous`` apply to the writer connection only;
+    page-cache and mmap sizes apply to every connection. ``read_pool_size``
+    read-only connections serve ``EventLog`` reads concurrently with the
+    writer; writes, the writer lease and fencing still go through the single
+    writer connection.
+    """
+
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size_kib: int = 64 * 1024
+    read_pool_size: int = 4
+
+    def __post_init__(self) -> None:
+        if self.journal_mode.lower() not in _JOURNAL_MODES:
+            raise ValueError(f"unsupported journal_mode: {self.journal_mode!r}")
+        if self.synchronous.lower() not in _SYNCHRONOUS_LEVELS:
+            raise ValueError(f"unsupported synchronous level: {self.synchronous!r}")
+        if self.mmap_size < 0 or self.cache_size_kib < 0 or self.read_pool_size < 0:
+            raise ValueError("storage profile sizes must be non-negative")
+
+    def apply(self, conn: sqlite3.Connection, *, writable: bool) -> None:
+        if writable:
+            mode = conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            applied = str(mode.fetchone()[0]).lower()
+            if applied != self.journal_mode.lower():
+                raise RuntimeError(f"journal_mode {self.journal_mode!r} not applied")
+            conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+
+
+WAL_STORAGE_PROFILE = StorageProfile()
+
+
+class _ReadPool:
+    """Bounded pool of read-only connections opened on demand."""
+
+    def __init__(self, path: str, profile: StorageProfile) -> None:
+        self._path = path
+        self._profile = profile
+        self._idle: List[sqlite3.Connection] = []
+        self._opened = 0
+        self._closed = False
+        self._available = threading.Condition()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self._path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=5.0,
+        )
+        conn.row_factory = sqlite3.Row
+        self._profile.apply(conn, writable=False)
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        with self._available:
+            while not self._idle and self._opened >= self._profile.read_pool_size:
+                self._available.wait()
+            if self._closed:
+                raise RuntimeError("EventLog read pool is closed")
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._opened += 1
+        if conn is None:
+            try:
+                conn = self._open()
+            except BaseException:
+                with self._available:
+                    self._opened -= 1
+                    self._available.notify()
+                raise
+        try:
+            yield conn
+        finally:
+            with self._available:
+                if self._closed:
+                    conn.close()
+                    self._opened -= 1
+                else:
+                    self._idle.append(conn)
+                self._available.notify()
+
+    def close(self) -> None:
+        with self._available:
+            self._closed = True
+            for conn in self._idle:
+                conn.close()
+            self._opened -= len(self._idle)
+            self._idle.clear()
+            self._available.notify_all()
+
+
+class _TrackedRLock:
+    """Re-entrant lock that can report whether the calling thread holds it."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._owner: Optional[int] = None
+        self._depth = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._owner = threading.get_ident()
+            self._depth += 1
+        return acquired
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+        self._lock.release()
+
+    def held(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
 
 
 def _iso_now() -> str:
@@ -194,9 +492,98 @@ def _event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
     }
 
 
+@dataclass(frozen=True)
+class SecondaryIndex:
+    """Expression index over one JSON field of the listed event kinds.
+
+    SQLite maintains the index inside each append transaction. ``content``
+    fields are indexed only where the content is valid JSON, so free-text
+    events of the same kind never fail to insert.
+    """
+
+    name: str
+    column: str
+    path: str
+    kinds: Tuple[str, ...]
+
+    @property
+    def expression(self) -> str:
+        return f"json_extract({self.column}, '{self.path}')"
+
+    @property
+    def predicate(self) -> str:
+        kinds = ", ".join(f"'{kind}'" for kind in self.kinds)
+        clause = f"kind IN ({kinds})"
+        if self.column == "content":
+            clause += " AND json_valid(content)"
+        return clause
+
+    def ddl(self) -> str:
+        return (
+            f"CREATE INDEX IF NOT EXISTS idx_events_{self.name} "
+            f"ON events({self.expression}, id) WHERE {self.predicate}"
+        )
+
+
+SECONDARY_INDEXES: Dict[str, SecondaryIndex] = {
+    index.name: index
+    for index in (
+        SecondaryIndex(
+            "commitment_cid", "meta", "$.cid", ("commitment_open", "commitment_close")
+        ),
+        SecondaryIndex(
+            "embedding_event_id", "content", "$.event_id", ("embedding_add",)
+        ),
+        SecondaryIndex(
+            "autonomy_slot_id",
+            "meta",
+            "$.slot_id",
+            ("autonomy_stimulus", "autonomy_tick"),
+        ),
+        SecondaryIndex("config_type", "content", "$.type", ("config",)),
+    )
+}
+
+
+# Lifecycle rows whose meta carries a non-empty text cid. Anything else is
+# ignored by the open-commitment projection, matching CommitmentManager.
+_LIFECYCLE_CID_GUARD = (
+    "CASE WHEN json_valid(NEW.meta) "
+    "THEN json_type(NEW.meta, '$.cid') = 'text' "
+    "AND json_extract(NEW.meta, '$.cid') != '' ELSE 0 END"
+)
+
+
+def _replay_open_commitments(conn: sqlite3.Connection) -> List[Tuple[Any, ...]]:
+    """Fold lifecycle history into ``(cid, open_event_id, origin, goal)`` rows."""
+    opens: Dict[str, Tuple[Any, ...]] = {}
+    for row in conn.execute(
+        "SELECT id, kind, meta FROM events "
+        "WHERE kind IN ('commitment_open', 'commitment_close') ORDER BY id"
+    ):
+        try:
+            meta = json.loads(row["meta"] or "{}")
+        except (TypeError, json.JSONDecodeError):
+            continue
+        cid = meta.get("cid") if isinstance(meta, dict) else None
+        if not isinstance(cid, str) or not cid:
+            continue
+        if row["kind"] == "commitment_open":
+            opens[cid] = (cid, int(row["id"]), meta.get("origin"), meta.get("goal"))
+        else:
+            opens.pop(cid, None)
+    return sorted(opens.values(), key=lambda item: item[1])
+
+
 class EventLog:
     """Persistent append-only log of events with hash chaining."""
 
+    # Minimum events a snapshot-capable projection may advance before the
+    # projection barrier re-persists its snapshot. The gap grows with the
+    # snapshot's own watermark so re-serialization stays amortized linear;
+    # close() persists whatever is left.
+    SNAPSHOT_INTERVAL = 1000
+
     def __init__(
         self,
         path: str = ":memory:",
@@ -206,6 +593,7 @@ class EventLog:
         writer_role: str = "runtime",
         lease_seconds: float = 30.0,
         heartbeat_seconds: float = 5.0,
+        storage: StorageProfile | None = None,
     ) -> None:
         if mode not in {"reader", "writer"}:
             raise ValueError("EventLog mode must be 'reader' or 'writer'")
@@ -215,6 +603,8 @@ class EventLog:
             raise ValueError("reader EventLog cannot receive a writer session")
         if mode == "reader" and path == ":memory:":
             raise ValueError("reader mode requires a file-backed database")
+        if storage is not None and path == ":memory:":
+            raise ValueError("storage profiles require a file-backed database")
 
         self.path = path
         self.mode = mode
@@ -241,8 +631,15 @@ class EventLog:
             # a bounded SQLite busy timeout after the fence has been acquired.
             self._conn.execute("PRAGMA busy_timeout = 0")
         self._conn.row_factory = sqlite3.Row
-        self._lock = threading.RLock()
+        self._lock = _TrackedRLock()
+        self.storage = storage
+        self._read_pool: Optional[_ReadPool] = None
+        self._hot_events: "OrderedDict[int, sqlite3.Row]" = OrderedDict()
+        self._hot_lock = threading.Lock()
         self._listeners: List[_ListenerRegistration] = []
+        self._cursors: weakref.WeakSet[ProjectionCursor] = weakref.WeakSet()
+        self._append_state: Optional[_AppendState] = None
+        self._batch: Optional[_AppendBatch] = None
         self._managed_assistant_producers: weakref.WeakSet[Any] = weakref.WeakSet()
         self._conn.create_function(
             "pmm_writer_owner",
@@ -263,6 +660,8 @@ class EventLog:
                     heartbeat_seconds=heartbeat_seconds,
                 )
             try:
+                if storage is not None:
+                    storage.apply(self._conn, writable=True)
                 self._init_db()
                 self._conn.execute("PRAGMA busy_timeout = 5000")
                 self.writer_session.start_heartbeat()
@@ -276,6 +675,10 @@ class EventLog:
                 self._conn.close()
                 self._closed = True
                 raise
+        elif storage is not None:
+            storage.apply(self._conn, writable=False)
+        if storage is not None and storage.read_pool_size > 0:
+            self._read_pool = _ReadPool(path, storage)
 
     def _init_db(self) -> None:
         try:
@@ -337,6 +740,8 @@ class EventLog:
                 WHERE kind = 'identity_adoption'
                   AND json_extract(meta, '$.adoption_protocol') = 'r06.v1';
                 """)
+            for index in SECONDARY_INDEXES.values():
+                self._conn.execute(index.ddl())
             # Authority is registered only by the governed transaction below.
             # Protocol-shaped raw history must not reserve cardinality.
             self._conn.execute("DROP INDEX IF EXISTS idx_commitment_outcome_v1_open")
@@ -376,6 +781,17 @@ class EventLog:
                     updated_at REAL NOT NULL
                 )
                 """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pmm_projection_snapshots (
+                    projection_name TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    applied_through INTEGER NOT NULL,
+                    anchor_hash TEXT,
+                    payload TEXT NOT NULL,
+                    payload_hash TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """)
             self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS pmm_managed_terminal_outcomes (
                     event_id INTEGER PRIMARY KEY,
@@ -417,6 +833,8 @@ class EventLog:
                     FOREIGN KEY(event_id) REFERENCES events(id)
                 )
                 """)
+            self._init_open_commitments()
+            self._init_merkle()
             assert self.writer_session is not None
             if self._owns_writer_session:
                 self.writer_session.acquire_in_transaction(self._conn)
@@ -453,12 +871,134 @@ class EventLog:
             self._conn.rollback()
             raise
 
+    def _init_open_commitments(self) -> None:
+        """Create the open-commitment side table and its maintenance triggers.
+
+        Triggers keep the table inside every append transaction, whichever
+        writer path inserted the lifecycle row. A ledger opened for the first
+        time since the table was introduced is backfilled from history.
+        """
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master "
+            "WHERE type = 'table' AND name = 'pmm_open_commitments'"
+        ).fetchone()
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pmm_open_commitments (
+                cid TEXT PRIMARY KEY,
+                open_event_id INTEGER NOT NULL UNIQUE,
+                origin TEXT,
+                goal TEXT,
+                FOREIGN KEY(open_event_id) REFERENCES events(id)
+            )
+            """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_open_commitments_origin_goal "
+            "ON pmm_open_commitments(origin, goal, open_event_id)"
+        )
+        self._conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS pmm_open_commitments_on_open
+            AFTER INSERT ON events
+            WHEN NEW.kind = 'commitment_open' AND {_LIFECYCLE_CID_GUARD}
+            BEGIN
+                INSERT OR REPLACE INTO pmm_open_commitments
+                    (cid, open_event_id, origin, goal)
+                VALUES (
+                    json_extract(NEW.meta, '$.cid'),
+                    NEW.id,
+                    json_extract(NEW.meta, '$.origin'),
+                    json_extract(NEW.meta, '$.goal')
+                );
+            END
+            """)
+        self._conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS pmm_open_commitments_on_close
+            AFTER INSERT ON events
+            WHEN NEW.kind = 'commitment_close' AND {_LIFECYCLE_CID_GUARD}
+            BEGIN
+                DELETE FROM pmm_open_commitments
+                WHERE cid = json_extract(NEW.meta, '$.cid');
+            END
+            """)
+        if exists is None:
+            self._conn.executemany(
+                "INSERT INTO pmm_open_commitments "
+                "(cid, open_event_id, origin, goal) VALUES (?, ?, ?, ?)",
+                _replay_open_commitments(self._conn),
+            )
+
+    def _init_merkle(self) -> None:
+        """Create the Merkle mountain range tables and cover existing events."""
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pmm_merkle_leaves (
+                event_id INTEGER PRIMARY KEY,
+                leaf_index INTEGER NOT NULL
+            )
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS pmm_merkle_nodes (
+                level INTEGER NOT NULL,
+                idx INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY(level, idx)
+            ) WITHOUT ROWID
+            """)
+        self._extend_merkle()
+
+    def _extend_merkle(self) -> None:
+        """Append a leaf (and any completed parents) per event not yet covered.
+
+        Runs inside the append transaction, so leaves commit with their events.
+        """
+        last = self._conn.execute(
+            "SELECT event_id, leaf_index FROM pmm_merkle_leaves "
+            "ORDER BY event_id DESC LIMIT 1"
+        ).fetchone()
+        rows = self._conn.execute(
+            "SELECT id, hash FROM events WHERE id > ? ORDER BY id ASC",
+            (int(last[0]) if last else 0,),
+        ).fetchall()
+        if not rows:
+            return
+        next_index = int(last[1]) + 1 if last else 0
+        written: Dict[Tuple[int, int], str] = {}
+
+        def node(level: int, index: int) -> str:
+            value = written.get((level, index))
+            if value is None:
+                value = self._conn.execute(
+                    "SELECT hash FROM pmm_merkle_nodes WHERE level = ? AND idx = ?",
+                    (level, index),
+                ).fetchone()[0]
+            return value
+
+        leaves = []
+        for offset, row in enumerate(rows):
+            leaf_index = next_index + offset
+            leaves.append((int(row["id"]), leaf_index))
+            written[(0, leaf_index)] = merkle.leaf_hash(row["hash"])
+            for level, index in merkle.parents_for_append(leaf_index):
+                written[(level, index)] = merkle.node_hash(
+                    node(level - 1, 2 * index), node(level - 1, 2 * index + 1)
+                )
+        self._conn.executemany(
+            "INSERT INTO pmm_merkle_leaves (event_id, leaf_index) VALUES (?, ?)",
+            leaves,
+        )
+        self._conn.executemany(
+            "INSERT INTO pmm_merkle_nodes (level, idx, hash) VALUES (?, ?, ?)",
+            [(level, index, value) for (level, index), value in written.items()],
+        )
+
     def close(self) -> None:
         if self._closed:
             return
+        if self.mode == "writer":
+            self.store_projection_snapshots()
         if self.mode == "writer" and self._owns_writer_session:
             assert self.writer_session is not None
             self.writer_session.release(self._conn)
+        if self._read_pool is not None:
+            self._read_pool.close()
         self._conn.close()
         self._closed = True
 
@@ -478,6 +1018,9 @@ class EventLog:
         """Confirm the current owner and fence in a reserved database transaction."""
         session = self._require_writer()
         with session.operation(), self._lock:
+            if self._batch is not None:
+                session.assert_authority_in_transaction(self._conn)
+                return
             try:
                 self._conn.execute("BEGIN IMMEDIATE")
                 session.assert_authority_in_transaction(self._conn)
@@ -486,6 +1029,66 @@ class EventLog:
                 self._conn.rollback()
                 raise
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group appends into one transaction with a single authority check.
+
+        Each append inside the block runs in its own savepoint, so a rejected
+        append rolls back alone and its durable failure record is kept. The
+        transaction commits once when the block exits; listeners then receive
+        every appended event in id order. If the block raises, completed
+        appends are still committed before the exception propagates, matching
+        unbatched behavior, unless writer authority was lost, in which case
+        the whole batch is rolled back. Holding the reserved lock for the
+        block keeps other writers, and so fence changes, out until commit.
+        Nested ``batch()`` calls join the outer batch.
+        """
+        session = self._require_writer()
+        with session.operation():
+            with self._lock:
+                if self._batch is not None:
+                    yield
+                    return
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    asserted_at = session.assert_authority_in_transaction(self._conn)
+                except BaseException:
+                    self._conn.rollback()
+                    raise
+                batch = _AppendBatch(
+                    asserted_at=asserted_at, committed_through=self.count()
+                )
+                self._batch = batch
+                failure: Optional[BaseException] = None
+                try:
+                    yield
+                except BaseException as exc:
+                    failure = exc
+                finally:
+                    self._batch = None
+                    if batch.savepoint_open:
+                        self._conn.execute("ROLLBACK TO pmm_append")
+                        self._conn.execute("RELEASE pmm_append")
+                keep = failure is None or (
+                    isinstance(failure, Exception)
+                    and not isinstance(failure, WriterOwnershipError)
+                )
+                try:
+                    if keep:
+                        self._conn.commit()
+                    else:
+                        self._conn.rollback()
+                        self._append_state = None
+                except BaseException:
+                    self._conn.rollback()
+                    self._append_state = None
+                    raise
+            if keep:
+                for ev, canonical_created in batch.pending:
+                    self._emit(ev, canonical_created=canonical_created)
+            if failure is not None:
+                raise failure
+
     def register_listener(
         self,
         callback,
@@ -505,6 +1108,89 @@ class EventLog:
                 )
             )
 
+    def open_cursor(
+        self, name: str, *, applied_through: int = 0, batch_size: int = 512
+    ) -> ProjectionCursor:
+        """Register an incremental consumer positioned after ``applied_through``.
+
+        Callers that keep derived state hold the cursor and fold only the rows
+        appended since their last call instead of replaying ``read_all()``.
+        """
+        cursor = ProjectionCursor(
+            self,
+            name=name,
+            applied_through=applied_through,
+            batch_size=batch_size,
+        )
+        with self._lock:
+            self._cursors.add(cursor)
+        return cursor
+
+    def projection(self, name: str, factory: Optional[Callable[[], Any]] = None) -> Any:
+        """Return the shared, listener-fed projection published as ``name``.
+
+        The instance is first caught up to the committed ledger head, so
+        callers read current state without replaying. Rows appended inside an
+        open ``batch()`` reach it only when the batch commits. When nothing holds ``name`` and a
+        ``factory`` is given, its instance (exposing ``rebuild(events)`` and
+        ``sync(event)``) is rebuilt once and registered as an optional
+        listener; later calls share it. Returns None otherwise.
+        """
+        with self._lock:
+            registration = self._shared(name)
+            if registration is not None:
+                self._catch_up_shared(registration)
+                return registration.projection
+        if factory is None:
+            return None
+        instance = factory()
+        self.rebuild_and_register_listener(
+            instance.rebuild, instance.sync, name=name, projection=instance
+        )
+        with self._lock:
+            registration = self._shared(name)
+            return registration.projection if registration is not None else None
+
+    def _shared(self, name: str) -> Optional[_ListenerRegistration]:
+        for registration in self._listeners:
+            if registration.name == name and registration.projection is not None:
+                return registration
+        return None
+
+    def _catch_up_shared(self, registration: _ListenerRegistration) -> None:
+        """Deliver committed rows a shared projection has not seen yet."""
+        # Rows of an open batch may still roll back; they arrive via _emit.
+        batch = self._batch
+        head = batch.committed_through if batch is not None else self.count()
+        if registration.applied_through >= head:
+            return
+        if registration.required:
+            self._deliver_required_through(registration, head, canonical_created=False)
+            return
+        for event in self.read_range(registration.applied_through + 1, head):
+            try:
+                registration.callback(event)
+            except Exception as exc:
+                self._record_projection_status(
+                    registration,
+                    state="optional_failed",
+                    failed_event_id=int(event["id"]),
+                    error=exc,
+                )
+                return
+            registration.applied_through = int(event["id"])
+
+    def cursor_watermarks(self) -> Dict[str, int]:
+        """Return the lowest applied watermark of each live cursor name."""
+        with self._lock:
+            cursors = list(self._cursors)
+        out: Dict[str, int] = {}
+        for cursor in cursors:
+            current = out.get(cursor.name)
+            if current is None or cursor.applied_through < current:
+                out[cursor.name] = cursor.applied_through
+        return dict(sorted(out.items()))
+
     def rebuild_and_register_listener(
         self,
         rebuild: Callable[[List[Dict[str, Any]]], None],
@@ -512,6 +1198,8 @@ class EventLog:
         *,
         name: str | None = None,
         required: bool = False,
+        snapshot: ProjectionSnapshot | None = None,
+        projection: Any = None,
     ) -> None:
         """Rebuild a projection and atomically hand off to incremental updates.
 
@@ -519,17 +1207,35 @@ class EventLog:
         is either included in the ordered historical snapshot or delivered to
         the registered listener. If reconstruction fails, the listener is not
         registered and the exception propagates to the caller.
+
+        With ``snapshot``, a stored snapshot whose version, payload hash and
+        anchor event hash all match is loaded and caught up from its
+        watermark instead; any mismatch falls back to the full replay.
+
+        With ``projection``, the instance is published under ``name`` for
+        ``EventLog.projection``; if another instance already holds that name
+        the call registers nothing.
         """
 
         if self.writer_session is not None:
             with self.writer_session.operation():
                 self.assert_writer_authority()
                 self._rebuild_and_register_listener_owned(
-                    rebuild, listener, name=name, required=required
+                    rebuild,
+                    listener,
+                    name=name,
+                    required=required,
+                    snapshot=snapshot,
+                    projection=projection,
                 )
             return
         self._rebuild_and_register_listener_owned(
-            rebuild, listener, name=name, required=required
+            rebuild,
+            listener,
+            name=name,
+            required=required,
+            snapshot=snapshot,
+            projection=projection,
         )
 
     def _rebuild_and_register_listener_owned(
@@ -539,13 +1245,25 @@ class EventLog:
         *,
         name: str | None,
         required: bool,
+        snapshot: ProjectionSnapshot | None = None,
+        projection: Any = None,
     ) -> None:
         registration = _ListenerRegistration(
             name=name or getattr(listener, "__qualname__", repr(listener)),
             callback=listener,
             required=required,
+            snapshot=snapshot,
+            projection=projection,
         )
         with self._lock:
+            if projection is not None and self._shared(registration.name):
+                return
+            if snapshot is not None and self._load_projection_snapshot(registration):
+                self._deliver_required_through(
+                    registration, self.count(), canonical_created=False
+                )
+                self._listeners.append(registration)
+                return
             events = self.read_all()
             replayed_through = int(events[-1]["id"]) if events else 0
             try:
@@ -571,6 +1289,93 @@ class EventLog:
             registration.applied_through = replayed_through
             self._listeners.append(registration)
 
+    def _load_projection_snapshot(self, registration: _ListenerRegistration) -> bool:
+        """Restore a registration's stored snapshot if it still matches the ledger."""
+        snapshot = registration.snapshot
+        assert snapshot is not None
+        try:
+            row = self._conn.execute(
+                "SELECT version, applied_through, anchor_hash, payload, payload_hash "
+                "FROM pmm_projection_snapshots WHERE projection_name = ?",
+                (registration.name,),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return False  # ledger predates the snapshot table
+        if row is None or int(row["version"]) != snapshot.version:
+            return False
+        through = int(row["applied_through"])
+        anchor = self._conn.execute(
+            "SELECT hash FROM events WHERE id = ?", (through,)
+        ).fetchone()
+        anchor_hash = anchor["hash"] if anchor is not None else None
+        if through > 0 and (anchor_hash is None or anchor_hash != row["anchor_hash"]):
+            return False
+        payload = row["payload"]
+        if sha256(payload.encode("utf-8")).hexdigest() != row["payload_hash"]:
+            return False
+        try:
+            snapshot.load(json.loads(payload))
+        except Exception:
+            return False
+        registration.applied_through = through
+        registration.snapshot_through = through
+        return True
+
+    def _store_projection_snapshot(self, registration: _ListenerRegistration) -> bool:
+        """Persist a registration's state at its applied watermark (best effort)."""
+        snapshot = registration.snapshot
+        if (
+            snapshot is None
+            or self.mode != "writer"
+            or self.writer_session is None
+            or not self.writer_session.healthy
+            or registration.applied_through <= registration.snapshot_through
+        ):
+            return False
+        session = self.writer_session
+        try:
+            with session.operation(), self._lock:
+                through = registration.applied_through
+                payload = _canonical_json(snapshot.dump())
+                anchor = self._conn.execute(
+                    "SELECT hash FROM events WHERE id = ?", (through,)
+                ).fetchone()
+                now = self._begin_owned(session)
+                self._conn.execute(
+                    "INSERT INTO pmm_projection_snapshots "
+                    "(projection_name, version, applied_through, anchor_hash, "
+                    "payload, payload_hash, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(projection_name) DO UPDATE SET "
+                    "version=excluded.version, "
+                    "applied_through=excluded.applied_through, "
+                    "anchor_hash=excluded.anchor_hash, payload=excluded.payload, "
+                    "payload_hash=excluded.payload_hash, "
+                    "updated_at=excluded.updated_at",
+                    (
+                        registration.name,
+                        snapshot.version,
+                        through,
+                        anchor["hash"] if anchor is not None else None,
+                        payload,
+                        sha256(payload.encode("utf-8")).hexdigest(),
+                        now,
+                    ),
+                )
+                self._commit_owned()
+            registration.snapshot_through = through
+            return True
+        except Exception:
+            self._rollback_owned()
+            return False
+
+    def store_projection_snapshots(self) -> int:
+        """Persist every snapshot-capable projection that advanced; return count."""
+        return sum(
+            self._store_projection_snapshot(registration)
+            for registration in list(self._listeners)
+        )
+
     def _record_projection_status(
         self,
         registration: _ListenerRegistration,
@@ -584,8 +1389,7 @@ class EventLog:
         session = self.writer_session
         try:
             with session.operation(), self._lock:
-                self._conn.execute("BEGIN IMMEDIATE")
-                now = session.assert_authority_in_transaction(self._conn)
+                now = self._begin_owned(session)
                 self._conn.execute(
                     "INSERT INTO pmm_projection_status "
                     "(projection_name, owner_id, fence, applied_through, state, "
@@ -609,10 +1413,10 @@ class EventLog:
                         now,
                     ),
                 )
-                self._conn.commit()
+                self._commit_owned()
             return True
         except Exception:
-            self._conn.rollback()
+            self._rollback_owned()
             return False
 
     def _deliver_required_through(
@@ -696,9 +1500,17 @@ class EventLog:
                 canonical_created=False,
             )
             self._record_projection_status(registration, state="healthy")
+            if registration.snapshot is not None and (
+                registration.applied_through - registration.snapshot_through
+                >= max(self.SNAPSHOT_INTERVAL, registration.snapshot_through)
+            ):
+                self._store_projection_snapshot(registration)
         return fixed_watermark
 
     def _emit(self, ev: Dict[str, Any], *, canonical_created: bool = True) -> None:
+        if self._batch is not None:
+            self._batch.pending.append((ev, canonical_created))
+            return
         event_id = int(ev["id"])
         for registration in list(self._listeners):
             if event_id <= registration.applied_through:
@@ -726,6 +1538,94 @@ class EventLog:
                     error=exc,
                 )
 
+    def _append_state_locked(self) -> _AppendState:
+        """Return the chain head/config index, catching up if the ledger moved.
+
+        Valid while the writer fence, ``PRAGMA data_version`` (commits from
+        other connections) and this connection's ``total_changes`` (commits
+        not recorded through ``_advance_chain_head``) are unchanged; otherwise
+        only the rows after the cached head are read. Caller holds the lock.
+        """
+        session = self.writer_session
+        stamp = (
+            session.fence if session is not None else 0,
+            int(self._conn.execute("PRAGMA data_version").fetchone()[0]),
+            self._conn.total_changes,
+        )
+        state = self._append_state
+        if state is not None and state.stamp == stamp:
+            return state
+        if state is None:
+            state = _AppendState(stamp=stamp)
+        row = self._conn.execute(
+            "SELECT id, hash FROM events ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        head_id = int(row["id"]) if row else 0
+        if head_id != state.head_id:
+            for config in self._conn.execute(
+                "SELECT content FROM events WHERE kind = 'config' AND id > ? "
+                "ORDER BY id ASC",
+                (state.head_id,),
+            ):
+                state.observe_config(config["content"])
+        state.head_id = head_id
+        state.head_hash = row["hash"] if row and row["hash"] else None
+        state.stamp = stamp
+        self._append_state = state
+        return state
+
+    def _begin_owned(self, session: WriterSession) -> float:
+        """Start an append transaction, or a savepoint inside ``batch()``."""
+        batch = self._batch
+        if batch is None:
+            self._conn.execute("BEGIN IMMEDIATE")
+            return session.assert_authority_in_transaction(self._conn)
+        self._conn.execute("SAVEPOINT pmm_append")
+        batch.savepoint_open = True
+        return batch.asserted_at
+
+    def _commit_owned(self) -> None:
+        batch = self._batch
+        if batch is None:
+            self._extend_merkle()
+            self._conn.commit()
+        elif batch.savepoint_open:
+            self._extend_merkle()
+            self._conn.execute("RELEASE pmm_append")
+            batch.savepoint_open = False
+
+    def _rollback_owned(self) -> None:
+        batch = self._batch
+        if batch is None:
+            self._conn.rollback()
+        elif batch.savepoint_open:
+            self._conn.execute("ROLLBACK TO pmm_append")
+            self._conn.execute("RELEASE pmm_append")
+            batch.savepoint_open = False
+            self._append_state = None
+
+    def _chain_head_in_transaction(self) -> Optional[str]:
+        """Return the hash the next appended event must chain to."""
+        return self._append_state_locked().head_hash
+
+    def _advance_chain_head(
+        self, event_id: int, digest: str, kind: str, content: str
+    ) -> None:
+        """Record a just-committed event so the next append skips the head read."""
+        state = self._append_state
+        if state is None:
+            return
+        state.head_id = int(event_id)
+        state.head_hash = digest
+        if kind == "config":
+            state.observe_config(content)
+        state.stamp = (*state.stamp[:2], self._conn.total_changes)
+
+    def _latest_config(self, config_type: str) -> Optional[Dict[str, Any]]:
+        """Return the latest ``config`` content dict whose ``type`` matches."""
+        with self._lock:
+            return self._append_state_locked().configs.get(config_type)
+
     def _last_hash(self) -> Optional[str]:
         with self._lock:
             cur = self._conn.execute("SELECT hash FROM events ORDER BY id DESC LIMIT 1")
@@ -964,18 +1864,7 @@ class EventLog:
             src = (meta or {}).get("source") or "unknown"
             # Load last policy config
             try:
-                policy = None
-                # Search from end for last policy
-                for e in self.read_all()[::-1]:
-                    if e.get("kind") != "config":
-                        continue
-                    try:
-                        data = json.loads(e.get("content") or "{}")
-                    except Exception:
-                        continue
-                    if isinstance(data, dict) and data.get("type") == "policy":
-                        policy = data
-                        break
+                policy = self._latest_config("policy")
                 if policy and isinstance(policy.get("forbid_sources"), dict):
                     forbidden = policy["forbid_sources"].get(src)
                     if isinstance(forbidden, list) and kind in forbidden:
@@ -997,12 +1886,8 @@ class EventLog:
         session = self._require_writer()
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
-                row = self._conn.execute(
-                    "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = row["hash"] if row and row["hash"] else None
+                self._begin_owned(session)
+                prev_hash = self._chain_head_in_transaction()
                 # Hash payload intentionally excludes timestamp to keep digest
                 # stable across independent runs producing identical semantic content.
                 payload = {
@@ -1047,9 +1932,11 @@ class EventLog:
                     meta_db = meta
                     prev_hash_db = prev_hash
                     hash_db = digest
-                self._conn.commit()
+                self._commit_owned()
+                if canonical_created:
+                    self._advance_chain_head(ev_id, digest, kind, content)
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         ev = {
@@ -1228,8 +2115,7 @@ class EventLog:
         emitted: Optional[Dict[str, Any]] = None
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
                 if protocol == OUTCOME_PROTOCOL_V1:
                     validation = validate_outcome_payload(
                         content,
@@ -1299,7 +2185,7 @@ class EventLog:
                             existing_event["content"] == canonical_content
                             and existing_event["meta"] == canonical_meta
                         ):
-                            self._conn.commit()
+                            self._commit_owned()
                             return int(existing_event["id"]), False, None, None
                         validation = CommitmentRelationshipValidation(
                             False,
@@ -1366,7 +2252,7 @@ class EventLog:
                             raise RuntimeError(
                                 "authoritative review metadata corrupted"
                             )
-                        self._conn.commit()
+                        self._commit_owned()
                         return int(existing_event["id"]), False, None, None
                 elif validation.ok:
                     canonical_content = canonical_reinterpretation_content(
@@ -1423,14 +2309,11 @@ class EventLog:
                             raise RuntimeError(
                                 "authoritative reinterpretation metadata corrupted"
                             )
-                        self._conn.commit()
+                        self._commit_owned()
                         return int(existing_event["id"]), False, None, None
 
                 if validation.ok:
-                    row = self._conn.execute(
-                        "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                    ).fetchone()
-                    prev_hash = row["hash"] if row and row["hash"] else None
+                    prev_hash = self._chain_head_in_transaction()
                     payload = {
                         "kind": kind,
                         "content": canonical_content,
@@ -1484,7 +2367,7 @@ class EventLog:
                                 event_id,
                             ),
                         )
-                    self._conn.commit()
+                    self._commit_owned()
                     emitted = {
                         "id": event_id,
                         "ts": ts,
@@ -1517,17 +2400,14 @@ class EventLog:
                         None,
                     )
                     if exact_failure is not None:
-                        self._conn.commit()
+                        self._commit_owned()
                         return (
                             None,
                             False,
                             int(exact_failure["id"]),
                             validation.code,
                         )
-                    row = self._conn.execute(
-                        "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                    ).fetchone()
-                    prev_hash = row["hash"] if row and row["hash"] else None
+                    prev_hash = self._chain_head_in_transaction()
                     payload = {
                         "kind": "validation_failure",
                         "content": failure_content,
@@ -1550,7 +2430,7 @@ class EventLog:
                         ),
                     )
                     failure_id = int(cur.lastrowid)
-                    self._conn.commit()
+                    self._commit_owned()
                     emitted = {
                         "id": failure_id,
                         "ts": ts,
@@ -1562,7 +2442,7 @@ class EventLog:
                     }
                     result = (None, False, failure_id, validation.code)
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         if emitted is not None:
@@ -1618,8 +2498,7 @@ class EventLog:
         ts = _iso_now()
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
                 validation = validate_identity_adoption_payload(
                     content, submitted_meta, get_event
                 )
@@ -1636,7 +2515,7 @@ class EventLog:
                         (validation.subject_id, validation.token),
                     ).fetchone()
                     if existing is not None:
-                        self._conn.commit()
+                        self._commit_owned()
                         return int(existing["id"]), False
 
                     adoption_content = canonical_identity_adoption_content(
@@ -1648,10 +2527,7 @@ class EventLog:
                     adoption_meta["anchor_event_id"] = validation.anchor_event_id
                     adoption_meta["ratify_event_id"] = validation.ratify_event_id
                     adoption_meta["anchor_kind"] = "reflection"
-                    row = self._conn.execute(
-                        "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                    ).fetchone()
-                    prev_hash = row["hash"] if row and row["hash"] else None
+                    prev_hash = self._chain_head_in_transaction()
                     payload = {
                         "kind": "identity_adoption",
                         "content": adoption_content,
@@ -1687,12 +2563,12 @@ class EventLog:
                             (validation.subject_id, validation.token),
                         ).fetchone()
                         if raced is None:
-                            self._conn.rollback()
+                            self._rollback_owned()
                             raise
-                        self._conn.commit()
+                        self._commit_owned()
                         return int(raced["id"]), False
                     event_id = int(cur.lastrowid)
-                    self._conn.commit()
+                    self._commit_owned()
                     created = True
                     kind_written = "identity_adoption"
                     content_written = adoption_content
@@ -1711,7 +2587,7 @@ class EventLog:
                         (IDENTITY_ADOPTION_VALIDATOR_SOURCE, attempted_digest),
                     ).fetchone()
                     if existing_failure is not None:
-                        self._conn.commit()
+                        self._commit_owned()
                         return None, False
 
                     failure_content = _canonical_json(
@@ -1746,10 +2622,7 @@ class EventLog:
                             and get_event(origin_id) is not None
                         ):
                             failure_meta["about_event"] = origin_id
-                    row = self._conn.execute(
-                        "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                    ).fetchone()
-                    prev_hash = row["hash"] if row and row["hash"] else None
+                    prev_hash = self._chain_head_in_transaction()
                     payload = {
                         "kind": "validation_failure",
                         "content": failure_content,
@@ -1772,7 +2645,7 @@ class EventLog:
                         ),
                     )
                     event_id = int(cur.lastrowid)
-                    self._conn.commit()
+                    self._commit_owned()
                     created = True
                     kind_written = "validation_failure"
                     content_written = failure_content
@@ -1780,7 +2653,7 @@ class EventLog:
                     hash_written = digest
                     prev_written = prev_hash
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         self._emit(
@@ -1838,8 +2711,7 @@ class EventLog:
         ts = _iso_now()
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
                 if "origin_event_id" in open_meta:
                     origin_event_id = open_meta.get("origin_event_id")
                     if (
@@ -1879,24 +2751,16 @@ class EventLog:
                             "commitment_open origin_event_id assistant must contain "
                             "the matching COMMIT line"
                         )
-                latest = self._conn.execute(
-                    """
-                    SELECT id, kind FROM events
-                    WHERE kind IN ('commitment_open', 'commitment_close')
-                      AND json_extract(meta, '$.cid') = ?
-                    ORDER BY id DESC LIMIT 1
-                    """,
+                active = self._conn.execute(
+                    "SELECT open_event_id FROM pmm_open_commitments WHERE cid = ?",
                     (cid,),
                 ).fetchone()
 
-                if latest is not None and latest["kind"] == "commitment_open":
-                    self._conn.commit()
-                    return int(latest["id"]), False
+                if active is not None:
+                    self._commit_owned()
+                    return int(active["open_event_id"]), False
 
-                row = self._conn.execute(
-                    "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = row["hash"] if row and row["hash"] else None
+                prev_hash = self._chain_head_in_transaction()
                 payload = {
                     "kind": "commitment_open",
                     "content": content,
@@ -1920,13 +2784,14 @@ class EventLog:
                         raise RuntimeError(
                             "Invariant violation: hash conflict without row"
                         )
-                    self._conn.commit()
+                    self._commit_owned()
                     return int(existing["id"]), False
 
                 event_id = int(cur.lastrowid)
-                self._conn.commit()
+                self._commit_owned()
+                self._advance_chain_head(event_id, digest, "commitment_open", content)
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         self._emit(
@@ -1984,24 +2849,31 @@ class EventLog:
         ts = _iso_now()
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
                 latest = self._conn.execute(
                     """
-                    SELECT id, kind, meta FROM events
-                    WHERE kind IN ('commitment_open', 'commitment_close')
-                      AND json_extract(meta, '$.cid') = ?
-                    ORDER BY id DESC LIMIT 1
+                    SELECT events.id, events.meta FROM pmm_open_commitments AS open
+                    JOIN events ON events.id = open.open_event_id
+                    WHERE open.cid = ?
                     """,
                     (cid,),
                 ).fetchone()
 
                 if latest is None:
-                    self._conn.commit()
-                    return None, False
-                if latest["kind"] == "commitment_close":
-                    self._conn.commit()
-                    return int(latest["id"]), False
+                    # Not active: reuse the latest close, or report unknown.
+                    closed = self._conn.execute(
+                        """
+                        SELECT id FROM events
+                        WHERE kind = 'commitment_close'
+                          AND json_extract(meta, '$.cid') = ?
+                        ORDER BY id DESC LIMIT 1
+                        """,
+                        (cid,),
+                    ).fetchone()
+                    self._commit_owned()
+                    if closed is None:
+                        return None, False
+                    return int(closed["id"]), False
 
                 open_event_id = int(latest["id"])
                 origin_event_id = close_meta.get("origin_event_id")
@@ -2051,10 +2923,7 @@ class EventLog:
                 close_meta["source"] = source
                 close_meta["open_event_id"] = open_event_id
 
-                row = self._conn.execute(
-                    "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = row["hash"] if row and row["hash"] else None
+                prev_hash = self._chain_head_in_transaction()
                 payload = {
                     "kind": "commitment_close",
                     "content": content,
@@ -2069,9 +2938,10 @@ class EventLog:
                     (ts, content, _canonical_json(close_meta), prev_hash, digest),
                 )
                 event_id = int(cur.lastrowid)
-                self._conn.commit()
+                self._commit_owned()
+                self._advance_chain_head(event_id, digest, "commitment_close", content)
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         self._emit(
@@ -2357,23 +3227,22 @@ class EventLog:
         ts = _iso_now()
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
 
                 target = self._conn.execute(
                     "SELECT id, kind, content FROM events WHERE id = ?",
                     (about_event,),
                 ).fetchone()
                 if target is None:
-                    self._conn.commit()
+                    self._commit_owned()
                     return None, False
                 if target["kind"] != "retrieval_selection":
-                    self._conn.commit()
+                    self._commit_owned()
                     return None, False
                 if not self.is_strict_v2_retrieval_selection_content(
                     target["content"] or ""
                 ):
-                    self._conn.commit()
+                    self._commit_owned()
                     return None, False
 
                 existing = self._conn.execute(
@@ -2391,18 +3260,15 @@ class EventLog:
                     if not self._existing_vector_overlap_markers_valid(
                         existing["content"] or "", existing_meta
                     ):
-                        self._conn.rollback()
+                        self._rollback_owned()
                         raise ValueError(
                             "existing vector_overlap_diagnostic failed marker "
                             f"revalidation for about_event={about_event}"
                         )
-                    self._conn.commit()
+                    self._commit_owned()
                     return int(existing["id"]), False
 
-                row = self._conn.execute(
-                    "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = row["hash"] if row and row["hash"] else None
+                prev_hash = self._chain_head_in_transaction()
                 payload = {
                     "kind": VECTOR_OVERLAP_DIAGNOSTIC_KIND,
                     "content": content,
@@ -2437,24 +3303,24 @@ class EventLog:
                         (VECTOR_OVERLAP_DIAGNOSTIC_KIND, about_event),
                     ).fetchone()
                     if raced is None:
-                        self._conn.rollback()
+                        self._rollback_owned()
                         raise
                     raced_meta = json.loads(raced["meta"] or "{}")
                     if not self._existing_vector_overlap_markers_valid(
                         raced["content"] or "", raced_meta
                     ):
-                        self._conn.rollback()
+                        self._rollback_owned()
                         raise ValueError(
                             "raced vector_overlap_diagnostic failed marker "
                             f"revalidation for about_event={about_event}"
                         )
-                    self._conn.commit()
+                    self._commit_owned()
                     return int(raced["id"]), False
 
                 event_id = int(cur.lastrowid)
-                self._conn.commit()
+                self._commit_owned()
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         self._emit(
@@ -2613,8 +3479,7 @@ class EventLog:
 
         with session.operation(), self._lock:
             try:
-                self._conn.execute("BEGIN IMMEDIATE")
-                session.assert_authority_in_transaction(self._conn)
+                self._begin_owned(session)
                 existing = self._conn.execute(
                     """
                     SELECT id FROM events
@@ -2626,13 +3491,10 @@ class EventLog:
                     (TERMINAL_OUTCOME_PROTOCOL, user_event_id),
                 ).fetchone()
                 if existing is not None:
-                    self._conn.commit()
+                    self._commit_owned()
                     return int(existing["id"]), False
 
-                row = self._conn.execute(
-                    "SELECT hash FROM events ORDER BY id DESC LIMIT 1"
-                ).fetchone()
-                prev_hash = row["hash"] if row and row["hash"] else None
+                prev_hash = self._chain_head_in_transaction()
                 payload = {
                     "kind": kind,
                     "content": content,
@@ -2653,9 +3515,9 @@ class EventLog:
                         "(event_id, user_event_id, kind) VALUES (?, ?, ?)",
                         (event_id, user_event_id, kind),
                     )
-                self._conn.commit()
+                self._commit_owned()
             except Exception:
-                self._conn.rollback()
+                self._rollback_owned()
                 raise
 
         self._emit(
@@ -2671,9 +3533,26 @@ class EventLog:
         )
         return event_id, True
 
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection for a read.
+
+        Pooled read-only connections serve reads concurrently with the writer.
+        A thread already holding the EventLog lock (inside an append, batch or
+        projection rebuild) reads through the writer connection so it sees
+        its own uncommitted rows.
+        """
+        pool = self._read_pool
+        if pool is None or self._lock.held():
+            with self._lock:
+                yield self._conn
+            return
+        with pool.connection() as conn:
+            yield conn
+
     def read_all(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            cur = self._conn.execute("SELECT * FROM events ORDER BY id ASC")
+        with self._reader() as conn:
+            cur = conn.execute("SELECT * FROM events ORDER BY id ASC")
             out: List[Dict[str, Any]] = []
             for row in cur.fetchall():
                 out.append(
@@ -2689,9 +3568,58 @@ class EventLog:
                 )
         return out
 
+    def iter_events(
+        self,
+        start_id: int = 0,
+        *,
+        end_id: Optional[int] = None,
+        kinds: Optional[Iterable[str]] = None,
+        columns: Optional[Iterable[str]] = None,
+        batch_size: int = 512,
+    ) -> Iterator[EventRow]:
+        """Stream events with ``start_id <= id <= end_id`` in id order.
+
+        Rows are fetched ``batch_size`` at a time and yielded as ``EventRow``
+        views, so peak memory stays bounded by one batch. ``kinds`` filters by
+        event kind; ``columns`` restricts the selected columns (``id`` is
+        always included). The lock is held per batch, not across yields.
+        """
+        if int(batch_size) < 1:
+            raise ValueError("batch_size must be positive")
+        if columns is None:
+            selected = EVENT_COLUMNS
+        else:
+            wanted = set(columns)
+            unknown = wanted.difference(EVENT_COLUMNS)
+            if unknown:
+                raise ValueError(f"unknown event columns: {sorted(unknown)}")
+            wanted.add("id")
+            selected = tuple(c for c in EVENT_COLUMNS if c in wanted)
+        sql = f"SELECT {', '.join(selected)} FROM events WHERE id > ?"
+        filters: List[Any] = []
+        if end_id is not None:
+            sql += " AND id <= ?"
+            filters.append(int(end_id))
+        if kinds is not None:
+            kind_list = sorted(set(kinds))
+            if not kind_list:
+                return
+            sql += f" AND kind IN ({', '.join('?' for _ in kind_list)})"
+            filters.extend(kind_list)
+        sql += " ORDER BY id ASC LIMIT ?"
+        after = int(start_id) - 1
+        while True:
+            with self._reader() as conn:
+                rows = conn.execute(sql, (after, *filters, int(batch_size))).fetchall()
+            for row in rows:
+                yield EventRow(row)
+            if len(rows) < int(batch_size):
+                return
+            after = int(rows[-1]["id"])
+
     def read_tail(self, limit: int) -> List[Dict[str, Any]]:
-        with self._lock:
-            cur = self._conn.execute(
+        with self._reader() as conn:
+            cur = conn.execute(
                 "SELECT * FROM events ORDER BY id DESC LIMIT ?",
                 (limit,),
             )
@@ -2714,8 +3642,8 @@ class EventLog:
 
     def read_since(self, event_id: int, limit: int) -> List[Dict[str, Any]]:
         """Return events with id > event_id ordered ASC, capped by limit."""
-        with self._lock:
-            cur = self._conn.execute(
+        with self._reader() as conn:
+            cur = conn.execute(
                 "SELECT * FROM events WHERE id > ? ORDER BY id ASC LIMIT ?",
                 (int(event_id), int(limit)),
             )
@@ -2744,8 +3672,8 @@ class EventLog:
         if limit is not None:
             sql += " LIMIT ?"
             params.append(int(limit))
-        with self._lock:
-            cur = self._conn.execute(sql, tuple(params))
+        with self._reader() as conn:
+            cur = conn.execute(sql, tuple(params))
             rows = cur.fetchall()
             out: List[Dict[str, Any]] = []
             for row in rows:
@@ -2773,8 +3701,8 @@ class EventLog:
         if limit is not None:
             sql += " LIMIT ?"
             params.append(int(limit))
-        with self._lock:
-            cur = self._conn.execute(sql, tuple(params))
+        with self._reader() as conn:
+            cur = conn.execute(sql, tuple(params))
             rows = cur.fetchall()
             out: List[Dict[str, Any]] = []
             for row in rows:
@@ -2791,13 +3719,248 @@ class EventLog:
                 )
         return out
 
-    def last_of_kind(self, kind: str) -> Optional[Dict[str, Any]]:
-        """Return the most recent event of a given kind."""
-        with self._lock:
-            cur = self._conn.execute(
-                "SELECT * FROM events WHERE kind = ? ORDER BY id DESC LIMIT 1",
-                (kind,),
+    def read_by_index(
+        self,
+        index: str,
+        value: Any,
+        *,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+        reverse: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Return events whose ``SECONDARY_INDEXES[index]`` field equals ``value``.
+
+        ``kind`` narrows the result to one of the index's kinds. Results are
+        ordered by id (descending with ``reverse``).
+        """
+        spec = SECONDARY_INDEXES.get(index)
+        if spec is None:
+            raise ValueError(f"unknown secondary index: {index!r}")
+        sql = f"SELECT * FROM events WHERE {spec.predicate} AND {spec.expression} = ?"
+        params: List[Any] = [value]
+        if kind is not None:
+            if kind not in spec.kinds:
+                return []
+            sql += " AND kind = ?"
+            params.append(kind)
+        sql += " ORDER BY id DESC" if reverse else " ORDER BY id ASC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._reader() as conn:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        return [_event_from_row(row) for row in rows]
+
+    def read_by_hash_prefix(
+        self, prefix: str, *, up_to_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return events whose hash starts with ``prefix``, ordered by id.
+
+        Served as a range scan on the unique hash index.
+        """
+        # The id bound is applied in Python so the planner keeps the hash index.
+        with self._reader() as conn:
+            rows = conn.execute(
+                "SELECT * FROM events WHERE hash >= ? AND hash < ?",
+                (prefix, prefix + "\uffff"),
+            ).fetchall()
+        events = [_event_from_row(row) for row in rows]
+        if up_to_id is not None:
+            events = [event for event in events if event["id"] <= int(up_to_id)]
+        return sorted(events, key=lambda event: event["id"])
+
+    def open_commitments(
+        self,
+        *,
+        cid: Optional[str] = None,
+        origin: Optional[str] = None,
+        goal: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the currently open ``commitment_open`` events, oldest first.
+
+        Served from ``pmm_open_commitments``; optional filters match the
+        open event's ``cid``, ``origin`` and ``goal`` meta fields. Ledgers
+        opened in reader mode before the table existed fall back to a replay.
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("cid", cid), ("origin", origin), ("goal", goal)):
+            if value is not None:
+                clauses.append(f"open.{column} = ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT events.* FROM pmm_open_commitments AS open "
+            "JOIN events ON events.id = open.open_event_id "
+            f"{where} ORDER BY open.open_event_id ASC"
+        )
+        with self._reader() as conn:
+            try:
+                rows = conn.execute(sql, tuple(params)).fetchall()
+            except sqlite3.OperationalError as exc:
+                if "no such table" not in str(exc):
+                    raise
+                ids = [
+                    open_event_id
+                    for row_cid, open_event_id, row_origin, row_goal in (
+                        _replay_open_commitments(conn)
+                    )
+                    if (cid is None or row_cid == cid)
+                    and (origin is None or row_origin == origin)
+                    and (goal is None or row_goal == goal)
+                ]
+                rows = [
+                    conn.execute("SELECT * FROM events WHERE id = ?", (eid,)).fetchone()
+                    for eid in ids
+                ]
+        return [_event_from_row(row) for row in rows]
+
+    def _merkle_view(
+        self, conn: sqlite3.Connection, up_to_id: Optional[int]
+    ) -> Tuple[int, merkle.NodeGetter, Callable[[int], Optional[Tuple[int, str]]]]:
+        """Return ``(leaf_count, get_node, leaf_of)`` for events with id <= bound.
+
+        Served from the persisted tables; ledgers whose tables are missing or
+        behind (reader mode on an older file) are hashed in memory instead.
+        """
+        bound = int(up_to_id) if up_to_id is not None else (1 << 62)
+        try:
+            covered = conn.execute(
+                "SELECT MAX(event_id) FROM pmm_merkle_leaves"
+            ).fetchone()[0]
+        except sqlite3.OperationalError as exc:
+            if "no such table" not in str(exc):
+                raise
+            covered = None
+        stale = (
+            covered is None
+            or conn.execute(
+                "SELECT 1 FROM events WHERE id > ? AND id <= ? LIMIT 1",
+                (int(covered), bound),
+            ).fetchone()
+        )
+        if stale:
+            rows = conn.execute(
+                "SELECT id, hash FROM events WHERE id <= ? ORDER BY id ASC", (bound,)
+            ).fetchall()
+            nodes = merkle.nodes_from_hashes(row["hash"] for row in rows)
+            leaves = {
+                int(row["id"]): (index, row["hash"] or "")
+                for index, row in enumerate(rows)
+            }
+            return len(rows), lambda level, index: nodes.get((level, index)), leaves.get
+
+        last = conn.execute(
+            "SELECT leaf_index FROM pmm_merkle_leaves WHERE event_id <= ? "
+            "ORDER BY event_id DESC LIMIT 1",
+            (bound,),
+        ).fetchone()
+
+        def get_node(level: int, index: int) -> Optional[str]:
+            row = conn.execute(
+                "SELECT hash FROM pmm_merkle_nodes WHERE level = ? AND idx = ?",
+                (level, index),
+            ).fetchone()
+            return row[0] if row else None
+
+        def leaf_of(event_id: int) -> Optional[Tuple[int, str]]:
+            row = conn.execute(
+                "SELECT leaves.leaf_index, events.hash FROM pmm_merkle_leaves AS leaves "
+                "JOIN events ON events.id = leaves.event_id "
+                "WHERE leaves.event_id = ? AND leaves.event_id <= ?",
+                (int(event_id), bound),
+            ).fetchone()
+            return (int(row[0]), row[1] or "") if row else None
+
+        return (int(last[0]) + 1 if last else 0), get_node, leaf_of
+
+    def merkle_checkpoint(self, up_to_id: Optional[int] = None) -> Dict[str, Any]:
+        """Return the Merkle root over event hashes with id <= ``up_to_id``.
+
+        The result (``up_to_id``, ``leaf_count``, ``root_hash``,
+        ``root_scheme``) is the core of a ``checkpoint_manifest``; it costs
+        O(log N) node reads regardless of ledger size.
+        """
+        with self._reader() as conn:
+            if up_to_id is None:
+                up_to_id = conn.execute("SELECT MAX(id) FROM events").fetchone()[0]
+            leaf_count, get_node, _ = self._merkle_view(conn, up_to_id or 0)
+            root = merkle.root_at(get_node, leaf_count)
+        return {
+            "up_to_id": int(up_to_id or 0),
+            "leaf_count": leaf_count,
+            "root_hash": root,
+            "root_scheme": merkle.MERKLE_SCHEME,
+        }
+
+    def inclusion_proof(
+        self, event_id: int, *, up_to_id: Optional[int] = None
+    ) -> Optional[merkle.InclusionProof]:
+        """Prove event ``event_id`` is covered by ``merkle_checkpoint(up_to_id)``.
+
+        Returns None when the event does not exist or lies past the bound.
+        Check the result with ``pmm.core.merkle.verify_inclusion``.
+        """
+        with self._reader() as conn:
+            leaf_count, get_node, leaf_of = self._merkle_view(conn, up_to_id)
+            leaf = leaf_of(int(event_id))
+            if leaf is None:
+                return None
+            leaf_index, event_hash = leaf
+            return merkle.build_proof(
+                get_node,
+                event_id=int(event_id),
+                event_hash=event_hash,
+                leaf_index=leaf_index,
+                leaf_count=leaf_count,
             )
+
+    def verify_checkpoint(self, manifest: Mapping[str, Any]) -> bool:
+        """Check a ``checkpoint_manifest`` event (or its content dict) against the ledger.
+
+        Merkle manifests are verified in O(log N); manifests without
+        ``root_scheme`` use the legacy digest over every hash up to the anchor.
+        """
+        data: Any = manifest
+        if "content" in manifest and "root_hash" not in manifest:
+            try:
+                data = json.loads(manifest.get("content") or "{}")
+            except (TypeError, json.JSONDecodeError):
+                return False
+        if not isinstance(data, Mapping):
+            return False
+        try:
+            up_to = int(data.get("up_to_id", 0))
+        except (TypeError, ValueError):
+            return False
+        if data.get("root_scheme") == merkle.MERKLE_SCHEME:
+            expected = self.merkle_checkpoint(up_to)
+            return (
+                data.get("leaf_count") == expected["leaf_count"]
+                and data.get("root_hash") == expected["root_hash"]
+            )
+        with self._reader() as conn:
+            hashes = [
+                row[0] or ""
+                for row in conn.execute(
+                    "SELECT hash FROM events WHERE id <= ? ORDER BY id ASC", (up_to,)
+                )
+            ]
+        digest = sha256(json.dumps(hashes, separators=(",", ":")).encode("utf-8"))
+        return data.get("root_hash") == digest.hexdigest()
+
+    def last_of_kind(
+        self, kind: str, *, up_to_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the most recent event of a given kind, optionally at or before an id."""
+        sql = "SELECT * FROM events WHERE kind = ?"
+        params: List[Any] = [kind]
+        if up_to_id is not None:
+            sql += " AND id <= ?"
+            params.append(int(up_to_id))
+        sql += " ORDER BY id DESC LIMIT 1"
+        with self._reader() as conn:
+            cur = conn.execute(sql, tuple(params))
             row = cur.fetchone()
             if not row:
                 return None
@@ -2812,8 +3975,8 @@ class EventLog:
             }
 
     def read_up_to(self, event_id: int) -> List[Dict[str, Any]]:
-        with self._lock:
-            cur = self._conn.execute(
+        with self._reader() as conn:
+            cur = conn.execute(
                 "SELECT * FROM events WHERE id <= ? ORDER BY id ASC",
                 (event_id,),
             )
@@ -2835,8 +3998,8 @@ class EventLog:
 
     # Convenience API for validators/replay
     def get(self, event_id: int) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            cur = self._conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+        with self._reader() as conn:
+            cur = conn.execute("SELECT * FROM events WHERE id = ?", (event_id,))
             row = cur.fetchone()
             if not row:
                 return None
@@ -2851,19 +4014,75 @@ class EventLog:
             }
 
     def exists(self, event_id: int) -> bool:
-        with self._lock:
-            cur = self._conn.execute("SELECT 1 FROM events WHERE id = ?", (event_id,))
+        with self._reader() as conn:
+            cur = conn.execute("SELECT 1 FROM events WHERE id = ?", (event_id,))
             return cur.fetchone() is not None
 
+    def get_many(self, event_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Return ``{id: event}`` for the ids that exist; missing ids are omitted.
+
+        Ids are fetched with chunked ``WHERE id IN (...)`` statements. A small
+        LRU of committed rows answers repeated lookups without touching SQLite.
+        """
+        wanted = sorted({int(event_id) for event_id in event_ids})
+        rows: Dict[int, sqlite3.Row] = {}
+        missing: List[int] = []
+        with self._hot_lock:
+            for event_id in wanted:
+                row = self._hot_events.get(event_id)
+                if row is None:
+                    missing.append(event_id)
+                else:
+                    self._hot_events.move_to_end(event_id)
+                    rows[event_id] = row
+        if missing:
+            fetched: List[sqlite3.Row] = []
+            with self._reader() as conn:
+                for start in range(0, len(missing), _BULK_FETCH_CHUNK):
+                    chunk = missing[start : start + _BULK_FETCH_CHUNK]
+                    marks = ", ".join("?" for _ in chunk)
+                    fetched.extend(
+                        conn.execute(
+                            f"SELECT * FROM events WHERE id IN ({marks})", chunk
+                        ).fetchall()
+                    )
+                # Rows read inside an open write transaction may still roll back.
+                committed = conn is not self._conn or not conn.in_transaction
+            for row in fetched:
+                rows[int(row["id"])] = row
+            if committed and fetched:
+                with self._hot_lock:
+                    for row in fetched:
+                        self._hot_events[int(row["id"])] = row
+                    while len(self._hot_events) > _HOT_EVENT_CAPACITY:
+                        self._hot_events.popitem(last=False)
+        return {event_id: _event_from_row(rows[event_id]) for event_id in sorted(rows)}
+
+    def exists_many(self, event_ids: Iterable[int]) -> Set[int]:
+        """Return the subset of ``event_ids`` present in the ledger."""
+        wanted = sorted({int(event_id) for event_id in event_ids})
+        found: Set[int] = set()
+        with self._reader() as conn:
+            for start in range(0, len(wanted), _BULK_FETCH_CHUNK):
+                chunk = wanted[start : start + _BULK_FETCH_CHUNK]
+                marks = ", ".join("?" for _ in chunk)
+                found.update(
+                    int(row[0])
+                    for row in conn.execute(
+                        f"SELECT id FROM events WHERE id IN ({marks})", chunk
+                    )
+                )
+        return found
+
     def hash_sequence(self) -> List[str]:
-        with self._lock:
-            cur = self._conn.execute("SELECT hash FROM events ORDER BY id ASC")
+        with self._reader() as conn:
+            cur = conn.execute("SELECT hash FROM events ORDER BY id ASC")
             return [r[0] for r in cur.fetchall()]
 
     def count(self) -> int:
         """Return total event count using MAX(id) (append-only, no deletes)."""
-        with self._lock:
-            cur = self._conn.execute("SELECT MAX(id) FROM events")
+        with self._reader() as conn:
+            cur = conn.execute("SELECT MAX(id) FROM events")
             row = cur.fetchone()
             max_id = row[0] if row and row[0] is not None else 0
             return int(max_id)
@@ -2872,17 +4091,11 @@ class EventLog:
         cid = (cid or "").strip()
         if not cid:
             return False
-        events = self.read_all()
-        for event in events:
-            if event.get("kind") != "config":
-                continue
-            content_raw = event.get("content") or ""
+        for event in self.read_by_index("config_type", "exec_bind"):
             try:
-                data = json.loads(content_raw)
+                data = json.loads(event.get("content") or "")
             except (TypeError, json.JSONDecodeError):
                 continue
-            if not isinstance(data, dict):
-                continue
-            if data.get("type") == "exec_bind" and data.get("cid") == cid:
+            if isinstance(data, dict) and data.get("cid") == cid:
                 return True
         return False
@@ -10,7 +10,7 @@ no regex, no env-gated behavior.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 import time
 
 from pmm.core.event_log import EventLog
@@ -34,13 +34,19 @@ def compute_metrics(
       - closed_commitments: number of commitment_close events
     """
     log = EventLog(db_path, mode="reader")
-    raw_events = log.read_all()
     instrumentation: set[str] = {"metrics_update"}
 
     prev_hash: Optional[str] = None
     broken_links = 0
-    for event in raw_events:
-        ph = event.get("prev_hash")
+    total_events = 0
+    kinds: Dict[str, int] = {}
+    opens = 0
+    closes = 0
+    last_hash = "0" * 64
+    # Stream only the columns the integrity pass needs; meta is never decoded.
+    for event in log.iter_events(columns=("kind", "prev_hash", "hash")):
+        total_events += 1
+        ph = event["prev_hash"]
         if prev_hash is None:
             if ph not in (
                 None,
@@ -50,27 +56,17 @@ def compute_metrics(
         else:
             if ph != prev_hash:
                 broken_links += 1
-        prev_hash = event.get("hash")
+        prev_hash = event["hash"]
 
-    canonical_events = [
-        event for event in raw_events if event.get("kind") not in instrumentation
-    ]
-
-    kinds: Dict[str, int] = {}
-    opens = 0
-    closes = 0
-    for event in canonical_events:
-        kind = event.get("kind")
+        kind = event["kind"]
+        if kind in instrumentation:
+            continue
         kinds[kind] = kinds.get(kind, 0) + 1
         if kind == "commitment_open":
             opens += 1
         elif kind == "commitment_close":
             closes += 1
-
-    if canonical_events:
-        last_hash = canonical_events[-1]["hash"]
-    else:
-        last_hash = "0" * 64
+        last_hash = event["hash"]
 
     manager = CommitmentManager(log)
     internal_goals_open = len(manager.get_open_commitments(origin="autonomy_kernel"))
@@ -79,13 +75,14 @@ def compute_metrics(
 
     # Replay speed metric (ms per event): reload + hash sequence
     t0 = time.perf_counter()
-    _ = log.read_all()
+    for _ in log.iter_events():
+        pass
     _ = log.hash_sequence()
     t1 = time.perf_counter()
-    per_event_ms = ((t1 - t0) / max(1, len(raw_events))) * 1000.0
+    per_event_ms = ((t1 - t0) / max(1, total_events)) * 1000.0
 
     metrics = {
-        "event_count": len(canonical_events),
+        "event_count": sum(kinds.values()),
         "kinds": kinds,
         "broken_links": broken_links,
         "open_commitments": max(0, opens - closes),
@@ -96,10 +93,11 @@ def compute_metrics(
         "replay_speed_ms": per_event_ms,
     }
 
-    meta_summaries = [
-        event for event in canonical_events if event.get("kind") == "meta_summary"
-    ]
-    stability = StabilityMetrics().compute(canonical_events, meta_summaries)
+    meta_summaries = list(log.iter_events(kinds=("meta_summary",)))
+    commitment_events = log.iter_events(
+        kinds=("commitment_open", "commitment_close"), columns=("kind",)
+    )
+    stability = StabilityMetrics().compute(commitment_events, meta_summaries)
     metrics["stability"] = stability
 
     if tracker:
@@ -218,7 +216,7 @@ def format_metrics_tables(metrics: Dict[str, Any]):
     return tables
 
 
-def _last_metrics_snapshot(events: List[Dict[str, Any]]) -> Optional[str]:
+def _last_metrics_snapshot(events: Iterable[Mapping[str, Any]]) -> Optional[str]:
     last: Optional[str] = None
     for e in events:
         if e.get("kind") == "metrics_update":
@@ -250,7 +248,9 @@ def append_metrics_if_delta(db_path: str) -> bool:
     with EventLog(db_path, mode="writer", writer_role="metrics") as log:
         assert log.writer_session is not None
         with log.writer_session.operation():
-            events = log.read_all()
+            events = log.iter_events(
+                kinds=("metrics_update",), columns=("kind", "content")
+            )
             new_metrics = compute_metrics(db_path)
             new_snapshot = _stable_serialize_snapshot(new_metrics)
             last_snapshot = _last_metrics_snapshot(events)
@@ -6,11 +6,13 @@
 
 from __future__ import annotations
 
+import copy
 from collections import defaultdict, deque
 from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 import json
 
-from .event_log import EventLog
+from .event_log import EventLog, open_cursor
+from .rsm import snapshot_ladder
 
 
 class RecursiveSelfModel:
@@ -54,6 +56,10 @@ class RecursiveSelfModel:
         # Uniqueness tracking (first 8 chars of event hash)
         self._unique_prefixes: set[str] = set()
         self._total_events: int = 0
+        # Distinct prefixes restored from a snapshot; those events stay in the
+        # ledger and are probed through the hash index instead of held here.
+        self._prefix_base: int = 0
+        self._prefix_base_through: Optional[int] = None
         self.behavioral_tendencies: Dict[str, int] = {}
         self.knowledge_gaps: List[str] = []
         self.interaction_meta_patterns: List[str] = []
@@ -69,6 +75,8 @@ class RecursiveSelfModel:
         self._last_identity_event = None
         self._unique_prefixes.clear()
         self._total_events = 0
+        self._prefix_base = 0
+        self._prefix_base_through = None
         self.behavioral_tendencies = {}
         self.knowledge_gaps = []
         self.interaction_meta_patterns = []
@@ -79,18 +87,31 @@ class RecursiveSelfModel:
         self.reset()
         for event in events:
             self.observe(event)
-        # After full rebuild, ensure uniqueness cache reflects all events.
-        # If an eventlog is available, read from it for complete coverage.
-        if self.eventlog is not None:
-            try:
-                all_events = self.eventlog.read_all()
-                self._unique_prefixes = {
-                    (e.get("hash") or "")[:8] for e in all_events if e.get("hash")
-                }
-                self._total_events = len(all_events)
-            except Exception:
-                # Fallback is already populated via observe loop
-                pass
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the last event folded in (or restored from a snapshot)."""
+        return self._last_processed_event_id or 0
+
+    def fork(self) -> "RecursiveSelfModel":
+        """Independent copy of the current state; only the eventlog is shared.
+
+        With an EventLog attached, the hash-prefix set is folded into the
+        restored-prefix count and probed from the ledger, so forks stay small.
+        """
+        twin = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, list, set, deque)):
+                setattr(twin, name, copy.copy(value))
+        if (
+            isinstance(self.eventlog, EventLog)
+            and twin._unique_prefixes
+            and twin.last_event_id
+        ):
+            twin._prefix_base += len(twin._unique_prefixes)
+            twin._prefix_base_through = twin.last_event_id
+            twin._unique_prefixes = set()
+        return twin
 
     def observe(self, event: Optional[Dict[str, Any]]) -> None:
         """Process a single event incrementally."""
@@ -116,7 +137,7 @@ class RecursiveSelfModel:
         # Track uniqueness from event hash prefix
         ev_hash = event.get("hash") or ""
         if ev_hash:
-            self._unique_prefixes.add(ev_hash[:8])
+            self._note_prefix(ev_hash[:8])
         self._total_events += 1
 
         self._track_behavioral_patterns(kind, content_lower)
@@ -139,7 +160,8 @@ class RecursiveSelfModel:
                 self._pattern_counts[key] = 50
 
         # Compute uniqueness emphasis (0..20, typical 0..10)
-        uniq_score = int((len(self._unique_prefixes) / max(1, self._total_events)) * 10)
+        distinct = self._prefix_base + len(self._unique_prefixes)
+        uniq_score = int((distinct / max(1, self._total_events)) * 10)
         if uniq_score > 20:
             uniq_score = 20
         self._pattern_counts["uniqueness_emphasis"] = uniq_score
@@ -159,6 +181,11 @@ class RecursiveSelfModel:
             "interaction_meta_patterns": list(self.interaction_meta_patterns),
             "intents": dict(self._gap_counts),
             "reflections": [{"intent": i} for i in self.reflection_intents],
+            "uniqueness": {
+                "through_id": self.last_event_id,
+                "events": self._total_events,
+                "prefixes": self._prefix_base + len(self._unique_prefixes),
+            },
         }
 
     def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
@@ -189,11 +216,35 @@ class RecursiveSelfModel:
             for item in refl:
                 if isinstance(item, dict) and isinstance(item.get("intent"), str):
                     self.reflection_intents.append(item["intent"])
+        uniqueness = snapshot.get("uniqueness")
+        if isinstance(uniqueness, dict):
+            try:
+                through = int(uniqueness["through_id"])
+                self._total_events = int(uniqueness["events"])
+                self._prefix_base = int(uniqueness["prefixes"])
+            except (KeyError, TypeError, ValueError):
+                self._total_events = self._prefix_base = 0
+            else:
+                self._last_processed_event_id = through or None
+                self._prefix_base_through = through
         # Export outward facing structures
         self.behavioral_tendencies = dict(sorted(self._pattern_counts.items()))
         self.knowledge_gaps = sorted(k for k in self._gap_counts.keys())
         self.interaction_meta_patterns = sorted(self._meta_patterns)
 
+    def _note_prefix(self, prefix: str) -> None:
+        if prefix in self._unique_prefixes:
+            return
+        if self._prefix_base_through is not None and isinstance(
+            self.eventlog, EventLog
+        ):
+            for event in self.eventlog.read_by_hash_prefix(
+                prefix, up_to_id=self._prefix_base_through
+            ):
+                if event.get("kind") != "rsm_update":
+                    return
+        self._unique_prefixes.add(prefix)
+
     def knowledge_gap_count(self) -> int:
         return len(self.knowledge_gaps)
 
@@ -339,11 +390,14 @@ class LedgerMirror:
         if event_id_a == event_id_b:
             return base
 
-        mirror_a = self._rebuild_up_to(event_id_a)
-        mirror_b = self._rebuild_up_to(event_id_b)
-
-        snapshot_a = mirror_a.rsm_snapshot()
-        snapshot_b = mirror_b.rsm_snapshot()
+        if isinstance(self.eventlog, EventLog):
+            # Nearest stored states at or before each endpoint, plus the gaps
+            ladder = snapshot_ladder(self.eventlog, RecursiveSelfModel)
+            snapshot_a = ladder.state_at(event_id_a).snapshot()
+            snapshot_b = ladder.state_at(event_id_b).snapshot()
+        else:
+            snapshot_a = self._rebuild_up_to(event_id_a).rsm_snapshot()
+            snapshot_b = self._rebuild_up_to(event_id_b).rsm_snapshot()
 
         tendencies_a: Dict[str, int] = snapshot_a.get("behavioral_tendencies", {}) or {}
         tendencies_b: Dict[str, int] = snapshot_b.get("behavioral_tendencies", {}) or {}
@@ -375,41 +429,35 @@ class LedgerMirror:
 
     # Fast rebuild using last summary_update snapshot if available
     def rebuild_fast(self) -> None:
-        events = self.eventlog.read_all()
         # Prefer checkpoint_manifest if available; otherwise fall back to last summary_update
         start_id = 0
         snap = None
-        # Find last checkpoint_manifest
-        last_manifest = None
-        for ev in reversed(events):
-            if ev.get("kind") == "checkpoint_manifest":
-                last_manifest = ev
-                break
+        last_manifest = self.eventlog.last_of_kind("checkpoint_manifest")
         if last_manifest is not None:
             try:
                 data = json.loads(last_manifest.get("content") or "{}")
             except Exception:
                 data = {}
             start_id = int(data.get("up_to_id", 0))
-        # Find last summary_update at or before start_id (or the absolute last if no manifest)
-        last_summary = None
-        for ev in reversed(events):
-            if ev.get("kind") == "summary_update":
-                if start_id == 0 or int(ev.get("id", 0)) <= start_id:
-                    last_summary = ev
-                    break
+        # Last summary_update at or before start_id (or the absolute last if no manifest)
+        last_summary = self.eventlog.last_of_kind(
+            "summary_update", up_to_id=start_id or None
+        )
+        start = 0
         if last_summary is None:
-            # Fallback to full rebuild
-            self._rsm.rebuild(events)
-            return
-        meta = last_summary.get("meta") or {}
-        if isinstance(meta, dict):
-            snap = meta.get("rsm_state")
-        if isinstance(snap, dict):
-            self._rsm.load_snapshot(snap)
-        anchor = int(last_summary.get("id", 0))
-        # Replay only subsequent events after the stronger of manifest or summary anchor
-        start = max(start_id, anchor)
-        for ev in events:
-            if int(ev.get("id", 0)) > start:
-                self._rsm.observe(ev)
+            # Fallback to full replay
+            self._rsm.reset()
+        else:
+            meta = last_summary.get("meta") or {}
+            if isinstance(meta, dict):
+                snap = meta.get("rsm_state")
+            if isinstance(snap, dict):
+                self._rsm.load_snapshot(snap)
+            anchor = int(last_summary.get("id", 0))
+            # Resume after the snapshot's last event, or after the stronger of
+            # manifest or summary anchor for snapshots that do not record it
+            start = self._rsm.last_event_id or max(start_id, anchor)
+        cursor = open_cursor(
+            self.eventlog, "ledger_mirror.rsm_fast", applied_through=start
+        )
+        cursor.fold(self._rsm.observe)
@@ -4,18 +4,18 @@
 # Path: pmm/core/meme_graph.py
 """MemeGraph projection for causal relationships over EventLog.
 
-Append-only directed graph using NetworkX DiGraph.
+Append-only directed graph stored in a compact array-backed ``CompactDiGraph``.
 """
 
 from __future__ import annotations
 
-from bisect import bisect_left
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 import threading
-import networkx as nx
 from typing import Dict, List, Iterable, Literal, Optional, Set
 
-from .event_log import EventLog, TERMINAL_OUTCOME_PROTOCOL
+from .compact_graph import CompactDiGraph
+from .event_log import EventLog, ProjectionSnapshot, TERMINAL_OUTCOME_PROTOCOL
 from .commitment_outcome import (
     OUTCOME_PROTOCOL_V1,
     REINTERPRETATION_PROTOCOL_V1,
@@ -81,18 +81,65 @@ class MemeGraph:
 
     def __init__(self, eventlog: EventLog) -> None:
         self.eventlog = eventlog
-        self.graph = nx.DiGraph()
+        self.graph = CompactDiGraph()
         self._lock = threading.RLock()
         self._managed_assistant_ids: list[int] = []
         self._managed_pair_by_assistant: dict[int, int] = {}
+        # Replay indexes for legacy rows that lack explicit provenance.
+        self._last_user_id: int | None = None
+        self._opens_by_cid: dict[str, list[int]] = {}
+        self._assistants_by_commit_text: dict[str, list[int]] = {}
+        # Lookups served from captured node attributes instead of the ledger.
+        self.eventlog_fetches_avoided = 0
+        # Materialized commitment episodes, keyed by open event id.
+        self._episodes: dict[int, CommitmentEpisode] = {}
+        self._episodes_by_event: dict[int, set[int]] = {}
 
     def rebuild(self, events: List[Dict]) -> None:
         with self._lock:
             self.graph.clear()
             self._managed_assistant_ids.clear()
             self._managed_pair_by_assistant.clear()
+            self._last_user_id = None
+            self._opens_by_cid.clear()
+            self._assistants_by_commit_text.clear()
+            self._episodes.clear()
+            self._episodes_by_event.clear()
             for event in events:
                 self._add_event(event)
+            self._materialize_episodes()
+
+    def projection_snapshot(self) -> ProjectionSnapshot:
+        """Snapshot hooks for ``EventLog.rebuild_and_register_listener``."""
+        return ProjectionSnapshot(
+            version=4, dump=self._dump_state, load=self._load_state
+        )
+
+    def _dump_state(self) -> Dict:
+        with self._lock:
+            return {
+                "nodes": [[node, data] for node, data in self.graph.nodes(data=True)],
+                "edges": [
+                    [source, target, data]
+                    for source, target, data in self.graph.edges(data=True)
+                ],
+                "managed_pairs": [
+                    [assistant_id, self._managed_pair_by_assistant[assistant_id]]
+                    for assistant_id in self._managed_assistant_ids
+                ],
+            }
+
+    def _load_state(self, state: Dict) -> None:
+        with self._lock:
+            self.rebuild([])
+            for node, data in state["nodes"]:
+                self.graph.add_node(int(node), **data)
+                self._index_replay_keys(int(node), data)
+            for source, target, data in state["edges"]:
+                self.graph.add_edge(int(source), int(target), **data)
+            for assistant_id, user_id in state["managed_pairs"]:
+                self._index_managed_pair(int(assistant_id), int(user_id))
+            self._materialize_episodes()
 
     def add_event(self, event: Dict) -> None:
         with self._lock:
@@ -101,6 +148,45 @@ class MemeGraph:
             if event["kind"] not in self.TRACKED_KINDS:
                 return
             self._add_event(event)
+            self._refresh_episodes_touching(int(event["id"]))
+
+    def _materialize_episodes(self) -> None:
+        self._episodes.clear()
+        self._episodes_by_event.clear()
+        for open_ids in self._opens_by_cid.values():
+            for open_event_id in open_ids:
+                self._refresh_episode(open_event_id)
+
+    def _refresh_episodes_touching(self, event_id: int) -> None:
+        """Recompute episodes reached by the edges a new event introduced.
+
+        New edges only point from the added node to existing nodes, so the
+        affected episodes are the node's own (for an open) plus those that
+        already contain one of its successors.
+        """
+        affected: Set[int] = set()
+        if self.graph.kind(event_id) == "commitment_open":
+            affected.add(event_id)
+        for successor in self.graph.successors(event_id):
+            affected.update(self._episodes_by_event.get(int(successor), ()))
+        for open_event_id in sorted(affected):
+            self._refresh_episode(open_event_id)
+
+    def _refresh_episode(self, open_event_id: int) -> None:
+        previous = self._episodes.pop(open_event_id, None)
+        if previous is not None:
+            for member in previous.event_ids:
+                owners = self._episodes_by_event.get(member)
+                if owners is not None:
+                    owners.discard(open_event_id)
+                    if not owners:
+                        del self._episodes_by_event[member]
+        episode = self._episode_for_open_locked(open_event_id)
+        if episode is None:
+            return
+        self._episodes[open_event_id] = episode
+        for member in episode.event_ids:
+            self._episodes_by_event.setdefault(member, set()).add(open_event_id)
 
     def _add_event(self, event: Dict) -> None:
         event_id = event["id"]
@@ -108,11 +194,10 @@ class MemeGraph:
         meta = event.get("meta", {})
 
         # Add node
-        self.graph.add_node(
-            event_id,
-            kind=kind,
-            turn_protocol=(meta or {}).get("turn_protocol"),
-        )
+        attrs = self._node_attributes(event)
+        self.graph.add_node(event_id, **attrs)
+
+        self._index_replay_keys(event_id, attrs)
 
         # Add edges
         if kind == "assistant_message":
@@ -122,7 +207,7 @@ class MemeGraph:
                     user_id = int(about_event)
                     self.graph.add_edge(event_id, user_id, label="replies_to")
                     if (
-                        self.graph.nodes[user_id].get("turn_protocol")
+                        self.graph.attributes(user_id).get("turn_protocol")
                         == TERMINAL_OUTCOME_PROTOCOL
                     ):
                         self._index_managed_pair(event_id, user_id)
@@ -130,7 +215,7 @@ class MemeGraph:
                 # Legacy assistant events have no mandatory canonical turn link.
                 # Preserve the historical latest-user heuristic for graph shape,
                 # but never promote those inferred pairs into the managed index.
-                last_user = self._find_last("user_message")
+                last_user = self._last_user_id
                 if last_user is not None:
                     self.graph.add_edge(event_id, last_user, label="replies_to")
         elif kind == "identity_adoption":
@@ -168,7 +253,7 @@ class MemeGraph:
                 isinstance(open_node, int)
                 and not isinstance(open_node, bool)
                 and self.graph.has_node(open_node)
-                and self.graph.nodes[open_node].get("kind") == "commitment_open"
+                and self.graph.kind(open_node) == "commitment_open"
             )
             if not valid_explicit_open and "open_event_id" not in (meta or {}):
                 cid = (meta or {}).get("cid")
@@ -212,7 +297,7 @@ class MemeGraph:
                 isinstance(open_event_id, int)
                 and not isinstance(open_event_id, bool)
                 and self.graph.has_node(open_event_id)
-                and self.graph.nodes[open_event_id].get("kind") == "commitment_open"
+                and self.graph.kind(open_event_id) == "commitment_open"
             ):
                 self.graph.add_edge(event_id, open_event_id, label="outcome_for")
         elif kind == "reflection":
@@ -241,8 +326,7 @@ class MemeGraph:
                     isinstance(outcome_event_id, int)
                     and not isinstance(outcome_event_id, bool)
                     and self.graph.has_node(outcome_event_id)
-                    and self.graph.nodes[outcome_event_id].get("kind")
-                    == "outcome_observation"
+                    and self.graph.kind(outcome_event_id) == "outcome_observation"
                 ):
                     self.graph.add_edge(
                         event_id, outcome_event_id, label="reviews_outcome"
@@ -277,23 +361,81 @@ class MemeGraph:
                     isinstance(review_event_id, int)
                     and not isinstance(review_event_id, bool)
                     and self.graph.has_node(review_event_id)
-                    and self.graph.nodes[review_event_id].get("kind") == "reflection"
+                    and self.graph.kind(review_event_id) == "reflection"
                 ):
-                    self.graph.add_edge(
-                        event_id, review_event_id, label="reinterprets"
-                    )
+                    self.graph.add_edge(event_id, review_event_id, label="reinterprets")
             else:
                 about_event = meta.get("about_event")
                 if about_event and self.graph.has_node(about_event):
                     self.graph.add_edge(event_id, about_event, label="reflects_on")
 
+    @staticmethod
+    def _node_attributes(event: Dict) -> Dict:
+        """Capture the event fields graph queries read after insertion.
+
+        Opens and closes keep their cid and, only when declared, their
+        ``origin_event_id``. Assistants keep the COMMIT texts and CLOSE cids
+        they emitted.
+        """
+        kind = event["kind"]
+        meta = event.get("meta") or {}
+        attrs: Dict = {"kind": kind, "turn_protocol": meta.get("turn_protocol")}
+        if kind in ("commitment_open", "commitment_close"):
+            attrs["cid"] = meta.get("cid")
+            if "origin_event_id" in meta:
+                attrs["origin_event_id"] = meta.get("origin_event_id")
+        elif kind == "assistant_message":
+            from pmm.core.semantic_extractor import (
+                extract_closures,
+                extract_commitments,
+            )
+
+            lines = str(event.get("content") or "").splitlines()
+            commitments = extract_commitments(lines)
+            closures = extract_closures(lines)
+            if commitments:
+                attrs["commitments"] = commitments
+            if closures:
+                attrs["closures"] = closures
+        return attrs
+
+    def _attrs(self, event_id: int) -> Dict:
+        """Return captured attributes for a node in place of ``eventlog.get``."""
+        self.eventlog_fetches_avoided += 1
+        return self.graph.attributes(event_id)
+
+    def _index_replay_keys(self, event_id: int, attrs: Dict) -> None:
+        """Record the lookup keys legacy replay resolves against later rows."""
+        kind = attrs["kind"]
+        if kind == "user_message":
+            self._observe_user(event_id)
+        elif kind == "assistant_message":
+            for text in set(attrs.get("commitments", ())):
+                ids = self._assistants_by_commit_text.setdefault(text, [])
+                if not ids or event_id > ids[-1]:
+                    ids.append(event_id)
+                else:
+                    insort(ids, event_id)
+        elif kind == "commitment_open":
+            cid = attrs.get("cid")
+            if isinstance(cid, str):
+                ids = self._opens_by_cid.setdefault(cid, [])
+                if not ids or event_id > ids[-1]:
+                    ids.append(event_id)
+                elif event_id not in ids:
+                    insort(ids, event_id)
+
+    def _observe_user(self, event_id: int) -> None:
+        if self._last_user_id is None or event_id > self._last_user_id:
+            self._last_user_id = event_id
+
     def _is_prior_user_node(self, event_id: object, *, assistant_id: int) -> bool:
         return (
             isinstance(event_id, int)
             and not isinstance(event_id, bool)
             and event_id < assistant_id
             and self.graph.has_node(event_id)
-            and self.graph.nodes[event_id].get("kind") == "user_message"
+            and self.graph.kind(event_id) == "user_message"
         )
 
     def _index_managed_pair(self, assistant_id: int, user_id: int) -> None:
@@ -332,15 +474,9 @@ class MemeGraph:
             assistant_id = self._managed_assistant_ids[position]
             return self._managed_pair_by_assistant[assistant_id], assistant_id
 
-    def _find_last(self, kind: str) -> int | None:
-        candidates = [
-            n for n in self.graph.nodes if self.graph.nodes[n]["kind"] == kind
-        ]
-        return max(candidates) if candidates else None
-
     def _find_node_with_content(self, kind: str, substring: str) -> int | None:
         for node in self.graph.nodes:
-            if self.graph.nodes[node]["kind"] == kind:
+            if self.graph.kind(node) == kind:
                 full_event = self.eventlog.get(node)
                 if substring in full_event.get("content", ""):
                     return node
@@ -353,19 +489,11 @@ class MemeGraph:
         before_event_id: int,
     ) -> int | None:
         """Infer the latest prior matching assistant for a legacy open."""
-        target = (text or "").strip()
-        from pmm.core.semantic_extractor import extract_commitments
-
-        for node in sorted(self.graph.nodes, reverse=True):
-            if int(node) >= before_event_id:
-                continue
-            if self.graph.nodes[node]["kind"] == "assistant_message":
-                full_event = self.eventlog.get(node)
-                content = full_event.get("content", "")
-                commitments = extract_commitments(content.splitlines())
-                if target in commitments:
-                    return node
-        return None
+        ids = self._assistants_by_commit_text.get((text or "").strip())
+        if not ids:
+            return None
+        position = bisect_left(ids, before_event_id) - 1
+        return ids[position] if position >= 0 else None
 
     def _validated_commitment_origin(
         self,
@@ -381,18 +509,13 @@ class MemeGraph:
             or origin_event_id <= 0
             or origin_event_id >= opening_id
             or not self.graph.has_node(origin_event_id)
-            or self.graph.nodes[origin_event_id].get("kind") != "assistant_message"
+            or self.graph.kind(origin_event_id) != "assistant_message"
             or not isinstance(text, str)
             or not text.strip()
         ):
             return None
 
-        from pmm.core.semantic_extractor import extract_commitments
-
-        assistant = self.eventlog.get(origin_event_id) or {}
-        commitments = extract_commitments(
-            str(assistant.get("content") or "").splitlines()
-        )
+        commitments = self._attrs(origin_event_id).get("commitments") or ()
         return origin_event_id if text.strip() in commitments else None
 
     def _validated_commitment_close_origin(
@@ -413,19 +536,15 @@ class MemeGraph:
             or not cid.strip()
             or origin_event_id >= closing_id
             or not self.graph.has_node(origin_event_id)
-            or self.graph.nodes[origin_event_id].get("kind") != "assistant_message"
+            or self.graph.kind(origin_event_id) != "assistant_message"
         ):
             return None
 
         if origin_event_id <= open_event_id:
-            open_event = self.eventlog.get(open_event_id) or {}
-            if (open_event.get("meta") or {}).get("origin_event_id") != origin_event_id:
+            if self._attrs(open_event_id).get("origin_event_id") != origin_event_id:
                 return None
 
-        from pmm.core.semantic_extractor import extract_closures
-
-        assistant = self.eventlog.get(origin_event_id) or {}
-        closures = extract_closures(str(assistant.get("content") or "").splitlines())
+        closures = self._attrs(origin_event_id).get("closures") or ()
         return origin_event_id if cid.strip() in closures else None
 
     def _find_commitment_open_by_cid(self, cid: str) -> int | None:
@@ -435,25 +554,13 @@ class MemeGraph:
         greatest id selects the latest open, which is the one the authoritative
         close path transitions from and the one Mirror projects as open.
         """
-        latest: int | None = None
-        for node in self.graph.nodes:
-            if self.graph.nodes[node]["kind"] == "commitment_open":
-                full_event = self.eventlog.get(node)
-                meta = full_event.get("meta", {})
-                if meta.get("cid") == cid:
-                    node_id = int(node)
-                    if latest is None or node_id > latest:
-                        latest = node_id
-        return latest
+        ids = self._opens_by_cid.get(cid)
+        return ids[-1] if ids else None
 
     # Read-only helpers (deterministic, rebuildable)
     def graph_stats(self) -> dict:
         with self._lock:
-            kinds: dict[str, int] = {}
-            for node in self.graph.nodes:
-                kind = self.graph.nodes[node].get("kind")
-                if kind:
-                    kinds[kind] = kinds.get(kind, 0) + 1
+            kinds = self.graph.count_by_kind()
             return {
                 "nodes": int(self.graph.number_of_nodes()),
                 "edges": int(self.graph.number_of_edges()),
@@ -485,7 +592,7 @@ class MemeGraph:
                     neigh.add(int(pred))
 
             if kind is not None:
-                neigh = {n for n in neigh if self.graph.nodes[n].get("kind") == kind}
+                neigh = {n for n in neigh if self.graph.kind(n) == kind}
 
             return sorted(neigh)
 
@@ -532,10 +639,10 @@ class MemeGraph:
 
         with self._lock:
             candidates: List[int] = []
-            # Nodes correspond 1:1 with ledger ids, so sort numerically.
-            for nid in sorted(self.graph.nodes, reverse=True):
+            # Nodes correspond 1:1 with ledger ids and are stored in id order.
+            for nid in reversed(self.graph.nodes):
                 if kind_set is not None:
-                    k = self.graph.nodes[nid].get("kind")
+                    k = self.graph.kind(nid)
                     if k not in kind_set:
                         continue
                 candidates.append(int(nid))
@@ -571,21 +678,19 @@ class MemeGraph:
             or isinstance(open_event_id, bool)
             or open_event_id <= 0
             or not self.graph.has_node(open_event_id)
-            or self.graph.nodes[open_event_id].get("kind") != "commitment_open"
+            or self.graph.kind(open_event_id) != "commitment_open"
         ):
             return None
 
-        open_event = self.eventlog.get(open_event_id) or {}
-        open_meta = open_event.get("meta") or {}
+        open_meta = self._attrs(open_event_id)
         cid = open_meta.get("cid")
         if not isinstance(cid, str) or not cid.strip():
             return None
         cid = cid.strip()
 
         opening_assistant_ids: list[int] = []
-        for successor in self.graph.successors(open_event_id):
-            edge = self.graph.get_edge_data(open_event_id, successor)
-            if (edge or {}).get("label") == "commits_to":
+        for successor, edge_label in self.graph.labeled_successors(open_event_id):
+            if edge_label == "commits_to":
                 opening_assistant_ids.append(int(successor))
         opening_assistant_ids.sort()
         opening_origin = self._episode_origin(
@@ -595,21 +700,18 @@ class MemeGraph:
         )
 
         close_event_ids: list[int] = []
-        for predecessor in self.graph.predecessors(open_event_id):
-            edge = self.graph.get_edge_data(predecessor, open_event_id)
-            if (edge or {}).get("label") == "closes":
+        for predecessor, edge_label in self.graph.labeled_predecessors(open_event_id):
+            if edge_label == "closes":
                 close_event_ids.append(int(predecessor))
         close_event_ids.sort()
 
         closures: list[CommitmentClosure] = []
         closing_assistant_ids: list[int] = []
         for close_event_id in close_event_ids:
-            close_event = self.eventlog.get(close_event_id) or {}
-            close_meta = close_event.get("meta") or {}
+            close_meta = self._attrs(close_event_id)
             issued_by_ids: list[int] = []
-            for successor in self.graph.successors(close_event_id):
-                edge = self.graph.get_edge_data(close_event_id, successor)
-                if (edge or {}).get("label") == "issued_by":
+            for successor, edge_label in self.graph.labeled_successors(close_event_id):
+                if edge_label == "issued_by":
                     issued_by_ids.append(int(successor))
             issued_by_ids.sort()
             closing_assistant_ids.extend(issued_by_ids)
@@ -632,33 +734,35 @@ class MemeGraph:
         )
         reflection_event_ids: list[int] = []
         for assistant_id in all_assistant_ids:
-            for predecessor in self.graph.predecessors(assistant_id):
-                edge = self.graph.get_edge_data(predecessor, assistant_id)
-                if (edge or {}).get("label") == "reflects_on":
+            for predecessor, edge_label in self.graph.labeled_predecessors(
+                assistant_id
+            ):
+                if edge_label == "reflects_on":
                     reflection_event_ids.append(int(predecessor))
         reflection_event_ids = sorted(set(reflection_event_ids))
 
         outcome_event_ids: list[int] = []
-        for predecessor in self.graph.predecessors(open_event_id):
-            edge = self.graph.get_edge_data(predecessor, open_event_id)
-            if (edge or {}).get("label") == "outcome_for":
+        for predecessor, edge_label in self.graph.labeled_predecessors(open_event_id):
+            if edge_label == "outcome_for":
                 outcome_event_ids.append(int(predecessor))
         outcome_event_ids.sort()
         outcome_event_id = outcome_event_ids[0] if outcome_event_ids else None
 
         review_event_ids: list[int] = []
         if outcome_event_id is not None:
-            for predecessor in self.graph.predecessors(outcome_event_id):
-                edge = self.graph.get_edge_data(predecessor, outcome_event_id)
-                if (edge or {}).get("label") == "reviews_outcome":
+            for predecessor, edge_label in self.graph.labeled_predecessors(
+                outcome_event_id
+            ):
+                if edge_label == "reviews_outcome":
                     review_event_ids.append(int(predecessor))
         review_event_ids = sorted(set(review_event_ids))
 
         reinterpretation_event_ids: list[int] = []
         for review_event_id in review_event_ids:
-            for predecessor in self.graph.predecessors(review_event_id):
-                edge = self.graph.get_edge_data(predecessor, review_event_id)
-                if (edge or {}).get("label") == "reinterprets":
+            for predecessor, edge_label in self.graph.labeled_predecessors(
+                review_event_id
+            ):
+                if edge_label == "reinterprets":
                     reinterpretation_event_ids.append(int(predecessor))
         reinterpretation_event_ids = sorted(set(reinterpretation_event_ids))
 
@@ -693,8 +797,10 @@ class MemeGraph:
         Explicit malformed provenance is reported as ``invalid_explicit`` and
         never replaced with a heuristic relationship.
         """
+        if not isinstance(open_event_id, int) or isinstance(open_event_id, bool):
+            return None
         with self._lock:
-            return self._episode_for_open_locked(open_event_id)
+            return self._episodes.get(open_event_id)
 
     def history_for_cid(self, cid: str) -> list[CommitmentEpisode]:
         """Return all reconstructed episodes for ``cid`` in open-event order."""
@@ -702,20 +808,11 @@ class MemeGraph:
         if not cid:
             return []
         with self._lock:
-            open_event_ids: list[int] = []
-            for node in self.graph.nodes:
-                if self.graph.nodes[node].get("kind") != "commitment_open":
-                    continue
-                event = self.eventlog.get(int(node)) or {}
-                if (event.get("meta") or {}).get("cid") == cid:
-                    open_event_ids.append(int(node))
-
-            episodes: list[CommitmentEpisode] = []
-            for open_event_id in sorted(open_event_ids):
-                episode = self._episode_for_open_locked(open_event_id)
-                if episode is not None:
-                    episodes.append(episode)
-            return episodes
+            return [
+                self._episodes[open_event_id]
+                for open_event_id in self._opens_by_cid.get(cid, ())
+                if open_event_id in self._episodes
+            ]
 
     def current_episode_for_cid(self, cid: str) -> CommitmentEpisode | None:
         """Return the latest episode for ``cid`` without flattening history."""
@@ -726,7 +823,7 @@ class MemeGraph:
             open_event_id = self._find_commitment_open_by_cid(cid)
             if open_event_id is None:
                 return None
-            return self._episode_for_open_locked(open_event_id)
+            return self._episodes.get(open_event_id)
 
     def episodes_for_event(self, event_id: int) -> list[CommitmentEpisode]:
         """Return exact commitment episodes containing ``event_id``.
@@ -739,13 +836,21 @@ class MemeGraph:
         with self._lock:
             if not self.graph.has_node(event_id):
                 return []
-            episodes: list[CommitmentEpisode] = []
-            for cid in self.cids_for_event(event_id):
-                for episode in self.history_for_cid(cid):
-                    if event_id in episode.event_ids:
-                        episodes.append(episode)
-            episodes.sort(key=lambda episode: episode.open_event_id)
-            return episodes
+            open_event_ids = self._episodes_by_event.get(event_id)
+            if not open_event_ids:
+                return []
+            # Membership is reported per CID the event participates in, so an
+            # episode reached only through a foreign-CID close stays excluded.
+            cids = {
+                cid.strip()
+                for cid in self.cids_for_event(event_id)
+                if isinstance(cid, str)
+            }
+            return [
+                self._episodes[open_event_id]
+                for open_event_id in sorted(open_event_ids)
+                if self._attrs(open_event_id).get("cid") in cids
+            ]
 
     def thread_for_cid(self, cid: str) -> list[int]:
         """Compatibility view of the current episode's semantic event order.
@@ -777,10 +882,10 @@ class MemeGraph:
             return []
 
         def _sort_key(eid: int) -> tuple:
-            ev = self.eventlog.get(eid) or {}
-            return (-int(eid), str(ev.get("kind") or ""), cid)
+            return (-int(eid), str(self._attrs(eid).get("kind") or ""), cid)
 
-        ordered = sorted((int(eid) for eid in full_thread), key=_sort_key)
+        with self._lock:
+            ordered = sorted((int(eid) for eid in full_thread), key=_sort_key)
         return ordered[:limit]
 
     def cids_for_event(self, event_id: int) -> List[str]:
@@ -796,78 +901,63 @@ class MemeGraph:
             if not self.graph.has_node(event_id):
                 return []
 
-            node = self.graph.nodes[event_id]
+            node = self._attrs(event_id)
             kind = node.get("kind")
-            full_event = self.eventlog.get(event_id)
-            meta = full_event.get("meta", {})
             cids: Set[str] = set()
 
             if kind in ("commitment_open", "commitment_close"):
-                cid = meta.get("cid")
+                cid = node.get("cid")
                 if cid:
                     cids.add(cid)
 
             elif kind == "outcome_observation":
-                for successor in self.graph.successors(event_id):
-                    edge = self.graph.get_edge_data(event_id, successor)
-                    if (edge or {}).get("label") != "outcome_for":
+                for successor, edge_label in self.graph.labeled_successors(event_id):
+                    if edge_label != "outcome_for":
                         continue
-                    open_event = self.eventlog.get(int(successor)) or {}
-                    cid = (open_event.get("meta") or {}).get("cid")
+                    cid = self._attrs(successor).get("cid")
                     if isinstance(cid, str) and cid:
                         cids.add(cid)
 
             elif kind == "assistant_message":
                 # Find lifecycle events that identify this assistant as origin.
-                for pred in self.graph.predecessors(event_id):
-                    edge = self.graph.get_edge_data(pred, event_id)
-                    if (edge or {}).get("label") in {"commits_to", "issued_by"}:
-                        lifecycle_event = self.eventlog.get(pred)
-                        cid = (lifecycle_event.get("meta") or {}).get("cid")
+                for pred, edge_label in self.graph.labeled_predecessors(event_id):
+                    if edge_label in {"commits_to", "issued_by"}:
+                        cid = self._attrs(pred).get("cid")
                         if cid:
                             cids.add(cid)
 
             elif kind == "reflection":
-                for successor in self.graph.successors(event_id):
-                    edge = self.graph.get_edge_data(event_id, successor)
-                    label = (edge or {}).get("label")
+                for successor, label in self.graph.labeled_successors(event_id):
                     outcome_nodes: list[int] = []
                     if label == "reviews_outcome":
                         outcome_nodes.append(int(successor))
                     elif label == "reinterprets":
-                        for outcome_node in self.graph.successors(successor):
-                            review_edge = self.graph.get_edge_data(
-                                successor, outcome_node
-                            )
-                            if (review_edge or {}).get("label") == "reviews_outcome":
+                        for outcome_node, review_label in self.graph.labeled_successors(
+                            successor
+                        ):
+                            if review_label == "reviews_outcome":
                                 outcome_nodes.append(int(outcome_node))
                     for outcome_node in outcome_nodes:
-                        for open_node in self.graph.successors(outcome_node):
-                            outcome_edge = self.graph.get_edge_data(
-                                outcome_node, open_node
-                            )
-                            if (outcome_edge or {}).get("label") != "outcome_for":
+                        for open_node, outcome_label in self.graph.labeled_successors(
+                            outcome_node
+                        ):
+                            if outcome_label != "outcome_for":
                                 continue
-                            open_event = self.eventlog.get(int(open_node)) or {}
-                            cid = (open_event.get("meta") or {}).get("cid")
+                            cid = self._attrs(open_node).get("cid")
                             if isinstance(cid, str) and cid:
                                 cids.add(cid)
                 # Find assistant it reflects on
-                for succ in self.graph.successors(event_id):
-                    edge = self.graph.get_edge_data(event_id, succ)
-                    if (edge or {}).get("label") == "reflects_on":
+                for succ, edge_label in self.graph.labeled_successors(event_id):
+                    if edge_label == "reflects_on":
                         # succ is the assistant
                         # Recursively get cids for that assistant
                         # (Manual recursion to avoid infinite loops, though graph is acyclic-ish here)
                         # We just duplicate the assistant logic for safety and clarity
-                        for pred_of_succ in self.graph.predecessors(succ):
-                            edge_pos = self.graph.get_edge_data(pred_of_succ, succ)
-                            if (edge_pos or {}).get("label") in {
-                                "commits_to",
-                                "issued_by",
-                            }:
-                                lifecycle_event = self.eventlog.get(pred_of_succ)
-                                cid = (lifecycle_event.get("meta") or {}).get("cid")
+                        for pred_of_succ, pos_label in self.graph.labeled_predecessors(
+                            succ
+                        ):
+                            if pos_label in {"commits_to", "issued_by"}:
+                                cid = self._attrs(pred_of_succ).get("cid")
                                 if cid:
                                     cids.add(cid)
 
@@ -880,14 +970,9 @@ class MemeGraph:
             direct = self.cids_for_event(event_id)
             if direct:
                 return direct
-            # Fallback scan over known opens (bounded by graph size)
+            # Fallback scan over known open CIDs (bounded by distinct CIDs)
             cids: Set[str] = set()
-            for node in self.graph.nodes:
-                node_kind = self.graph.nodes[node].get("kind")
-                if node_kind != "commitment_open":
-                    continue
-                open_event = self.eventlog.get(int(node)) or {}
-                cid_val = (open_event.get("meta") or {}).get("cid")
+            for cid_val in self._opens_by_cid:
                 if not cid_val:
                     continue
                 if event_id in self.thread_for_cid(cid_val):
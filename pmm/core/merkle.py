@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/core/merkle.py
+"""Merkle mountain range over the ledger hash chain.
+
+Leaf ``i`` commits to the ``hash`` of the ``i``-th event in id order. Nodes
+are addressed by ``(level, index)``: leaves sit at level 0 and node
+``(level + 1, i)`` joins ``(level, 2i)`` and ``(level, 2i + 1)``. A range of
+``n`` leaves is covered by one perfect subtree ("peak") per set bit of ``n``;
+the root bags those peaks right to left. Nodes never change once written, so
+appending a leaf writes at most ``log2(n) + 1`` nodes and any prefix root or
+inclusion proof touches O(log n) of them.
+
+Leaf and interior hashes are domain-separated (``0x00``/``0x01`` prefixes).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from hashlib import sha256
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+MERKLE_SCHEME = "mmr-sha256-v1"
+EMPTY_ROOT = sha256(b"").hexdigest()
+
+NodeGetter = Callable[[int, int], Optional[str]]
+
+
+def leaf_hash(event_hash: Optional[str]) -> str:
+    return sha256(b"\x00" + (event_hash or "").encode("utf-8")).hexdigest()
+
+
+def node_hash(left: str, right: str) -> str:
+    return sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def peaks(leaf_count: int) -> List[Tuple[int, int]]:
+    """Return ``(level, index)`` of each peak for ``leaf_count`` leaves, left first."""
+    out: List[Tuple[int, int]] = []
+    start = 0
+    for level in range(max(0, int(leaf_count)).bit_length() - 1, -1, -1):
+        if leaf_count >> level & 1:
+            out.append((level, start >> level))
+            start += 1 << level
+    return out
+
+
+def bag_peaks(peak_hashes: List[str]) -> str:
+    if not peak_hashes:
+        return EMPTY_ROOT
+    root = peak_hashes[-1]
+    for peak in reversed(peak_hashes[:-1]):
+        root = node_hash(peak, root)
+    return root
+
+
+def parents_for_append(leaf_index: int) -> List[Tuple[int, int]]:
+    """Interior nodes completed by appending leaf ``leaf_index``, lowest first."""
+    out: List[Tuple[int, int]] = []
+    level, index = 0, int(leaf_index)
+    while index & 1:
+        level, index = level + 1, index >> 1
+        out.append((level, index))
+    return out
+
+
+def root_at(get_node: NodeGetter, leaf_count: int) -> str:
+    """Root of the first ``leaf_count`` leaves from stored nodes."""
+    hashes = []
+    for level, index in peaks(leaf_count):
+        value = get_node(level, index)
+        if value is None:
+            raise KeyError(f"missing merkle node ({level}, {index})")
+        hashes.append(value)
+    return bag_peaks(hashes)
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Evidence that ``event_hash`` is leaf ``leaf_index`` of a ``leaf_count`` root."""
+
+    event_id: int
+    event_hash: str
+    leaf_index: int
+    leaf_count: int
+    siblings: Tuple[str, ...]
+    peaks: Tuple[str, ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["siblings"] = list(self.siblings)
+        data["peaks"] = list(self.peaks)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InclusionProof":
+        return cls(
+            event_id=int(data["event_id"]),
+            event_hash=str(data["event_hash"]),
+            leaf_index=int(data["leaf_index"]),
+            leaf_count=int(data["leaf_count"]),
+            siblings=tuple(data.get("siblings") or ()),
+            peaks=tuple(data.get("peaks") or ()),
+        )
+
+
+def _locate(leaf_index: int, leaf_count: int) -> Tuple[int, int, int]:
+    """Return ``(peak_position, peak_level, first_leaf_of_peak)`` for a leaf."""
+    start = 0
+    for position, (level, _index) in enumerate(peaks(leaf_count)):
+        if leaf_index < start + (1 << level):
+            return position, level, start
+        start += 1 << level
+    raise IndexError(f"leaf {leaf_index} outside {leaf_count} leaves")
+
+
+def build_proof(
+    get_node: NodeGetter,
+    *,
+    event_id: int,
+    event_hash: str,
+    leaf_index: int,
+    leaf_count: int,
+) -> InclusionProof:
+    position, level, _start = _locate(leaf_index, leaf_count)
+    siblings = []
+    for height in range(level):
+        sibling = get_node(height, (leaf_index >> height) ^ 1)
+        if sibling is None:
+            raise KeyError(
+                f"missing merkle node ({height}, {(leaf_index >> height) ^ 1})"
+            )
+        siblings.append(sibling)
+    others = [
+        get_node(peak_level, peak_index)
+        for offset, (peak_level, peak_index) in enumerate(peaks(leaf_count))
+        if offset != position
+    ]
+    if any(value is None for value in others):
+        raise KeyError("missing merkle peak")
+    return InclusionProof(
+        event_id=int(event_id),
+        event_hash=event_hash or "",
+        leaf_index=int(leaf_index),
+        leaf_count=int(leaf_count),
+        siblings=tuple(siblings),
+        peaks=tuple(others),
+    )
+
+
+def verify_inclusion(proof: InclusionProof | Dict[str, Any], root: str) -> bool:
+    """Check ``proof`` against ``root`` without access to the ledger."""
+    if isinstance(proof, dict):
+        try:
+            proof = InclusionProof.from_dict(proof)
+        except (KeyError, TypeError, ValueError):
+            return False
+    if not 0 <= proof.leaf_index < proof.leaf_count:
+        return False
+    position, level, _start = _locate(proof.leaf_index, proof.leaf_count)
+    if (
+        len(proof.siblings) != level
+        or len(proof.peaks) != len(peaks(proof.leaf_count)) - 1
+    ):
+        return False
+    try:
+        current = leaf_hash(proof.event_hash)
+        for height, sibling in enumerate(proof.siblings):
+            if proof.leaf_index >> height & 1:
+                current = node_hash(sibling, current)
+            else:
+                current = node_hash(current, sibling)
+        peak_hashes = list(proof.peaks)
+        peak_hashes.insert(position, current)
+        return bag_peaks(peak_hashes) == root
+    except ValueError:
+        return False
+
+
+def nodes_from_hashes(
+    event_hashes: Iterable[Optional[str]],
+) -> Dict[Tuple[int, int], str]:
+    """Build every node for a hash sequence in memory (O(n)); for fallbacks."""
+    nodes: Dict[Tuple[int, int], str] = {}
+    for leaf_index, event_hash in enumerate(event_hashes):
+        nodes[(0, leaf_index)] = leaf_hash(event_hash)
+        for level, index in parents_for_append(leaf_index):
+            nodes[(level, index)] = node_hash(
+                nodes[(level - 1, 2 * index)], nodes[(level - 1, 2 * index + 1)]
+            )
+    return nodes
@@ -11,11 +11,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Optional
 
-from .event_log import EventLog
+from .event_log import EventLog, ProjectionSnapshot
 from .commitment_outcome import is_commitment_relationship_protocol
-from .rsm import RecursiveSelfModel
+from .rsm import RecursiveSelfModel, snapshot_ladder
 import json
 
+RSM_MIRROR_PROJECTION = "mirror.rsm"
+
 
 class Mirror:
     STALE_THRESHOLD = 20
@@ -69,6 +71,40 @@ class Mirror:
         if isinstance(event_id, int):
             self.last_event_id = event_id
 
+    def projection_snapshot(self) -> Optional[ProjectionSnapshot]:
+        """Snapshot hooks for ``EventLog.rebuild_and_register_listener``.
+
+        RSM-enabled mirrors rebuild from the ledger and return None.
+        """
+        if self._rsm is not None:
+            return None
+        return ProjectionSnapshot(
+            version=1, dump=self._dump_state, load=self._load_state
+        )
+
+    def _dump_state(self) -> Dict[str, Any]:
+        return {
+            "open_commitments": self.open_commitments,
+            "stale_flags": self.stale_flags,
+            "reflection_counts": self.reflection_counts,
+            "last_event_id": self.last_event_id,
+            "current_retrieval_config": self.current_retrieval_config,
+        }
+
+    def _load_state(self, state: Dict[str, Any]) -> None:
+        self.open_commitments = {
+            str(cid): dict(data) for cid, data in state["open_commitments"].items()
+        }
+        self.stale_flags = {
+            str(cid): bool(flag) for cid, flag in state["stale_flags"].items()
+        }
+        self.reflection_counts = {
+            str(source): int(count)
+            for source, count in state["reflection_counts"].items()
+        }
+        self.last_event_id = int(state["last_event_id"])
+        self.current_retrieval_config = state["current_retrieval_config"]
+
     def _process_event(self, event: Dict) -> None:
         if is_commitment_relationship_protocol(event):
             return
@@ -132,7 +168,7 @@ class Mirror:
     def rsm_knowledge_gaps(self) -> int:
         if self._rsm is None:
             return 0
-        snapshot = self._rsm.snapshot()
+        snapshot = self._rsm.snapshot(include_concept_metrics=False)
         intents = snapshot.get("intents", {}) or {}
         reflections = snapshot.get("reflections", []) or []
 
@@ -156,10 +192,8 @@ class Mirror:
     def diff_rsm(self, event_id_a: int, event_id_b: int) -> Dict[str, Any]:
         if self._rsm is None or event_id_a == event_id_b:
             return {"tendencies_delta": {}, "gaps_added": [], "gaps_resolved": []}
-        mirror_a = self._rebuild_up_to(event_id_a)
-        mirror_b = self._rebuild_up_to(event_id_b)
-        snap_a = mirror_a.rsm_snapshot()
-        snap_b = mirror_b.rsm_snapshot()
+        snap_a = self.rsm_snapshot_at(event_id_a, include_concept_metrics=False)
+        snap_b = self.rsm_snapshot_at(event_id_b, include_concept_metrics=False)
 
         tendencies_a: Dict[str, int] = snap_a.get("behavioral_tendencies", {}) or {}
         tendencies_b: Dict[str, int] = snap_b.get("behavioral_tendencies", {}) or {}
@@ -181,6 +215,21 @@ class Mirror:
             "gaps_resolved": gaps_resolved,
         }
 
+    def rsm_snapshot_at(
+        self, event_id: int, *, include_concept_metrics: bool = True
+    ) -> Dict[str, Any]:
+        """RSM snapshot as of ``event_id``.
+
+        Served from the ledger's shared snapshot ladder: the nearest stored
+        state at or before ``event_id`` is forked and only the gap replayed.
+        """
+        if self._rsm is None:
+            return {}
+        if not isinstance(self.eventlog, EventLog):
+            return self._rebuild_up_to(event_id).rsm_snapshot()
+        rsm = snapshot_ladder(self.eventlog).state_at(event_id)
+        return rsm.snapshot(include_concept_metrics=include_concept_metrics)
+
     def _rebuild_up_to(self, event_id: int) -> "Mirror":
         events = self.eventlog.read_up_to(event_id)
         mirror = Mirror(
@@ -195,14 +244,9 @@ class Mirror:
     def rebuild_fast(self) -> None:
         if self._rsm is None:
             return
-        events = self.eventlog.read_all()
         start_id = 0
         snapshot: Optional[Dict[str, Any]] = None
-        last_manifest = None
-        for ev in reversed(events):
-            if ev.get("kind") == "checkpoint_manifest":
-                last_manifest = ev
-                break
+        last_manifest = self.eventlog.last_of_kind("checkpoint_manifest")
         if last_manifest is not None:
             try:
                 data = json.loads(last_manifest.get("content") or "{}")
@@ -210,27 +254,25 @@ class Mirror:
                 data = {}
             start_id = int(data.get("up_to_id", 0))
 
-        anchor_event = None
-        for ev in reversed(events):
-            if ev.get("kind") == "summary_update":
-                if start_id == 0 or int(ev.get("id", 0)) <= start_id:
-                    anchor_event = ev
-                    break
+        anchor_event = self.eventlog.last_of_kind(
+            "summary_update", up_to_id=start_id or None
+        )
 
+        start = 0
         if anchor_event is None:
-            self._rsm.rebuild(events)
-            return
-
-        meta = anchor_event.get("meta") or {}
-        if isinstance(meta, dict):
-            snapshot = meta.get("rsm_state")
-        if isinstance(snapshot, dict):
-            self._rsm.load_snapshot(snapshot)
-        anchor_id = int(anchor_event.get("id", 0))
-        start = max(start_id, anchor_id)
-        for ev in events:
-            if int(ev.get("id", 0)) > start:
-                self._rsm.observe(ev)
+            self._rsm.reset()
+        else:
+            meta = anchor_event.get("meta") or {}
+            if isinstance(meta, dict):
+                snapshot = meta.get("rsm_state")
+            if isinstance(snapshot, dict):
+                self._rsm.load_snapshot(snapshot)
+            # Snapshots that record the last event they cover resume right
+            # after it; older ones resume after the anchor.
+            anchor_id = int(anchor_event.get("id", 0))
+            start = self._rsm.last_event_id or max(start_id, anchor_id)
+        cursor = self.eventlog.open_cursor("mirror.rsm_fast", applied_through=start)
+        cursor.fold(self._rsm.observe)
 
     # --- Commitment helpers -----------------------------------------------------------
 
@@ -238,3 +280,17 @@ class Mirror:
         if not cid:
             return False
         return cid in self.open_commitments
+
+
+def shared_rsm_mirror(eventlog: EventLog) -> Mirror:
+    """RSM-enabled Mirror shared through the ledger's projection registry.
+
+    The first request rebuilds it once; afterwards it is listener-fed, so
+    per-turn helpers read current RSM state without replaying the ledger.
+    """
+    if not isinstance(eventlog, EventLog):
+        return Mirror(eventlog, enable_rsm=True, listen=False)
+    return eventlog.projection(
+        RSM_MIRROR_PROJECTION,
+        lambda: Mirror(eventlog, enable_rsm=True, auto_rebuild=False),
+    )
@@ -5,9 +5,12 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import copy
+from collections import OrderedDict, defaultdict, deque
 import json
-from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+import threading
+import weakref
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from .event_log import EventLog
 from .commitment_outcome import (
@@ -58,6 +61,10 @@ class RecursiveSelfModel:
         # Uniqueness tracking (first 8 chars of event hash)
         self._unique_prefixes: set[str] = set()
         self._total_events: int = 0
+        # Distinct prefixes restored from a snapshot; those events stay in the
+        # ledger and are probed through the hash index instead of held here.
+        self._prefix_base: int = 0
+        self._prefix_base_through: Optional[int] = None
         self.behavioral_tendencies: Dict[str, int] = {}
         self.knowledge_gaps: List[str] = []
         self.interaction_meta_patterns: List[str] = []
@@ -73,6 +80,8 @@ class RecursiveSelfModel:
         self._last_identity_event = None
         self._unique_prefixes.clear()
         self._total_events = 0
+        self._prefix_base = 0
+        self._prefix_base_through = None
         self.behavioral_tendencies = {}
         self.knowledge_gaps = []
         self.interaction_meta_patterns = []
@@ -83,21 +92,31 @@ class RecursiveSelfModel:
         self.reset()
         for event in events:
             self.observe(event)
-        # After full rebuild, ensure uniqueness cache reflects all events.
-        if self.eventlog is not None:
-            try:
-                all_events = [
-                    event
-                    for event in self.eventlog.read_all()
-                    if not is_commitment_relationship_protocol(event)
-                ]
-                self._unique_prefixes = {
-                    (e.get("hash") or "")[:8] for e in all_events if e.get("hash")
-                }
-                self._total_events = len(all_events)
-            except Exception:
-                # Fallback is already populated via observe loop
-                pass
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the last event folded in (or restored from a snapshot)."""
+        return self._last_processed_event_id or 0
+
+    def fork(self) -> "RecursiveSelfModel":
+        """Independent copy of the current state; only the eventlog is shared.
+
+        With an EventLog attached, the hash-prefix set is folded into the
+        restored-prefix count and probed from the ledger, so forks stay small.
+        """
+        twin = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, list, set, deque)):
+                setattr(twin, name, copy.copy(value))
+        if (
+            isinstance(self.eventlog, EventLog)
+            and twin._unique_prefixes
+            and twin.last_event_id
+        ):
+            twin._prefix_base += len(twin._unique_prefixes)
+            twin._prefix_base_through = twin.last_event_id
+            twin._unique_prefixes = set()
+        return twin
 
     def observe(self, event: Optional[Dict[str, Any]]) -> None:
         """Process a single event incrementally."""
@@ -127,7 +146,7 @@ class RecursiveSelfModel:
         # Track uniqueness from event hash prefix
         ev_hash = event.get("hash") or ""
         if ev_hash:
-            self._unique_prefixes.add(ev_hash[:8])
+            self._note_prefix(ev_hash[:8])
         self._total_events += 1
 
         self._track_behavioral_patterns(kind, content_lower)
@@ -150,7 +169,8 @@ class RecursiveSelfModel:
                 self._pattern_counts[key] = 50
 
         # Compute uniqueness emphasis (0..20, typical 0..10)
-        uniq_score = int((len(self._unique_prefixes) / max(1, self._total_events)) * 10)
+        distinct = self._prefix_base + len(self._unique_prefixes)
+        uniq_score = int((distinct / max(1, self._total_events)) * 10)
         if uniq_score > 20:
             uniq_score = 20
         self._pattern_counts["uniqueness_emphasis"] = uniq_score
@@ -162,11 +182,15 @@ class RecursiveSelfModel:
         )
         self.interaction_meta_patterns = sorted(self._meta_patterns)
 
-    def snapshot(self) -> Dict[str, Any]:
-        """Return serialized snapshot for reflections or diagnostics."""
+    def snapshot(self, *, include_concept_metrics: bool = True) -> Dict[str, Any]:
+        """Return serialized snapshot for reflections or diagnostics.
+
+        ``include_concept_metrics=False`` skips the ConceptGraph rebuild for
+        callers that only read the intent/reflection fields.
+        """
         # Concept-level metrics are derived deterministically from the ledger.
         concept_metrics: Dict[str, Any] = {}
-        if self.eventlog is not None:
+        if self.eventlog is not None and include_concept_metrics:
             try:
                 concept_metrics = compute_concept_metrics(self.eventlog)
             except Exception:
@@ -178,6 +202,11 @@ class RecursiveSelfModel:
             "interaction_meta_patterns": list(self.interaction_meta_patterns),
             "intents": dict(self._gap_counts),
             "reflections": [{"intent": i} for i in self.reflection_intents],
+            "uniqueness": {
+                "through_id": self.last_event_id,
+                "events": self._total_events,
+                "prefixes": self._prefix_base + len(self._unique_prefixes),
+            },
             "concept_metrics": concept_metrics,
         }
 
@@ -203,10 +232,37 @@ class RecursiveSelfModel:
             for item in refl:
                 if isinstance(item, dict) and isinstance(item.get("intent"), str):
                     self.reflection_intents.append(item["intent"])
+        uniqueness = snapshot.get("uniqueness")
+        if isinstance(uniqueness, dict):
+            try:
+                through = int(uniqueness["through_id"])
+                self._total_events = int(uniqueness["events"])
+                self._prefix_base = int(uniqueness["prefixes"])
+            except (KeyError, TypeError, ValueError):
+                self._total_events = self._prefix_base = 0
+            else:
+                self._last_processed_event_id = through or None
+                self._prefix_base_through = through
         self.behavioral_tendencies = dict(sorted(self._pattern_counts.items()))
         self.knowledge_gaps = sorted(k for k in self._gap_counts.keys())
         self.interaction_meta_patterns = sorted(self._meta_patterns)
 
+    def _note_prefix(self, prefix: str) -> None:
+        if prefix in self._unique_prefixes:
+            return
+        if self._prefix_base_through is not None and isinstance(
+            self.eventlog, EventLog
+        ):
+            for event in self.eventlog.read_by_hash_prefix(
+                prefix, up_to_id=self._prefix_base_through
+            ):
+                if not (
+                    is_commitment_relationship_protocol(event)
+                    or event.get("kind") == "rsm_update"
+                ):
+                    return
+        self._unique_prefixes.add(prefix)
+
     def knowledge_gap_count(self) -> int:
         return len(self.knowledge_gaps)
 
@@ -273,3 +329,76 @@ class RecursiveSelfModel:
             self._gap_counts[old_topic] -= 1
             if self._gap_counts[old_topic] <= 0:
                 del self._gap_counts[old_topic]
+
+
+class RSMSnapshotLadder:
+    """Exact RSM states every ``interval`` events, kept in a bounded LRU.
+
+    ``state_at(event_id)`` forks the nearest rung at or before ``event_id``
+    and replays only the gap, recording rungs as it crosses interval
+    boundaries and at the endpoint. Rungs are derived from immutable ledger
+    prefixes, so dropping the ladder only costs replay time.
+    """
+
+    def __init__(
+        self,
+        eventlog: EventLog,
+        *,
+        model: Callable[..., Any] = RecursiveSelfModel,
+        interval: int = 1000,
+        max_rungs: int = 32,
+    ) -> None:
+        if int(interval) < 1 or int(max_rungs) < 1:
+            raise ValueError("interval and max_rungs must be positive")
+        self.eventlog = eventlog
+        self.model = model
+        self.interval = int(interval)
+        self.max_rungs = int(max_rungs)
+        self._rungs: "OrderedDict[int, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def state_at(self, event_id: int) -> Any:
+        """Return a fresh model holding the state after events with id <= ``event_id``."""
+        bound = max(0, int(event_id))
+        with self._lock:
+            start = max((rid for rid in self._rungs if rid <= bound), default=0)
+            if start:
+                self._rungs.move_to_end(start)
+                rsm = self._rungs[start].fork()
+            else:
+                rsm = self.model(eventlog=self.eventlog)
+        through = start
+        boundary = (start // self.interval + 1) * self.interval
+        for event in self.eventlog.iter_events(start + 1, end_id=bound):
+            rsm.observe(event)
+            through = int(event["id"])
+            if through >= boundary:
+                self._store(through, rsm)
+                boundary = (through // self.interval + 1) * self.interval
+        if through > start:
+            self._store(through, rsm)
+        return rsm
+
+    def _store(self, event_id: int, rsm: Any) -> None:
+        rung = rsm.fork()
+        with self._lock:
+            self._rungs[event_id] = rung
+            self._rungs.move_to_end(event_id)
+            while len(self._rungs) > self.max_rungs:
+                self._rungs.popitem(last=False)
+
+
+_LADDERS: "weakref.WeakKeyDictionary[EventLog, Dict[Any, RSMSnapshotLadder]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def snapshot_ladder(
+    eventlog: EventLog, model: Callable[..., Any] = RecursiveSelfModel
+) -> RSMSnapshotLadder:
+    """Return the ladder shared by every mirror over ``eventlog`` for ``model``."""
+    ladders = _LADDERS.setdefault(eventlog, {})
+    ladder = ladders.get(model)
+    if ladder is None:
+        ladder = ladders[model] = RSMSnapshotLadder(eventlog, model=model)
+    return ladder
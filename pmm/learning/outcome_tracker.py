@@ -8,9 +8,9 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
-from pmm.core.event_log import EventLog
+from pmm.core.event_log import EventLog, open_cursor
 from pmm.core.commitment_outcome import OUTCOME_PROTOCOL_V1
 
 
@@ -24,31 +24,50 @@ class OutcomeObservation:
     evidence_event_ids: tuple[int, ...]
 
 
+def outcome_observation_from_event(
+    event: Dict[str, Any],
+) -> Optional[OutcomeObservation]:
+    """Parse one legacy outcome_observation event; governed v1 rows are skipped."""
+    if event.get("kind") != "outcome_observation":
+        return None
+    if (event.get("meta") or {}).get("protocol") == OUTCOME_PROTOCOL_V1:
+        return None
+    try:
+        data = json.loads(event.get("content") or "{}")
+        if not isinstance(data, dict):
+            return None
+        return OutcomeObservation(
+            event_id=event["id"],
+            commitment_id=data.get("commitment_id", ""),
+            action_kind=data.get("action_kind", ""),
+            action_payload=data.get("action_payload", ""),
+            observed_result=data.get("observed_result", ""),
+            evidence_event_ids=tuple(data.get("evidence_event_ids", [])),
+        )
+    except (ValueError, TypeError):
+        return None  # Skip malformed
+
+
+class OutcomeTracker:
+    """Incremental outcome-observation projection advanced through a cursor."""
+
+    def __init__(self, log: EventLog) -> None:
+        self._observations: List[OutcomeObservation] = []
+        self._cursor = open_cursor(log, "learning.outcomes")
+
+    def observations(self) -> List[OutcomeObservation]:
+        self._cursor.fold(self._observe)
+        return list(self._observations)
+
+    def _observe(self, event: Dict[str, Any]) -> None:
+        observation = outcome_observation_from_event(event)
+        if observation is not None:
+            self._observations.append(observation)
+
+
 def extract_outcome_observations(log: EventLog) -> List[OutcomeObservation]:
     """Extract outcome observations from event log."""
-    observations = []
-    for event in log.read_all():
-        if event.get("kind") == "outcome_observation":
-            if (event.get("meta") or {}).get("protocol") == OUTCOME_PROTOCOL_V1:
-                continue
-            try:
-                data = json.loads(event.get("content") or "{}")
-                if isinstance(data, dict):
-                    observations.append(
-                        OutcomeObservation(
-                            event_id=event["id"],
-                            commitment_id=data.get("commitment_id", ""),
-                            action_kind=data.get("action_kind", ""),
-                            action_payload=data.get("action_payload", ""),
-                            observed_result=data.get("observed_result", ""),
-                            evidence_event_ids=tuple(
-                                data.get("evidence_event_ids", [])
-                            ),
-                        )
-                    )
-            except (ValueError, TypeError):
-                continue  # Skip malformed
-    return observations
+    return OutcomeTracker(log).observations()
 
 
 def build_outcome_observation_content(
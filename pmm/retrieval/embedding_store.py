@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/retrieval/embedding_store.py
+"""Incremental int8 embedding matrices projected from ``embedding_add`` events.
+
+Each (model, dims) pair owns one contiguous int8 matrix with a parallel
+event-id array and per-row scales. The store is a rebuildable projection: it
+folds only ``embedding_add`` rows appended since its watermark, so existence
+checks are O(1) dictionary lookups and scoring is a single pass over the
+matrix instead of JSON parsing and dequantization per call.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class EmbeddingMatrix:
+    """Row-major int8 vectors for one (model, dims) pair."""
+
+    def __init__(self, dims: int) -> None:
+        self.dims = int(dims)
+        self.ids = array("q")
+        self.scales = array("d")
+        self.values = array("b")
+        self._rows: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, event_id: object) -> bool:
+        return event_id in self._rows
+
+    def put(self, event_id: int, ints: Sequence[int], scale: float) -> None:
+        """Insert or replace the row for ``event_id`` (latest record wins)."""
+        row = self._rows.get(event_id)
+        if row is None:
+            self._rows[event_id] = len(self.ids)
+            self.ids.append(event_id)
+            self.scales.append(scale)
+            self.values.extend(ints)
+            return
+        self.scales[row] = scale
+        start = row * self.dims
+        self.values[start : start + self.dims] = array("b", ints)
+
+    def vector(self, event_id: int) -> Optional[List[float]]:
+        row = self._rows.get(event_id)
+        if row is None:
+            return None
+        s = self.scales[row]
+        start = row * self.dims
+        return [i * s for i in self.values[start : start + self.dims]]
+
+    def scores(
+        self, query: Sequence[float], ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, float]:
+        """Return event_id -> dot(query, dequantized row) for stored rows."""
+        if ids is None:
+            rows: Iterable[int] = range(len(self.ids))
+        else:
+            rows = [self._rows[eid] for eid in ids if eid in self._rows]
+        dims = self.dims
+        values = memoryview(self.values)
+        out: Dict[int, float] = {}
+        for row in rows:
+            start = row * dims
+            acc = 0.0
+            for x, q in zip(values[start : start + dims], query):
+                acc += x * q
+            out[self.ids[row]] = acc * self.scales[row]
+        return out
+
+
+class EmbeddingStore:
+    """Projection of ``embedding_add`` events keyed by (model, dims)."""
+
+    def __init__(self, eventlog: Any = None) -> None:
+        self.eventlog = eventlog
+        self.last_event_id = 0
+        self._matrices: Dict[Tuple[str, int], EmbeddingMatrix] = {}
+
+    def rebuild(self, events: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        self._matrices.clear()
+        self.last_event_id = 0
+        if events is None:
+            self.refresh()
+            return
+        for event in events:
+            self.sync(event)
+
+    def sync(self, event: Optional[Dict[str, Any]]) -> None:
+        """Apply one ledger event; non-embedding events only advance the watermark."""
+        if not event:
+            return
+        event_id = event.get("id")
+        if isinstance(event_id, int):
+            if event_id <= self.last_event_id:
+                return
+            self.last_event_id = event_id
+        if event.get("kind") == "embedding_add":
+            self._apply(event.get("content"))
+
+    def refresh(self) -> int:
+        """Fold ``embedding_add`` events appended since the watermark."""
+        if self.eventlog is None:
+            return self.last_event_id
+        iter_events = getattr(self.eventlog, "iter_events", None)
+        if iter_events is None:
+            for event in self.eventlog.read_all():
+                self.sync(event)
+            return self.last_event_id
+        for row in iter_events(
+            self.last_event_id + 1,
+            kinds=("embedding_add",),
+            columns=("kind", "content"),
+        ):
+            self.sync(row)
+        return self.last_event_id
+
+    def matrix(self, model: str, dims: int) -> Optional[EmbeddingMatrix]:
+        self.refresh()
+        return self._matrices.get((str(model), int(dims)))
+
+    def has(self, event_id: int, *, model: str, dims: int) -> bool:
+        matrix = self.matrix(model, dims)
+        return matrix is not None and int(event_id) in matrix
+
+    def missing(self, event_ids: Iterable[int], *, model: str, dims: int) -> List[int]:
+        """Return the ``event_ids`` without a stored row, refreshing once."""
+        matrix = self.matrix(model, dims)
+        if matrix is None:
+            return [int(eid) for eid in event_ids]
+        return [int(eid) for eid in event_ids if int(eid) not in matrix]
+
+    def vector(self, event_id: int, *, model: str, dims: int) -> Optional[List[float]]:
+        matrix = self.matrix(model, dims)
+        return None if matrix is None else matrix.vector(int(event_id))
+
+    def index(self, *, model: str, dims: int) -> Dict[int, List[float]]:
+        """Return event_id -> dequantized vector, as ``build_index`` does."""
+        matrix = self.matrix(model, dims)
+        if matrix is None:
+            return {}
+        return {eid: matrix.vector(eid) or [] for eid in matrix.ids}
+
+    def scores(
+        self,
+        query: Sequence[float],
+        *,
+        model: str,
+        dims: int,
+        ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, float]:
+        matrix = self.matrix(model, dims)
+        if matrix is None:
+            return {}
+        return matrix.scores(query, ids)
+
+    def _apply(self, content: Any) -> None:
+        try:
+            data = json.loads(content or "{}")
+        except Exception:
+            return
+        if not isinstance(data, dict):
+            return
+        try:
+            dims = int(data.get("dims", 0))
+            event_id = int(data.get("event_id", 0))
+            scale = float(data.get("scale") or 1.0)
+            ints = [int(x) for x in data.get("vector") or []]
+        except (TypeError, ValueError):
+            return
+        if dims <= 0 or len(ints) != dims:
+            return
+        try:
+            packed = array("b", ints)
+        except OverflowError:
+            return
+        key = (str(data.get("model")), dims)
+        matrix = self._matrices.get(key)
+        if matrix is None:
+            matrix = self._matrices[key] = EmbeddingMatrix(dims)
+        matrix.put(event_id, packed, scale)
@@ -10,12 +10,15 @@ relevant context for a turn.
 from __future__ import annotations
 
 import math
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from pmm.core.event_log import EventLog
 from pmm.core.concept_graph import ConceptGraph
 from pmm.core.meme_graph import CommitmentEpisode, MemeGraph
+from pmm.retrieval.result_cache import RetrievalCache, cache_key
+from pmm.retrieval.summary_index import SummaryIndex
 from pmm.retrieval.vector import select_by_vector, select_by_concepts
 
 # Embedding parameters this pipeline applies to every select_by_vector call.
@@ -86,27 +89,78 @@ class RetrievalResult:
     # One entry per select_by_vector invocation that actually ran, recording the
     # embedding parameters passed to it. Empty when no vector stage executed.
     vector_embedding_uses: List[Dict[str, Any]] = field(default_factory=list)
+    # Per-stage cost in execution order: wall_ms, eventlog_gets (single and
+    # bulk fetch calls), events_embedded and candidates. Timing varies run to run, so it is not
+    # part of result equality.
+    stage_metrics: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, compare=False
+    )
 
 
-def run_retrieval_pipeline(
-    *,
-    query_text: str,
-    eventlog: EventLog,
-    concept_graph: ConceptGraph,
-    meme_graph: MemeGraph,
-    config: RetrievalConfig,
-    user_event: Optional[Dict[str, Any]] = None,
-) -> RetrievalResult:
-    """Execute the deterministic retrieval pipeline.
+# Receives (stage_name, metrics) as each stage finishes.
+StageMetricSink = Callable[[str, Dict[str, Any]], None]
 
-    Steps:
-    1. Concept Seeding: specific concepts from user event meta or config.
-    2. CTL Selection: get events and threads bound to seeded concepts.
-    3. Vector Selection: get events by semantic similarity.
-    4. Graph Expansion: expand selection via MemeGraph.
-    5. Merge & Sort: produce final stable list.
-    """
-    total_events = eventlog.count() if hasattr(eventlog, "count") else 0
+
+class _StageRecorder:
+    """Measures consecutive pipeline stages for one run."""
+
+    def __init__(self, sink: Optional[StageMetricSink] = None) -> None:
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.gets = 0
+        self._sink = sink
+        self._name: Optional[str] = None
+        self._current: Dict[str, Any] = {}
+        self._started = 0.0
+        self._gets_at_start = 0
+
+    def begin(self, name: str) -> None:
+        self.end()
+        self._name = name
+        self._current = {"events_embedded": 0, "candidates": 0}
+        self._gets_at_start = self.gets
+        self._started = time.perf_counter()
+
+    def note(self, *, candidates: Optional[int] = None, embedded: int = 0) -> None:
+        if candidates is not None:
+            self._current["candidates"] = int(candidates)
+        self._current["events_embedded"] += int(embedded)
+
+    def end(self) -> None:
+        if self._name is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        metrics = {
+            "wall_ms": round(elapsed * 1000.0, 3),
+            "eventlog_gets": self.gets - self._gets_at_start,
+            **self._current,
+        }
+        name, self._name = self._name, None
+        self.metrics[name] = metrics
+        if self._sink is not None:
+            self._sink(name, dict(metrics))
+
+
+class _CountingEventLog:
+    """Forwards to an EventLog, counting ``get`` calls for the recorder."""
+
+    def __init__(self, eventlog: EventLog, recorder: _StageRecorder) -> None:
+        self._eventlog = eventlog
+        self._recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._eventlog, name)
+
+    def get(self, event_id: int) -> Optional[Dict[str, Any]]:
+        self._recorder.gets += 1
+        return self._eventlog.get(event_id)
+
+    def get_many(self, event_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        self._recorder.gets += 1
+        return self._eventlog.get_many(event_ids)
+
+
+def _effective_limits(config: RetrievalConfig, total_events: int) -> Tuple[int, int]:
+    """Return (limit_total_events, thread_event_limit) for a ledger size."""
 
     def _grow_cap(base: int, max_cap: int) -> int:
         if not config.dynamic_cap_growth:
@@ -122,14 +176,14 @@ def run_retrieval_pipeline(
         config.cap_total_max,
     )
     thread_event_limit = _grow_cap(config.thread_event_limit, config.cap_total_max)
-    historical_episode_limit = max(0, int(config.historical_episode_limit))
-    historical_episode_event_limit = max(1, int(config.historical_episode_event_limit))
-    concept_thread_limit = max(1, int(config.concept_thread_limit))
+    return limit_total_events, thread_event_limit
 
-    # 1. Concept Seeding
+
+def _seed_concepts(
+    config: RetrievalConfig, user_event: Optional[Dict[str, Any]]
+) -> Set[str]:
     seed_concepts: Set[str] = set(config.always_include_concepts)
-    sticky_tokens: Set[str] = set(config.sticky_concepts or [])
-    seed_concepts.update(sticky_tokens)
+    seed_concepts.update(config.sticky_concepts or [])
 
     # Extract from user event meta if present (deterministic)
     if user_event:
@@ -138,10 +192,123 @@ def run_retrieval_pipeline(
         # For now, we assume meta might have "relevant_concepts"
         if "relevant_concepts" in meta and isinstance(meta["relevant_concepts"], list):
             seed_concepts.update(meta["relevant_concepts"])
+    return seed_concepts
+
+
+def run_retrieval_pipeline(
+    *,
+    query_text: str,
+    eventlog: EventLog,
+    concept_graph: ConceptGraph,
+    meme_graph: MemeGraph,
+    config: RetrievalConfig,
+    user_event: Optional[Dict[str, Any]] = None,
+    cache: Optional[RetrievalCache] = None,
+    metric_sink: Optional[StageMetricSink] = None,
+    summary_index: Optional[SummaryIndex] = None,
+) -> RetrievalResult:
+    """Execute the deterministic retrieval pipeline.
+
+    Steps:
+    1. Concept Seeding: specific concepts from user event meta or config.
+    2. CTL Selection: get events and threads bound to seeded concepts.
+    3. Vector Selection: get events by semantic similarity.
+    4. Graph Expansion: expand selection via MemeGraph.
+    5. Merge & Sort: produce final stable list.
+
+    When ``cache`` is given, an identical query whose inputs no appended event
+    has touched since it was computed is served from the cache.
+
+    Per-stage cost is recorded in ``RetrievalResult.stage_metrics`` and, when
+    ``metric_sink`` is given, passed to it as each stage finishes.
+
+    When ``summary_index`` is given, the summary stages read the kinds it
+    tracks from it instead of scanning and re-embedding them.
+    """
+    stages = _StageRecorder(metric_sink)
+    if cache is None:
+        return _run_pipeline(
+            query_text=query_text,
+            eventlog=eventlog,
+            concept_graph=concept_graph,
+            meme_graph=meme_graph,
+            config=config,
+            user_event=user_event,
+            stages=stages,
+            summary_index=summary_index,
+        )
+
+    stages.begin("cache_lookup")
+    key = cache_key(query_text, config, _seed_concepts(config, user_event))
+    cached = cache.lookup(
+        key,
+        eventlog=eventlog,
+        concept_graph=concept_graph,
+        meme_graph=meme_graph,
+        limits_at=lambda total: _effective_limits(config, total),
+    )
+    if cached is not None:
+        stages.note(candidates=len(cached.event_ids))
+        stages.end()
+        cached.stage_metrics = stages.metrics
+        return cached
+    watermark = eventlog.count()
+    watched: Set[int] = set()
+    result = _run_pipeline(
+        query_text=query_text,
+        eventlog=eventlog,
+        concept_graph=concept_graph,
+        meme_graph=meme_graph,
+        config=config,
+        user_event=user_event,
+        stages=stages,
+        watch=watched,
+        summary_index=summary_index,
+    )
+    cache.store(
+        key,
+        result,
+        eventlog=eventlog,
+        concept_graph=concept_graph,
+        meme_graph=meme_graph,
+        watermark=watermark,
+        limits=_effective_limits(config, watermark),
+        watched_ids=watched,
+        summary_kinds=config.summary_event_kinds,
+    )
+    return result
 
-    seed_concepts_list = sorted(seed_concepts)
+
+def _run_pipeline(
+    *,
+    query_text: str,
+    eventlog: EventLog,
+    concept_graph: ConceptGraph,
+    meme_graph: MemeGraph,
+    config: RetrievalConfig,
+    user_event: Optional[Dict[str, Any]] = None,
+    stages: Optional[_StageRecorder] = None,
+    watch: Optional[Set[int]] = None,
+    summary_index: Optional[SummaryIndex] = None,
+) -> RetrievalResult:
+    """Run the pipeline; ``watch`` collects every event id the selection read."""
+    if stages is None:
+        stages = _StageRecorder()
+    eventlog = _CountingEventLog(eventlog, stages)
+    stages.begin("concept_seeding")
+    total_events = eventlog.count() if hasattr(eventlog, "count") else 0
+    limit_total_events, thread_event_limit = _effective_limits(config, total_events)
+    historical_episode_limit = max(0, int(config.historical_episode_limit))
+    historical_episode_event_limit = max(1, int(config.historical_episode_event_limit))
+    concept_thread_limit = max(1, int(config.concept_thread_limit))
+
+    # 1. Concept Seeding
+    sticky_tokens: Set[str] = set(config.sticky_concepts or [])
+    seed_concepts_list = sorted(_seed_concepts(config, user_event))
+    stages.note(candidates=len(seed_concepts_list))
 
     # 2. CTL Selection
+    stages.begin("ctl_selection")
     ctl_event_ids: Set[int] = set()
     relevant_cids: Set[str] = set()
     cid_trigger_event_ids: Dict[str, Set[int]] = {}
@@ -212,11 +379,8 @@ def run_retrieval_pipeline(
     # bound to those tokens is available in the forced bucket.
     if seed_concepts_list:
         topology_budget = max(4, min(12, limit_total_events // 10))
-        added_from_topology = 0
+        topology_ids: List[List[int]] = []
         for tok in seed_concepts_list:
-            if added_from_topology >= topology_budget:
-                break
-
             root_eid = concept_graph.root_event_id(tok)
             tail_eid = concept_graph.tail_event_id(tok)
             kind = concept_graph.concept_kind(tok)
@@ -232,14 +396,22 @@ def run_retrieval_pipeline(
                 # For other concept kinds, a tail binding is usually enough for continuity.
                 if isinstance(tail_eid, int):
                     ids_to_add.append(tail_eid)
+            topology_ids.append(ids_to_add)
 
+        present_ids = eventlog.exists_many(
+            eid for ids_to_add in topology_ids for eid in ids_to_add
+        )
+        added_from_topology = 0
+        for ids_to_add in topology_ids:
             for eid in ids_to_add:
                 if added_from_topology >= topology_budget:
                     break
-                if eventlog.exists(eid):
+                if eid in present_ids:
                     forced_event_ids.add(eid)
                     added_from_topology += 1
 
+    stages.note(candidates=len(ctl_event_ids | sticky_event_ids | forced_event_ids))
+
     # 3. Vector Selection
     vector_event_ids: Set[int] = set()
     vector_scores: Dict[int, float] = {}
@@ -261,11 +433,13 @@ def run_retrieval_pipeline(
             return set(), {}
         if not candidate_ids:
             return set(), {}
+        fetched = eventlog.get_many(candidate_ids)
         events_data: List[Dict] = []
         for eid in sorted(candidate_ids):
-            ev = eventlog.get(int(eid)) or {}
+            ev = fetched.get(int(eid)) or {}
             ev["id"] = int(eid)
             events_data.append(ev)
+        stages.note(candidates=len(events_data), embedded=len(events_data))
         stage_model, stage_dims = VECTOR_EMBEDDING_MODEL, VECTOR_EMBEDDING_DIMS
         vec_ids, scores = select_by_vector(
             events=events_data,
@@ -285,6 +459,7 @@ def run_retrieval_pipeline(
         return set(vec_ids), dict(zip(vec_ids, scores))
 
     # 3a. Thread-first selection (concept -> CID -> slices)
+    stages.begin("thread_slicing")
     thread_expanded_ids: Set[int] = set()
     if relevant_cids:
         for cid in sorted(relevant_cids):
@@ -302,7 +477,10 @@ def run_retrieval_pipeline(
                 ]
             thread_expanded_ids.update(slice_ids)
 
+    stages.note(candidates=len(thread_expanded_ids))
+
     # 3b. Optional vector refinement over thread slices
+    stages.begin("vector_refinement")
     if config.enable_vector_search and query_text:
         refined_ids, refined_scores = _refine_with_vector(
             thread_expanded_ids.union(ctl_event_ids).union(sticky_event_ids),
@@ -312,21 +490,29 @@ def run_retrieval_pipeline(
         vector_scores.update(refined_scores)
 
     # 3c. Summary vector search (unchanged but bounded to summaries)
+    stages.begin("summary_vector")
     if (
         config.enable_vector_search
         and config.enable_summary_vector_search
         and query_text
     ):
         summary_events: List[Dict] = []
+        embedded = 0
         for kind in config.summary_event_kinds:
-            summary_events.extend(
-                eventlog.read_by_kind(
-                    kind,
-                    limit=config.summary_event_scan_limit,
-                    reverse=False,
+            if summary_index is not None and summary_index.tracks(kind):
+                summary_events.extend(
+                    summary_index.events(kind, limit=config.summary_event_scan_limit)
                 )
+                continue
+            kind_events = eventlog.read_by_kind(
+                kind,
+                limit=config.summary_event_scan_limit,
+                reverse=False,
             )
+            embedded += len(kind_events)
+            summary_events.extend(kind_events)
         summary_events = sorted(summary_events, key=lambda ev: int(ev.get("id", 0)))
+        stages.note(candidates=len(summary_events), embedded=embedded)
         if summary_events:
             stage_model, stage_dims = VECTOR_EMBEDDING_MODEL, VECTOR_EMBEDDING_DIMS
             s_vec_ids, s_vec_scores = select_by_vector(
@@ -337,6 +523,7 @@ def run_retrieval_pipeline(
                 cap=len(summary_events),
                 model=stage_model,
                 dims=stage_dims,
+                store=summary_index,
             )
             vector_embedding_uses.append(
                 {
@@ -348,8 +535,10 @@ def run_retrieval_pipeline(
             summary_vector_ids.update(s_vec_ids)
             summary_vector_scores.update(dict(zip(s_vec_ids, s_vec_scores)))
             summary_expanded_ids.update(summary_vector_ids)
+            summary_hits = eventlog.get_many(s_vec_ids)
+            sample_ids_wanted: Set[int] = set()
             for sid in s_vec_ids:
-                ev = eventlog.get(sid) or {}
+                ev = summary_hits.get(sid) or {}
                 meta = ev.get("meta") or {}
                 sample_ids = meta.get("sample_ids") or []
                 cids = meta.get("cids") or []
@@ -358,17 +547,19 @@ def run_retrieval_pipeline(
                         mid_int = int(mid)
                     except Exception:
                         continue
-                    if eventlog.exists(mid_int):
-                        summary_expanded_ids.add(mid_int)
+                    sample_ids_wanted.add(mid_int)
                 # Expand via cids to pull deterministic slices
                 for cid in cids:
                     slice_ids = meme_graph.get_thread_slice(
                         cid, limit=thread_event_limit
                     )
                     summary_expanded_ids.update(slice_ids)
+            summary_expanded_ids.update(eventlog.exists_many(sample_ids_wanted))
 
     # Always pin recent summary/lifetime_memory events if configured
+    stages.begin("lifetime_memory_recall")
     if config.include_summary_events and config.summary_event_kinds:
+        pinned_sample_ids: Set[int] = set()
         for kind in config.summary_event_kinds:
             pinned = eventlog.read_by_kind(
                 kind,
@@ -385,12 +576,24 @@ def run_retrieval_pipeline(
                         sid_int = int(sid)
                     except Exception:
                         continue
-                    if eventlog.exists(sid_int):
-                        summary_expanded_ids.add(sid_int)
+                    pinned_sample_ids.add(sid_int)
+        summary_expanded_ids.update(eventlog.exists_many(pinned_sample_ids))
 
     # Structural lifetime_memory recall: for seeded concepts, also pin the
     # earliest lifetime_memory chunk that references them, if configurable.
-    if config.summary_event_kinds and "lifetime_memory" in config.summary_event_kinds:
+    if (
+        "lifetime_memory" in config.summary_event_kinds
+        and summary_index is not None
+        and summary_index.tracks("lifetime_memory")
+    ):
+        canonical_seeds = {
+            concept_graph.canonical_token(tok) for tok in seed_concepts_list
+        }
+        for canon in sorted(canonical_seeds):
+            span = summary_index.concept_span(canon, concept_graph)
+            if span is not None and span[0]:
+                summary_pinned_ids.add(span[0])
+    elif config.summary_event_kinds and "lifetime_memory" in config.summary_event_kinds:
         lm_events = eventlog.read_by_kind("lifetime_memory", reverse=False)
         if lm_events and seed_concepts_list:
             # Map canonical tokens to earliest lifetime_memory id that mentions them
@@ -417,7 +620,10 @@ def run_retrieval_pipeline(
                 if ev_id:
                     summary_pinned_ids.add(ev_id)
 
+    stages.note(candidates=len(summary_pinned_ids))
+
     # 4. Graph Expansion (MemeGraph)
+    stages.begin("episode_expansion")
     # We want to expand around the seed events (CTL + Vector).
     # AND include full threads for any relevant CIDs.
 
@@ -588,10 +794,10 @@ def run_retrieval_pipeline(
             open_event_id = int(episode.open_event_id)
             if open_event_id not in current_open_ids:
                 continue
-            is_relationship = event_id == episode.outcome_event_id or (
-                event_id in episode.review_event_ids
-            ) or (
-                event_id in episode.reinterpretation_event_ids
+            is_relationship = (
+                event_id == episode.outcome_event_id
+                or (event_id in episode.review_event_ids)
+                or (event_id in episode.reinterpretation_event_ids)
             )
             if not is_relationship or episode_triggers.get(open_event_id):
                 return True
@@ -628,7 +834,10 @@ def run_retrieval_pipeline(
         thread_expanded_ids.update(subgraph)
         graph_expanded_ids.update(set(subgraph) - base_ids)
 
+    stages.note(candidates=len(expanded_ids))
+
     # 5. Finalize
+    stages.begin("bucket_merge")
     # Bucketed allocation: pinned (forced+sticky) > concept > thread > summary > vector > residual
     forced_sorted = sorted(forced_event_ids, reverse=True)
     sticky_sorted = [
@@ -726,6 +935,20 @@ def run_retrieval_pipeline(
                 ),
             )
 
+    stages.note(candidates=len(final_ids))
+    stages.end()
+
+    if watch is not None:
+        watch.update(expanded_ids)
+        watch.update(summary_pinned_ids)
+        watch.update(summary_vector_ids)
+        for tok in seed_concepts_list:
+            watch.update(concept_graph.events_for_concept(tok))
+        for episode in episodes_by_open.values():
+            watch.update(episode.event_ids)
+        for cid in relevant_cids:
+            watch.update(meme_graph.thread_for_cid(cid))
+
     return RetrievalResult(
         event_ids=final_ids,
         relevant_cids=sorted(relevant_cids),
@@ -733,4 +956,5 @@ def run_retrieval_pipeline(
         provenance=provenance,
         episode_selections=episode_selections,
         vector_embedding_uses=vector_embedding_uses,
+        stage_metrics=stages.metrics,
     )
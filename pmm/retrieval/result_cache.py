@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/retrieval/result_cache.py
+"""Opt-in LRU cache for retrieval pipeline results.
+
+Entries are keyed by the query text hash, a digest of the RetrievalConfig and
+the seeded concepts. Each entry remembers the ledger watermark it is valid
+through. A lookup at a later watermark checks only the newly appended events:
+the entry survives unless one of them touches the seeds, the selected CIDs,
+an event the selection looked at, or a summary kind the pipeline scans.
+
+The cache is derived state only. Dropping it never changes a result.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from pmm.core.concept_graph import ConceptGraph
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+
+CacheKey = Tuple[str, str, Tuple[str, ...]]
+
+# Kinds that ConceptGraph projects; they matter only when their tokens overlap.
+_CONCEPT_KINDS = {
+    "concept_define",
+    "concept_alias",
+    "concept_bind_event",
+    "concept_bind_async",
+    "concept_bind_thread",
+    "concept_relate",
+    "identity_adoption",
+}
+
+
+def config_digest(config: Any) -> str:
+    """Return a stable digest of a RetrievalConfig."""
+    payload = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key(query_text: str, config: Any, seeds: Iterable[str]) -> CacheKey:
+    """Return the cache key for one pipeline invocation."""
+    query_hash = hashlib.sha256((query_text or "").encode("utf-8")).hexdigest()
+    return (query_hash, config_digest(config), tuple(sorted(seeds)))
+
+
+@dataclass
+class _Entry:
+    result: Any
+    sources: Tuple[Any, Any, Any]
+    watermark: int
+    limits: Tuple[int, int]
+    seeds: FrozenSet[str]
+    cids: FrozenSet[str]
+    watched_ids: FrozenSet[int]
+    summary_kinds: FrozenSet[str]
+
+
+class RetrievalCache:
+    """Bounded LRU of retrieval results with event-precise invalidation."""
+
+    def __init__(self, maxsize: int = 64, *, max_gap: int = 256) -> None:
+        if int(maxsize) < 1:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = int(maxsize)
+        # Entries older than this many events are dropped instead of checked.
+        self.max_gap = max(0, int(max_gap))
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for telemetry."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def lookup(
+        self,
+        key: CacheKey,
+        *,
+        eventlog: EventLog,
+        concept_graph: ConceptGraph,
+        meme_graph: MemeGraph,
+        limits_at: Callable[[int], Tuple[int, int]],
+    ) -> Optional[Any]:
+        """Return a copy of the cached result if it is still valid, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._still_valid(
+                entry, eventlog, concept_graph, meme_graph, limits_at
+            ):
+                del self._entries[key]
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry.result)
+
+    def store(
+        self,
+        key: CacheKey,
+        result: Any,
+        *,
+        eventlog: EventLog,
+        concept_graph: ConceptGraph,
+        meme_graph: MemeGraph,
+        watermark: int,
+        limits: Tuple[int, int],
+        watched_ids: Iterable[int],
+        summary_kinds: Iterable[str],
+    ) -> None:
+        """Remember ``result`` as valid through ``watermark``."""
+        seeds = set(key[2])
+        seeds.update(concept_graph.canonical_token(token) for token in key[2])
+        entry = _Entry(
+            result=copy.deepcopy(result),
+            sources=(eventlog, concept_graph, meme_graph),
+            watermark=int(watermark),
+            limits=tuple(limits),
+            seeds=frozenset(seeds),
+            cids=frozenset(result.relevant_cids),
+            watched_ids=frozenset(int(event_id) for event_id in watched_ids),
+            summary_kinds=frozenset(summary_kinds) | {"lifetime_memory"},
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _still_valid(
+        self,
+        entry: _Entry,
+        eventlog: EventLog,
+        concept_graph: ConceptGraph,
+        meme_graph: MemeGraph,
+        limits_at: Callable[[int], Tuple[int, int]],
+    ) -> bool:
+        sources = (eventlog, concept_graph, meme_graph)
+        if any(a is not b for a, b in zip(entry.sources, sources)):
+            return False
+        current = int(eventlog.count())
+        if current == entry.watermark:
+            return True
+        if current < entry.watermark or current - entry.watermark > self.max_gap:
+            return False
+        if limits_at(current) != entry.limits:
+            return False
+        for event in eventlog.read_range(entry.watermark + 1, current):
+            if self._touches(entry, event, concept_graph, meme_graph):
+                return False
+        entry.watermark = current
+        return True
+
+    @staticmethod
+    def _touches(
+        entry: _Entry,
+        event: Dict[str, Any],
+        concept_graph: ConceptGraph,
+        meme_graph: MemeGraph,
+    ) -> bool:
+        kind = event.get("kind")
+        if kind in entry.summary_kinds:
+            return True
+        meta = event.get("meta") or {}
+        if meta.get("cid") in entry.cids:
+            return True
+        if kind in _CONCEPT_KINDS:
+            try:
+                data = json.loads(event.get("content") or "{}")
+            except (TypeError, json.JSONDecodeError):
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+            tokens = [data.get(field) for field in ("token", "from", "to")]
+            if isinstance(data.get("tokens"), list):
+                tokens.extend(data["tokens"])
+            for token in tokens:
+                if not isinstance(token, str):
+                    continue
+                if token in entry.seeds:
+                    return True
+                if concept_graph.canonical_token(token) in entry.seeds:
+                    return True
+            if isinstance(data.get("event_id"), int):
+                if data["event_id"] in entry.watched_ids:
+                    return True
+        if kind in MemeGraph.TRACKED_KINDS:
+            event_id = int(event["id"])
+            # A projection that has not seen the event cannot vouch for it.
+            if not meme_graph.graph.has_node(event_id):
+                return True
+            if entry.watched_ids.intersection(meme_graph.neighbors(event_id)):
+                return True
+            if entry.cids.intersection(meme_graph.cids_for_event(event_id)):
+                return True
+        return False
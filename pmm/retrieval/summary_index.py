@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/retrieval/summary_index.py
+"""Projection of summary events for the retrieval pipeline's summary stages.
+
+For each tracked kind (``lifetime_memory`` by default) the index keeps the
+events in ledger order with their embeddings precomputed, so summary vector
+search scores stored vectors instead of re-embedding every summary per turn.
+It also maps each ``meta.concepts`` token of a ``lifetime_memory`` chunk to
+the earliest and latest chunk id mentioning it, so structural recall is a
+lookup per seed concept rather than a walk over every chunk.
+
+Like ``EmbeddingStore`` it is rebuildable: it can be fed as a listener, and
+``refresh`` folds tracked rows appended since its watermark.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pmm.core.event_log import ProjectionSnapshot
+from pmm.retrieval.vector import DeterministicEmbedder, cosine
+
+
+class SummaryIndex:
+    """Summary events with precomputed embeddings and a concept span map."""
+
+    def __init__(
+        self,
+        eventlog: Any = None,
+        *,
+        kinds: Iterable[str] = ("lifetime_memory",),
+        model: str = "hash64",
+        dims: int = 64,
+    ) -> None:
+        self.eventlog = eventlog
+        self.kinds = tuple(sorted({str(kind) for kind in kinds}))
+        self.model = str(model)
+        self.dims = int(dims)
+        self.last_event_id = 0
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._vectors: Dict[int, List[float]] = {}
+        # Raw concept token -> (earliest, latest) lifetime_memory id.
+        self._concept_spans: Dict[str, Tuple[int, int]] = {}
+        # Canonicalized view of _concept_spans, valid for _canonical_key.
+        self._canonical: Dict[str, Tuple[int, int]] = {}
+        self._canonical_key: Optional[Tuple[Any, int, int]] = None
+
+    def rebuild(self, events: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        self._events.clear()
+        self._vectors.clear()
+        self._concept_spans.clear()
+        self._canonical_key = None
+        self.last_event_id = 0
+        if events is None:
+            self.refresh()
+            return
+        for event in events:
+            self.sync(event)
+
+    def sync(self, event: Optional[Dict[str, Any]]) -> None:
+        """Apply one ledger event; untracked kinds only advance the watermark."""
+        if not event:
+            return
+        event_id = event.get("id")
+        if not isinstance(event_id, int) or event_id <= self.last_event_id:
+            return
+        self.last_event_id = event_id
+        kind = event.get("kind")
+        if kind not in self.kinds:
+            return
+        concepts = (event.get("meta") or {}).get("concepts") or []
+        self._add(event_id, str(kind), event.get("content") or "", concepts)
+
+    def refresh(self) -> int:
+        """Fold tracked events appended since the watermark."""
+        if self.eventlog is None:
+            return self.last_event_id
+        iter_events = getattr(self.eventlog, "iter_events", None)
+        if iter_events is None:
+            for event in self.eventlog.read_all():
+                self.sync(event)
+            return self.last_event_id
+        for row in iter_events(
+            self.last_event_id + 1,
+            kinds=self.kinds,
+            columns=("kind", "content", "meta"),
+        ):
+            self.sync(row)
+        return self.last_event_id
+
+    def tracks(self, kind: str) -> bool:
+        return kind in self.kinds
+
+    def events(self, kind: str, *, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return ``{id, kind, content}`` rows of ``kind``, earliest first.
+
+        Matches ``read_by_kind(kind, limit=limit, reverse=False)`` ordering.
+        """
+        self.refresh()
+        rows = self._events.get(kind, [])
+        if limit is not None and int(limit) >= 0:
+            rows = rows[: int(limit)]
+        return [dict(row) for row in rows]
+
+    def scores(
+        self,
+        query: Sequence[float],
+        *,
+        model: str,
+        dims: int,
+        ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, float]:
+        """Score stored vectors against ``query`` (``EmbeddingStore`` protocol).
+
+        Vectors are exact embeddings, so scores equal fresh re-embedding.
+        """
+        if str(model) != self.model or int(dims) != self.dims:
+            return {}
+        self.refresh()
+        wanted = self._vectors if ids is None else ids
+        out: Dict[int, float] = {}
+        for event_id in wanted:
+            vector = self._vectors.get(int(event_id))
+            if vector is not None:
+                out[int(event_id)] = cosine(query, vector)
+        return out
+
+    def concept_span(self, token: str, concept_graph: Any) -> Optional[Tuple[int, int]]:
+        """Return (earliest, latest) lifetime_memory ids for a canonical token."""
+        self.refresh()
+        key = (concept_graph, concept_graph.alias_version, self.last_event_id)
+        cached = self._canonical_key
+        if cached is None or cached[0] is not concept_graph or cached[1:] != key[1:]:
+            canonical: Dict[str, Tuple[int, int]] = {}
+            for raw, (earliest, latest) in self._concept_spans.items():
+                canon = concept_graph.canonical_token(raw)
+                span = canonical.get(canon)
+                if span is None:
+                    canonical[canon] = (earliest, latest)
+                else:
+                    canonical[canon] = (min(span[0], earliest), max(span[1], latest))
+            self._canonical = canonical
+            self._canonical_key = key
+        return self._canonical.get(token)
+
+    def projection_snapshot(self) -> ProjectionSnapshot:
+        """Snapshot hooks for ``EventLog.rebuild_and_register_listener``."""
+        return ProjectionSnapshot(
+            version=1, dump=self._dump_state, load=self._load_state
+        )
+
+    def _dump_state(self) -> Dict[str, Any]:
+        return {
+            "kinds": list(self.kinds),
+            "model": self.model,
+            "dims": self.dims,
+            "events": [
+                [row["id"], row["kind"], row["content"]]
+                for kind in self.kinds
+                for row in self._events.get(kind, [])
+            ],
+            "concepts": [
+                [token, earliest, latest]
+                for token, (earliest, latest) in sorted(self._concept_spans.items())
+            ],
+            "last_event_id": self.last_event_id,
+        }
+
+    def _load_state(self, state: Dict[str, Any]) -> None:
+        if (
+            list(state["kinds"]) != list(self.kinds)
+            or state["model"] != self.model
+            or int(state["dims"]) != self.dims
+        ):
+            raise ValueError("summary index snapshot was taken with other settings")
+        self.rebuild([])
+        for event_id, kind, content in state["events"]:
+            self._add(int(event_id), str(kind), content, [])
+        for token, earliest, latest in state["concepts"]:
+            self._concept_spans[token] = (int(earliest), int(latest))
+        self.last_event_id = int(state["last_event_id"])
+
+    def _add(
+        self, event_id: int, kind: str, content: str, concepts: Iterable[Any]
+    ) -> None:
+        self._events.setdefault(kind, []).append(
+            {"id": event_id, "kind": kind, "content": content}
+        )
+        embedder = DeterministicEmbedder(model=self.model, dims=self.dims)
+        self._vectors[event_id] = embedder.embed_many([content])[0]
+        if kind != "lifetime_memory":
+            return
+        for token in concepts:
+            if not isinstance(token, str):
+                continue
+            span = self._concept_spans.get(token)
+            if span is None:
+                self._concept_spans[token] = (event_id, event_id)
+            else:
+                self._concept_spans[token] = (
+                    min(span[0], event_id),
+                    max(span[1], event_id),
+                )
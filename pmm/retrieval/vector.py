@@ -11,11 +11,50 @@ events from the ledger.
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
 from hashlib import sha256
 import math
 import json
 
+# Bounded caches for token vectors and plain-model text embeddings. Both are
+# pure functions of their arguments, so cached values are identical to fresh
+# computation.
+TOKEN_VECTOR_CACHE_SIZE = 65536
+TEXT_VECTOR_CACHE_SIZE = 4096
+
+
+class VectorScoreStore(Protocol):
+    """Stored vectors ``select_by_vector`` can score instead of re-embedding.
+
+    Implemented by ``EmbeddingStore`` and ``SummaryIndex``. ``scores`` returns
+    only the ids it holds a vector for; the rest are embedded by the caller.
+    """
+
+    def scores(
+        self,
+        query: Sequence[float],
+        *,
+        model: str,
+        dims: int,
+        ids: Optional[Iterable[int]] = None,
+    ) -> Dict[int, float]:  # pragma: no cover - interface
+        ...
+
+
+@lru_cache(maxsize=TOKEN_VECTOR_CACHE_SIZE)
+def _token_vector(token: str, dims: int) -> Tuple[float, ...]:
+    # Component i is the first 4 bytes of sha256(token + ":" + i) mapped to
+    # [-1, 1]. The shared "token:" prefix is hashed once and copied per index.
+    prefix = sha256(f"{token}:".encode("utf-8"))
+    vec: List[float] = []
+    for i in range(dims):
+        h = prefix.copy()
+        h.update(str(i).encode("ascii"))
+        n = int.from_bytes(h.digest()[:4], byteorder="big", signed=False)
+        vec.append((n / 2**32) * 2.0 - 1.0)
+    return tuple(vec)
+
 
 class DeterministicEmbedder:
     def __init__(self, *, model: str = "hash64", dims: int = 64) -> None:
@@ -24,15 +63,7 @@ class DeterministicEmbedder:
 
     def _tok_vec(self, token: str) -> List[float]:
         """Return a deterministic pseudo-random vector for a token."""
-        vec: List[float] = []
-        # Produce dims 32-bit integers via sha256(token + ":" + i)
-        for i in range(self.dims):
-            h = sha256(f"{token}:{i}".encode("utf-8")).digest()
-            # Take first 4 bytes -> uint32 -> map to [-1, 1]
-            n = int.from_bytes(h[:4], byteorder="big", signed=False)
-            x = (n / 2**32) * 2.0 - 1.0
-            vec.append(x)
-        return vec
+        return list(_token_vector(token, self.dims))
 
     def embed(
         self,
@@ -47,26 +78,36 @@ class DeterministicEmbedder:
         toks.extend([t for t in (text or "").split() if t])
         if not toks:
             return [0.0] * self.dims
+        weighted = self.model == "hash64_tfidf" and idf is not None
         agg = [0.0] * self.dims
         for t in toks:
-            v = self._tok_vec(t)
-            weight = 1.0
+            v = _token_vector(t, self.dims)
             # Optional TF-IDF-style weighting for the hash64_tfidf model.
-            if self.model == "hash64_tfidf" and idf is not None:
-                weight = float(idf.get(t, 1.0))
-            for i in range(self.dims):
-                agg[i] += weight * v[i]
+            if weighted:
+                weight = float(idf.get(t, 1.0))  # type: ignore[union-attr]
+                agg = [a + weight * x for a, x in zip(agg, v)]
+            else:
+                agg = [a + x for a, x in zip(agg, v)]
         # L2 normalize
         norm = math.sqrt(sum(x * x for x in agg))
         if norm == 0.0:
             return [0.0] * self.dims
         return [x / norm for x in agg]
 
+    def embed_many(self, texts: Iterable[str]) -> List[List[float]]:
+        """Embed unweighted texts, reusing cached vectors for repeated text."""
+        return [list(_text_vector(self.model, self.dims, t or "")) for t in texts]
+
 
-def cosine(a: List[float], b: List[float]) -> float:
+@lru_cache(maxsize=TEXT_VECTOR_CACHE_SIZE)
+def _text_vector(model: str, dims: int, text: str) -> Tuple[float, ...]:
+    return tuple(DeterministicEmbedder(model=model, dims=dims).embed(text))
+
+
+def cosine(a: Sequence[float], b: Sequence[float]) -> float:
     s = 0.0
-    for i in range(min(len(a), len(b))):
-        s += a[i] * b[i]
+    for x, y in zip(a, b):
+        s += x * y
     return s
 
 
@@ -103,10 +144,16 @@ def select_by_vector(
     up_to_id: int | None = None,
     kinds: Optional[Iterable[str]] = None,
     cap: Optional[int] = None,
+    store: Optional[VectorScoreStore] = None,
 ) -> Tuple[List[int], List[float]]:
     """Return (selected_ids, scores) by cosine similarity to query.
 
     Deterministic, local-only scoring over recent candidate messages.
+
+    With an ``EmbeddingStore``, plain-model candidates that already have a
+    stored int8 embedding are scored from the store's matrix in one pass and
+    only the rest are embedded. Stored vectors are quantized, so scores can
+    differ from exact re-embedding in the last digits.
     """
     limit = max(1, int(limit))
     cap_val = cap if cap is not None else 100
@@ -152,12 +199,21 @@ def select_by_vector(
     else:
         embedder = DeterministicEmbedder(model=model, dims=dims)
         q = embedder.embed(query_text)
+        stored: Dict[int, float] = {}
+        if store is not None:
+            stored = store.scores(
+                q,
+                model=model,
+                dims=dims,
+                ids=[int(ev.get("id", 0)) for ev in cands],
+            )
+        rest = [ev for ev in cands if int(ev.get("id", 0)) not in stored]
+        vectors = embedder.embed_many(ev.get("content") or "" for ev in rest)
+        for ev, v in zip(rest, vectors):
+            stored[int(ev.get("id", 0))] = cosine(q, v)
         for ev in cands:
             eid = int(ev.get("id", 0))
-            text = ev.get("content") or ""
-            v = embedder.embed(text)
-            s = cosine(q, v)
-            scored.append((eid, s))
+            scored.append((eid, stored[eid]))
     # Sort by score desc, tiebreak by id asc
     scored.sort(key=lambda t: (-t[1], t[0]))
     top = scored[:limit]
@@ -246,9 +302,24 @@ def build_index(events: List[Dict], *, model: str, dims: int) -> Dict[int, List[
 
 
 def ensure_embedding_for_event(
-    *, events: List[Dict], eventlog, event_id: int, text: str, model: str, dims: int
+    *,
+    events: List[Dict],
+    eventlog,
+    event_id: int,
+    text: str,
+    model: str,
+    dims: int,
+    store=None,
 ) -> None:
-    """Append embedding_add if missing for (event_id, model, dims)."""
+    """Append embedding_add if missing for (event_id, model, dims).
+
+    With an ``EmbeddingStore`` the existence check is a lookup against the
+    ledger-wide store; otherwise only ``events`` is scanned.
+    """
+    if store is not None:
+        if store.has(event_id, model=model, dims=dims):
+            return
+        events = []
     # Check existing
     for ev in events[::-1]:  # scan from end
         if ev.get("kind") != "embedding_add":
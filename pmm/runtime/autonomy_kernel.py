@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 import math
 
@@ -14,6 +14,7 @@ from pmm.core.event_log import (
     PostCommitProjectionError,
     VECTOR_OVERLAP_DIAGNOSTIC_PROTOCOL,
     VECTOR_OVERLAP_DIAGNOSTIC_SOURCE,
+    open_cursor,
 )
 from pmm.core.writer_session import WriterOwnershipError
 from pmm.core.mirror import Mirror
@@ -23,20 +24,20 @@ from pmm.core.concept_graph import ConceptGraph
 from pmm.core.concept_metrics import check_concept_health
 from pmm.core.concept_schemas import create_concept_bind_event_payload
 from pmm.core.binding_attribution import binding_attribution_meta
+from pmm.runtime.kernel_state import KernelLedgerState
 from pmm.runtime.reflection_synthesizer import synthesize_kernel_reflection
-from pmm.core.commitment_outcome import is_governed_commitment_reflection_protocol
 from pmm.context.context_graph import ContextGraph
 from pmm.stability.stability_monitor import (
     calculate_stability_metrics,
     build_stability_metrics_event_content,
 )
-from pmm.coherence.claim_parser import extract_all_claims
+from pmm.coherence.claim_parser import ClaimTracker
 from pmm.coherence.fragmentation_detector import detect_fragmentation
 from pmm.coherence.coherence_scorer import (
     calculate_coherence_score,
     build_coherence_check_content,
 )
-from pmm.learning.outcome_tracker import extract_outcome_observations
+from pmm.learning.outcome_tracker import OutcomeTracker
 from pmm.learning.learning_metrics import aggregate_outcomes
 from pmm.learning.policy_evolver import (
     suggest_policy_changes,
@@ -50,20 +51,6 @@ from pmm.meta_learning.optimization_engine import (
 )
 
 
-def _last_event(events: List[Dict], kind: str) -> Optional[Dict]:
-    for event in reversed(events):
-        if event.get("kind") == kind:
-            return event
-    return None
-
-
-def _events_after(events: List[Dict], anchor: Optional[Dict]) -> List[Dict]:
-    if anchor is None:
-        return events
-    anchor_id = anchor.get("id", 0)
-    return [event for event in events if event.get("id", 0) > anchor_id]
-
-
 def _last_event_matching(
     events: List[Dict], kind: str, predicate: Callable[[Dict], bool]
 ) -> Optional[Dict]:
@@ -73,6 +60,25 @@ def _last_event_matching(
     return None
 
 
+def _unclosed_opens(events: List[Dict]) -> List[Tuple[Dict, int]]:
+    """Return ``(open_event, events_after)`` for opens with no later close.
+
+    ``events`` must be ordered by id. A single reverse pass remembers which
+    cids are closed later in the window.
+    """
+    found: List[Tuple[Dict, int]] = []
+    closed_later: set = set()
+    for position in range(len(events) - 1, -1, -1):
+        event = events[position]
+        cid = event.get("meta", {}).get("cid")
+        if event["kind"] == "commitment_close":
+            closed_later.add(cid)
+        elif event["kind"] == "commitment_open" and cid not in closed_later:
+            found.append((event, len(events) - 1 - position))
+    found.reverse()
+    return found
+
+
 @dataclass(frozen=True)
 class KernelDecision:
     decision: str
@@ -100,6 +106,18 @@ class AutonomyKernel:
         self, eventlog: EventLog, thresholds: Optional[Dict[str, int]] = None
     ) -> None:
         self.eventlog = eventlog
+        # Each tick decodes only the rows appended since the previous read and
+        # folds them into the counters and pointers that tick-time checks
+        # consult; decoded events are not retained.
+        self._ledger_cursor = open_cursor(eventlog, "autonomy.kernel")
+        self._state = KernelLedgerState(
+            goals=(self.INTERNAL_GOAL_MONITOR_RSM, self.INTERNAL_GOAL_ANALYZE_GAPS)
+        )
+        # Commitment threads for stall detection, folded on demand.
+        self._meme_graph = MemeGraph(eventlog)
+        self._meme_cursor = open_cursor(eventlog, "autonomy.kernel.meme_graph")
+        self._claim_tracker = ClaimTracker(eventlog)
+        self._outcome_tracker = OutcomeTracker(eventlog)
         defaults = {
             "reflection_interval": 10,
             "summary_interval": 50,
@@ -165,20 +183,14 @@ class AutonomyKernel:
         self._load_stability_config()
         self._load_coherence_config()
 
+    def _sync_state(self) -> KernelLedgerState:
+        """Fold unapplied events into the tick state."""
+        self._ledger_cursor.fold(self._state.observe)
+        return self._state
+
     def _init_ticks_counter(self) -> int:
         """Reconstruct ticks since last index decision from ledger."""
-        events = self.eventlog.read_all()
-        ticks = 0
-        for e in reversed(events):
-            if e.get("kind") == "autonomy_tick":
-                try:
-                    content = json.loads(e.get("content") or "{}")
-                    if content.get("decision") == "index":
-                        return ticks
-                except (json.JSONDecodeError, TypeError):
-                    pass
-                ticks += 1
-        return ticks
+        return self._sync_state().ticks_since_index
 
     def _should_index(self, events: List[Dict[str, Any]]) -> bool:
         """Check if we should run the background indexer."""
@@ -220,7 +232,7 @@ class AutonomyKernel:
             "}"
         )
         # Append only if not present with identical content
-        recent = self.eventlog.read_all()[-50:]
+        recent = self.eventlog.read_tail(limit=50)
         existing = [e for e in recent if e.get("kind") == "autonomy_rule_table"]
         if not existing or existing[-1].get("content") != content:
             self.eventlog.append(
@@ -229,17 +241,32 @@ class AutonomyKernel:
                 meta={"source": "autonomy_kernel"},
             )
 
+    def _latest_config(self, config_type: str) -> Optional[Dict[str, Any]]:
+        """Latest ``config`` content of ``config_type``, via the config_type index."""
+        read_by_index = getattr(self.eventlog, "read_by_index", None)
+        if callable(read_by_index):
+            candidates = read_by_index(
+                "config_type", config_type, limit=1, reverse=True
+            )
+        else:
+            candidates = [
+                e
+                for e in reversed(self.eventlog.read_all())
+                if e.get("kind") == "config"
+            ]
+        for e in candidates:
+            try:
+                data = json.loads(e.get("content") or "{}")
+            except Exception:
+                continue
+            if isinstance(data, dict) and data.get("type") == config_type:
+                return data
+        return None
+
     def _ensure_policy_event(self) -> None:
         # Only one policy event
-        events = self.eventlog.read_all()
-        for e in reversed(events):
-            if e.get("kind") == "config":
-                try:
-                    data = json.loads(e.get("content") or "{}")
-                except Exception:
-                    continue
-                if isinstance(data, dict) and data.get("type") == "policy":
-                    return
+        if self._latest_config("policy") is not None:
+            return
         policy = {
             "type": "policy",
             "forbid_sources": {
@@ -258,16 +285,8 @@ class AutonomyKernel:
         )
 
     def _ensure_retrieval_config(self) -> None:
-        events = self.eventlog.read_all()
-        for e in reversed(events):
-            if e.get("kind") != "config":
-                continue
-            try:
-                data = json.loads(e.get("content") or "{}")
-            except Exception:
-                continue
-            if isinstance(data, dict) and data.get("type") == "retrieval":
-                return
+        if self._latest_config("retrieval") is not None:
+            return
         cfg = {
             "type": "retrieval",
             "strategy": "vector",
@@ -283,20 +302,7 @@ class AutonomyKernel:
         )
 
     def _last_autonomy_thresholds_config(self) -> Optional[Dict[str, int]]:
-        cfg = None
-        try:
-            for e in self.eventlog.read_all():
-                if e.get("kind") != "config":
-                    continue
-                raw = e.get("content") or "{}"
-                data = json.loads(raw)
-                if isinstance(data, dict) and data.get("type") == "autonomy_thresholds":
-                    cfg = data
-        except Exception:
-            return None
-        if isinstance(cfg, dict):
-            return cfg
-        return None
+        return self._latest_config("autonomy_thresholds")
 
     def _on_config_event(self, event: Dict[str, Any]) -> None:
         if not event or event.get("kind") != "config":
@@ -553,50 +559,29 @@ class AutonomyKernel:
 
     def _current_coherence_view(self) -> tuple[List, List, float]:
         """Compute current coherence view (read-only)."""
-        claims = extract_all_claims(self.eventlog)
+        claims = self._claim_tracker.claims()
         conflicts = detect_fragmentation(claims)
         score = calculate_coherence_score(claims, conflicts)
         return claims, conflicts, score
 
     def _load_stability_config(self) -> None:
         """Load stability config from ledger (no-op if none)."""
-        events = self.eventlog.read_all()
-        for e in reversed(events):
-            if e.get("kind") == "config":
-                try:
-                    data = json.loads(e.get("content") or "{}")
-                    if (
-                        isinstance(data, dict)
-                        and data.get("type") == "stability_monitor"
-                    ):
-                        # Update self._stability_window if present
-                        if (
-                            "window" in data
-                            and isinstance(data["window"], int)
-                            and data["window"] > 0
-                        ):
-                            self._stability_window = data["window"]
-                        break
-                except Exception:
-                    continue
+        data = self._latest_config("stability_monitor")
+        # Update self._stability_window if present
+        if (
+            data
+            and "window" in data
+            and isinstance(data["window"], int)
+            and data["window"] > 0
+        ):
+            self._stability_window = data["window"]
 
     def _load_coherence_config(self) -> None:
         """Load coherence config from ledger (no-op if none)."""
-        events = self.eventlog.read_all()
-        for e in reversed(events):
-            if e.get("kind") == "config":
-                try:
-                    data = json.loads(e.get("content") or "{}")
-                    if (
-                        isinstance(data, dict)
-                        and data.get("type") == "coherence_monitor"
-                    ):
-                        # Update self._coherence_enabled if present
-                        if "enabled" in data and isinstance(data["enabled"], bool):
-                            self._coherence_enabled = data["enabled"]
-                        break
-                except Exception:
-                    continue
+        data = self._latest_config("coherence_monitor")
+        # Update self._coherence_enabled if present
+        if data and "enabled" in data and isinstance(data["enabled"], bool):
+            self._coherence_enabled = data["enabled"]
 
     def reflect(self, eventlog, meta_extra, staleness_threshold, auto_close_threshold):
         # Idempotent REF handling and deterministic reflection synthesis
@@ -629,7 +614,17 @@ class AutonomyKernel:
         }
 
         current_tick_id: Optional[int] = None
-        if slot_id:
+        read_by_index = getattr(eventlog, "read_by_index", None)
+        if slot_id and callable(read_by_index):
+            ticks = read_by_index(
+                "autonomy_slot_id",
+                slot_id,
+                kind="autonomy_tick",
+                limit=1,
+                reverse=True,
+            )
+            current_tick_id = ticks[0]["id"] if ticks else None
+        elif slot_id:
             for event in reversed(raw_events):
                 if (
                     event.get("kind") == "autonomy_tick"
@@ -645,17 +640,9 @@ class AutonomyKernel:
         events = [e for e in events if e.get("kind") != "autonomy_stimulus"]
 
         # Compute open commitments canonically via cid
-        open_commitments = [
-            e
-            for e in events
-            if e["kind"] == "commitment_open"
-            and not any(
-                c["kind"] == "commitment_close"
-                and c.get("meta", {}).get("cid") == e.get("meta", {}).get("cid")
-                for c in events
-                if c["id"] > e["id"]
-            )
-        ]
+        unclosed = _unclosed_opens(events)
+        open_commitments = [e for e, _ in unclosed]
+        events_after = {e["id"]: count for e, count in unclosed}
         # Auto-close stale commitments only under threshold policy
         # Enforce auto-close when there is at least one open commitment
         if auto_close_threshold is not None and open_commitments:
@@ -665,7 +652,7 @@ class AutonomyKernel:
                     continue
                 if hasattr(eventlog, "has_exec_bind") and eventlog.has_exec_bind(cid):
                     continue
-                events_since_open = sum(1 for e in events if e["id"] > c["id"])
+                events_since_open = events_after[c["id"]]
                 if events_since_open > auto_close_threshold:
                     CommitmentManager(eventlog).close_commitment(
                         cid,
@@ -733,34 +720,32 @@ class AutonomyKernel:
     # Maintenance tasks executed during idle/reflect decisions
     def _maintain_embeddings(self) -> None:
         # Ensure embeddings coverage >=95% for vector strategy
-        events = self.eventlog.read_all()
-        cfg = None
-        for e in reversed(events):
-            if e.get("kind") == "config":
-                try:
-                    d = json.loads(e.get("content") or "{}")
-                except Exception:
-                    continue
-                if isinstance(d, dict) and d.get("type") == "retrieval":
-                    cfg = d
-                    break
+        state = self._sync_state()
+        cfg = self._latest_config("retrieval")
         if not cfg or cfg.get("strategy") != "vector":
             return
         model = str(cfg.get("model", "hash64"))
         dims = int(cfg.get("dims", 64))
-        from pmm.runtime.cli import _message_events, _embedding_map  # reuse helpers
-
-        msgs = _message_events(events)
-        embs = _embedding_map(events, model=model, dims=dims)
-        coverage = len(embs) / max(1, len(msgs))
+        msg_ids = state.message_ids
+        embedded = state.embedded_ids(model, dims)
+        coverage = len(embedded) / max(1, len(msg_ids))
         if coverage >= 0.95:
             return
         # Backfill last 50 missing
         from pmm.retrieval.vector import build_embedding_content
 
-        missing = [m for m in msgs if int(m.get("id", 0)) not in embs]
-        for m in missing[-50:]:
-            eid = int(m.get("id", 0))
+        missing_ids: List[int] = []
+        for eid in reversed(msg_ids):
+            if eid not in embedded:
+                missing_ids.append(eid)
+                if len(missing_ids) == 50:
+                    break
+        missing_ids.reverse()
+        fetched = self.eventlog.get_many(missing_ids)
+        for eid in missing_ids:
+            m = fetched.get(eid)
+            if m is None:
+                continue
             payload = build_embedding_content(
                 event_id=eid, text=m.get("content") or "", model=model, dims=dims
             )
@@ -770,21 +755,10 @@ class AutonomyKernel:
                 meta={"source": "autonomy_kernel"},
             )
 
-    def _latest_retrieval_embedding_params(
-        self, events: List[Dict[str, Any]]
-    ) -> tuple[str, int]:
+    def _latest_retrieval_embedding_params(self) -> tuple[str, int]:
         """Phase 2 parameter source: latest retrieval config, else defaults."""
 
-        cfg = None
-        for e in reversed(events):
-            if e.get("kind") == "config":
-                try:
-                    d = json.loads(e.get("content") or "{}")
-                except Exception:
-                    continue
-                if isinstance(d, dict) and d.get("type") == "retrieval":
-                    cfg = d
-                    break
+        cfg = self._latest_config("retrieval")
         model = str((cfg or {}).get("model", "hash64"))
         try:
             dims = int((cfg or {}).get("dims", 64))
@@ -955,9 +929,9 @@ class AutonomyKernel:
         else:
             embedder = DeterministicEmbedder(model=model, dims=dims)
             qv = embedder.embed(query)
-            for ev in cands:
+            vectors = embedder.embed_many(ev.get("content") or "" for ev in cands)
+            for ev, vec in zip(cands, vectors):
                 eid = int(ev.get("id", 0))
-                vec = embedder.embed(ev.get("content") or "")
                 sscore = cosine(qv, vec)
                 scored.append((eid, sscore))
 
@@ -1023,6 +997,27 @@ class AutonomyKernel:
         }
         return json.dumps(content_obj, sort_keys=True, separators=(",", ":")), meta
 
+    def _overlap_evidence(
+        self, state: KernelLedgerState, selection: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Messages the overlap evaluator reads for ``selection``, in id order.
+
+        That is its query (the last user message before the turn) and its
+        candidate window (the last 100 messages before the turn).
+        """
+        try:
+            turn_id = json.loads(selection.get("content") or "{}").get("turn_id")
+        except Exception:
+            return []
+        if type(turn_id) is not int:
+            return []
+        ids = set(state.message_ids_before(turn_id, 100))
+        query_id = state.last_user_message_before(turn_id)
+        if query_id is not None:
+            ids.add(query_id)
+        fetched = self.eventlog.get_many(ids)
+        return [fetched[eid] for eid in sorted(fetched)]
+
     def _verify_recent_selections(self, N: int = 5) -> None:
         """R17 Phase 3: at-most-once per eligible v2 selection (batch size N)."""
 
@@ -1033,15 +1028,15 @@ class AutonomyKernel:
         if not candidates:
             return
 
-        events = self.eventlog.read_all()
-        model, dims = self._latest_retrieval_embedding_params(events)
+        state = self._sync_state()
+        model, dims = self._latest_retrieval_embedding_params()
 
         for selection in candidates:
             selection_id = int(selection["id"])
             try:
                 evaluation = self.evaluate_vector_overlap_for_selection(
                     selection,
-                    events,
+                    self._overlap_evidence(state, selection),
                     model=model,
                     dims=dims,
                 )
@@ -1064,23 +1059,13 @@ class AutonomyKernel:
             self.eventlog.append_vector_overlap_diagnostic(content=content, meta=meta)
 
     def _maybe_append_checkpoint(self, M: int = 50) -> None:
-        events = self.eventlog.read_all()
-        last_manifest = None
-        last_manifest_id = 0
-        for e in reversed(events):
-            if e.get("kind") == "checkpoint_manifest":
-                last_manifest = e
-                last_manifest_id = int(e.get("id", 0))
-                break
-        last_summary = None
-        for e in reversed(events):
-            if e.get("kind") == "summary_update":
-                last_summary = e
-                break
+        state = self._sync_state()
+        last_manifest = state.last("checkpoint_manifest")
+        last_summary = state.last("summary_update")
         if not last_summary:
             return
         up_to = int(last_summary.get("id", 0))
-        since = len([e for e in events if int(e.get("id", 0)) > last_manifest_id])
+        since = state.event_count - state.ordinal("checkpoint_manifest")
         # Check rsm_triggered (support new JSON content and legacy string format)
         triggered = False
         raw_content = last_summary.get("content") or "{}"
@@ -1097,27 +1082,25 @@ class AutonomyKernel:
             if "rsm_triggered:1" in parsed:
                 triggered = True
         if since >= M or triggered:
-            hashes = [
-                e.get("hash") or "" for e in events if int(e.get("id", 0)) <= up_to
-            ]
-            import hashlib as _hl
-
-            root = _hl.sha256(
-                json.dumps(hashes, separators=(",", ":")).encode("utf-8")
-            ).hexdigest()
+            checkpoint = self.eventlog.merkle_checkpoint(up_to)
             # Idempotent
             if last_manifest:
                 try:
                     m = json.loads(last_manifest.get("content") or "{}")
                 except Exception:
                     m = {}
-                if int(m.get("up_to_id", 0)) == up_to and m.get("root_hash") == root:
+                if (
+                    int(m.get("up_to_id", 0)) == up_to
+                    and m.get("root_hash") == checkpoint["root_hash"]
+                ):
                     return
             content = json.dumps(
                 {
                     "up_to_id": up_to,
                     "covers": ["rsm_state", "open_commitments"],
-                    "root_hash": root,
+                    "root_hash": checkpoint["root_hash"],
+                    "root_scheme": checkpoint["root_scheme"],
+                    "leaf_count": checkpoint["leaf_count"],
                 },
                 sort_keys=True,
                 separators=(",", ":"),
@@ -1130,12 +1113,7 @@ class AutonomyKernel:
 
     def _maybe_tune_thresholds(self) -> None:
         # Minimal bounded auto-tuning based on autonomy_metrics last snapshot
-        events = self.eventlog.read_all()
-        last = None
-        for e in reversed(events):
-            if e.get("kind") == "autonomy_metrics":
-                last = e
-                break
+        last = self._sync_state().last("autonomy_metrics")
         if not last:
             return
         # Simple heuristic: if idle_count dominates and reflect_count low, decrease reflection_interval
@@ -1155,17 +1133,11 @@ class AutonomyKernel:
         Deterministic and idempotent: compares against the last autonomy_metrics
         content; also gates by ticks_total delta >= 10 to reduce noise.
         """
-        events = self.eventlog.read_all()
-        ticks = [e for e in events if e.get("kind") == "autonomy_tick"]
-        ticks_total = len(ticks)
+        state = self._sync_state()
+        ticks_total = state.count("autonomy_tick")
         if ticks_total == 0:
             return
-        # Find last autonomy_metrics
-        last_metrics = None
-        for e in reversed(events):
-            if e.get("kind") == "autonomy_metrics":
-                last_metrics = e
-                break
+        last_metrics = state.last("autonomy_metrics")
         last_ticks = 0
         if last_metrics:
             try:
@@ -1179,44 +1151,14 @@ class AutonomyKernel:
         if last_metrics is not None and last_ticks == ticks_total:
             return
 
-        # Compute counts
-        idle_count = 0
-        reflect_count = 0
-        summarize_count = 0
-        intention_summarize_count = 0
-        last_reflection_id = 0
-        for e in events:
-            k = e.get("kind")
-            if k == "autonomy_tick":
-                try:
-                    data = json.loads(e.get("content") or "{}")
-                except Exception:
-                    data = {}
-                if (data or {}).get("decision") == "idle":
-                    idle_count += 1
-            elif k == "reflection" and not is_governed_commitment_reflection_protocol(
-                e
-            ):
-                reflect_count += 1
-                last_reflection_id = int(e.get("id", 0))
-                # Count reflections that use the {intent,...} shape
-                try:
-                    r = json.loads(e.get("content") or "{}")
-                except Exception:
-                    r = {}
-                if isinstance(r, dict) and "intent" in r:
-                    intention_summarize_count += 1
-            elif k == "summary_update":
-                summarize_count += 1
-
         open_commitments = len(self.mirror.get_open_commitment_events())
         payload = {
-            "idle_count": int(idle_count),
-            "reflect_count": int(reflect_count),
-            "summarize_count": int(summarize_count),
-            "intention_summarize_count": int(intention_summarize_count),
+            "idle_count": int(state.idle_ticks),
+            "reflect_count": int(state.reflect_count),
+            "summarize_count": int(state.count("summary_update")),
+            "intention_summarize_count": int(state.intention_reflect_count),
             "ticks_total": int(ticks_total),
-            "last_reflection_id": int(last_reflection_id),
+            "last_reflection_id": int(state.last_reflection_id),
             "open_commitments": int(open_commitments),
         }
         content = json.dumps(payload, sort_keys=True, separators=(",", ":"))
@@ -1235,13 +1177,8 @@ class AutonomyKernel:
         content = build_stability_metrics_event_content(metrics)
         content_str = json.dumps(content, sort_keys=True, separators=(",", ":"))
 
-        # Find last stability_metrics
-        events = self.eventlog.read_all()[-200:]  # Bounded scan
-        last_stability = None
-        for e in reversed(events):
-            if e.get("kind") == "stability_metrics":
-                last_stability = e
-                break
+        # Find last stability_metrics among the most recent 200 events
+        last_stability = self._sync_state().last_within("stability_metrics", 200)
 
         # Idempotent: skip if identical
         if last_stability and (last_stability.get("content") or "") == content_str:
@@ -1258,18 +1195,13 @@ class AutonomyKernel:
         if not self._coherence_enabled:
             return
 
-        claims = extract_all_claims(self.eventlog)
+        claims = self._claim_tracker.claims()
         conflicts = detect_fragmentation(claims)
         content = build_coherence_check_content(claims, conflicts)
         content_str = json.dumps(content, sort_keys=True, separators=(",", ":"))
 
-        # Find last coherence_check
-        events = self.eventlog.read_all()[-200:]  # Bounded scan
-        last_coherence = None
-        for e in reversed(events):
-            if e.get("kind") == "coherence_check":
-                last_coherence = e
-                break
+        # Find last coherence_check among the most recent 200 events
+        last_coherence = self._sync_state().last_within("coherence_check", 200)
 
         # Idempotent: skip if identical
         if last_coherence and (last_coherence.get("content") or "") == content_str:
@@ -1297,13 +1229,8 @@ class AutonomyKernel:
         content = build_meta_policy_update_content(suggestions)
         content_str = json.dumps(content, sort_keys=True, separators=(",", ":"))
 
-        # Find last meta_policy_update
-        events = self.eventlog.read_all()[-200:]  # Bounded scan
-        last_meta = None
-        for e in reversed(events):
-            if e.get("kind") == "meta_policy_update":
-                last_meta = e
-                break
+        # Find last meta_policy_update among the most recent 200 events
+        last_meta = self._sync_state().last_within("meta_policy_update", 200)
 
         # Idempotent: skip if identical
         if last_meta and (last_meta.get("content") or "") == content_str:
@@ -1317,7 +1244,7 @@ class AutonomyKernel:
 
     def _maybe_emit_policy_update(self) -> None:
         """Emit policy_update when suggestions change."""
-        observations = extract_outcome_observations(self.eventlog)
+        observations = self._outcome_tracker.observations()
         stats = aggregate_outcomes(observations)
         suggestions = suggest_policy_changes(stats)
 
@@ -1329,13 +1256,8 @@ class AutonomyKernel:
         content = build_policy_update_content(suggestions)
         content_str = json.dumps(content, sort_keys=True, separators=(",", ":"))
 
-        # Find last policy_update
-        events = self.eventlog.read_all()[-200:]  # Bounded scan
-        last_policy = None
-        for e in reversed(events):
-            if e.get("kind") == "policy_update":
-                last_policy = e
-                break
+        # Find last policy_update among the most recent 200 events
+        last_policy = self._sync_state().last_within("policy_update", 200)
 
         # Idempotent: skip if identical
         if last_policy and (last_policy.get("content") or "") == content_str:
@@ -1349,11 +1271,18 @@ class AutonomyKernel:
 
     def decide_next_action(self) -> KernelDecision:
         """Decide the next autonomous action based on ledger state."""
-        events = self.eventlog.read_all()
-        if not events:
+        state = self._sync_state()
+        if not state.event_count:
             return KernelDecision("idle", "no events recorded", [])
 
-        last_event_id = events[-1]["id"]
+        # Facts as of the start of this decision; goal execution below may
+        # append events that must not influence this tick's thresholds.
+        event_count = state.event_count
+        last_event_id = state.last_event_id
+        last_metrics = state.last("metrics_turn")
+        last_autonomy_reflection = state.last_autonomy_reflection
+        summary_ordinal = state.ordinal("summary_update")
+        self._meme_cursor.fold(self._meme_graph.add_event)
         gaps = self.mirror.rsm_knowledge_gaps()
 
         # 1. OPEN GOAL IF NEEDED
@@ -1371,7 +1300,7 @@ class AutonomyKernel:
 
         # 5. Background Indexing: Fill coverage gaps
         # Check this BEFORE other idle tasks but AFTER urgent goals
-        if self._should_index(self.eventlog.read_all()):
+        if self._should_index(self._sync_state().recent(50)):
             # Reset counter effectively by the act of indexing (handled in _init_ticks_counter on reload)
             # We don't manually reset self.ticks_since_last_index here because
             # the next _init_ticks_counter() or explicit increment in the loop will handle it?
@@ -1391,20 +1320,16 @@ class AutonomyKernel:
         self.execute_internal_goal(self.INTERNAL_GOAL_ANALYZE_GAPS)
         self.execute_internal_goal(self.INTERNAL_GOAL_MONITOR_RSM)
 
-        last_metrics = _last_event(events, "metrics_turn")
         if not last_metrics:
             return KernelDecision("idle", "no metrics_turn recorded yet", [])
 
         # Concept Token Layer (CTL) health derived deterministically from ledger.
         # This read is side-effect free and only influences decisions when CTL
         # is actually in use (i.e., when concepts exist).
-        ctl_health = check_concept_health(self.eventlog)
-
-        last_autonomy_reflection = _last_event_matching(
-            events,
-            "reflection",
-            lambda e: e.get("meta", {}).get("source") == "autonomy_kernel",
+        ctl_health = check_concept_health(
+            self.eventlog, concept_graph=self.concept_graph
         )
+
         if last_autonomy_reflection is None:
             return KernelDecision(
                 decision="reflect",
@@ -1412,23 +1337,19 @@ class AutonomyKernel:
                 evidence=[last_event_id],
             )
 
-        events_since_autonomy = _events_after(events, last_autonomy_reflection)
+        events_since_autonomy = event_count - last_autonomy_reflection[0]
 
-        if len(events_since_autonomy) >= self.thresholds["reflection_interval"]:
+        if events_since_autonomy >= self.thresholds["reflection_interval"]:
             return KernelDecision(
                 decision="reflect",
-                reasoning=f"reflection_interval reached ({len(events_since_autonomy)})",
+                reasoning=f"reflection_interval reached ({events_since_autonomy})",
                 evidence=[last_event_id],
             )
 
-        last_summary = _last_event(events, "summary_update")
-        events_since_summary = _events_after(events, last_summary)
-        autonomy_reflections_since_summary = [
-            event
-            for event in events_since_summary
-            if event.get("kind") == "reflection"
-            and event.get("meta", {}).get("source") == "autonomy_kernel"
-        ]
+        events_since_summary = event_count - summary_ordinal
+        autonomy_reflection_since_summary = (
+            last_autonomy_reflection[0] > summary_ordinal
+        )
 
         # Autonomous maintenance on each decision cycle (side-effect free
         # with respect to decision semantics; metrics/telemetry emission is
@@ -1439,17 +1360,17 @@ class AutonomyKernel:
         self._maybe_tune_thresholds()
 
         if (
-            autonomy_reflections_since_summary
-            and len(events_since_summary) >= self.thresholds["summary_interval"]
+            autonomy_reflection_since_summary
+            and events_since_summary >= self.thresholds["summary_interval"]
         ):
             return KernelDecision(
                 decision="summarize",
-                reasoning=f"summary_interval reached ({len(events_since_summary)})",
+                reasoning=f"summary_interval reached ({events_since_summary})",
                 evidence=[last_event_id],
             )
 
         # 3. Graph-aware attention: stalled commitments
-        stalled = self._stalled_commitments(events)
+        stalled = self._stalled_commitments(last_event_id)
         if stalled:
             threshold = int(self.thresholds.get("commitment_staleness", 0))
             primary = stalled[0]
@@ -1503,18 +1424,18 @@ class AutonomyKernel:
         ):
             return None
 
-        events = self.eventlog.read_all()
-        if not events:
+        ledger = self._sync_state()
+        if not ledger.event_count:
             return None
 
-        open_goal = self._find_open_internal_goal(goal, events)
+        open_goal = ledger.open_goal(goal)
         if not open_goal:
             return None
 
-        current_event_id = events[-1]["id"]
+        current_event_id = ledger.last_event_id
         state = self._goal_state.setdefault(
             goal,
-            {"last_check_id": self._initial_goal_anchor(goal, open_goal, events)},
+            {"last_check_id": self._initial_goal_anchor(goal, open_goal)},
         )
         last_check_id = state["last_check_id"]
 
@@ -1525,7 +1446,9 @@ class AutonomyKernel:
             if current_event_id - last_check_id < self.RSM_EVENT_INTERVAL:
                 return None
 
-            mirror = Mirror(self.eventlog, enable_rsm=True, listen=False)
+            mirror = Mirror(
+                self.eventlog, enable_rsm=True, listen=False, auto_rebuild=False
+            )
             diff = mirror.diff_rsm(last_check_id, current_event_id)
 
             if not self._is_significant_rsm_change(diff):
@@ -1573,44 +1496,14 @@ class AutonomyKernel:
             return True
         return False
 
-    def _find_open_internal_goal(
-        self, goal: str, events: List[Dict[str, object]]
-    ) -> Optional[Dict[str, object]]:
-        open_event: Optional[Dict[str, object]] = None
-        for event in events:
-            if (
-                event.get("kind") == "commitment_open"
-                and event.get("meta", {}).get("goal") == goal
-            ):
-                open_event = event
-            elif (
-                open_event
-                and event.get("kind") == "commitment_close"
-                and event.get("meta", {}).get("cid")
-                == open_event.get("meta", {}).get("cid")
-            ):
-                open_event = None
-        return open_event
-
-    def _initial_goal_anchor(
-        self,
-        goal: str,
-        open_goal: Dict[str, object],
-        events: List[Dict[str, object]],
-    ) -> int:
+    def _initial_goal_anchor(self, goal: str, open_goal: Dict[str, object]) -> int:
         if goal == self.INTERNAL_GOAL_MONITOR_RSM:
-            summary_id = self._last_summary_event_id(events)
-            if summary_id is not None:
-                return summary_id
+            summary = self._state.last("summary_update")
+            if summary is not None:
+                return int(summary["id"])
             return int(open_goal.get("id", 0))
         return 0
 
-    def _last_summary_event_id(self, events: List[Dict[str, object]]) -> Optional[int]:
-        for event in reversed(events):
-            if event.get("kind") == "summary_update":
-                return int(event["id"])
-        return None
-
     def _append_rsm_reflection(
         self, diff: Dict[str, object], start_id: int, end_id: int
     ) -> int:
@@ -1648,26 +1541,24 @@ class AutonomyKernel:
             reason="rsm_stable",
         )
 
-    def _stalled_commitments(
-        self, events: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    def _stalled_commitments(self, last_id: int) -> List[Dict[str, Any]]:
         """Return info on open commitments whose threads appear stalled.
 
         Staleness is measured as the difference between the last ledger event id
         and the last event id in the commitment thread, using the configured
         `commitment_staleness` threshold. Only non-internal commitments are
         considered here; internal autonomy_kernel goals are handled separately.
+        Threads come from the kernel's MemeGraph, folded up to ``last_id`` at
+        the start of the decision.
         """
-        if not events:
+        if not last_id:
             return []
 
         open_events = self.commitment_manager.get_open_commitments()
         if not open_events:
             return []
 
-        mg = MemeGraph(self.eventlog)
-        mg.rebuild(events)
-        last_id = int(events[-1].get("id", 0))
+        mg = self._meme_graph
         try:
             threshold = int(self.thresholds.get("commitment_staleness", 0))
         except Exception:
@@ -7,9 +7,9 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-from pmm.core.event_log import EventLog
+from pmm.core.event_log import EventLog, open_cursor
 from pmm.runtime.executors import IdleMonitorExecutor
 
 
@@ -19,12 +19,12 @@ class ExecBindRouter:
     def __init__(self, eventlog: EventLog) -> None:
         self.eventlog = eventlog
         self.executors: Dict[str, IdleMonitorExecutor] = {}
+        self._cursor = open_cursor(eventlog, "runtime.exec_binds")
         self.eventlog.register_listener(self._on_event)
         self._load_active_binds()
 
     def _load_active_binds(self) -> None:
-        for exec_type, cid, params in self._iter_exec_binds(self.eventlog.read_all()):
-            self._ensure_executor(exec_type, cid, params)
+        self._cursor.fold(self._on_event)
 
     def tick(self) -> None:
         for executor in self.executors.values():
@@ -46,14 +46,6 @@ class ExecBindRouter:
         if cid not in self.executors:
             self.executors[cid] = IdleMonitorExecutor(self.eventlog, cid, params)
 
-    def _iter_exec_binds(
-        self, events: Iterable[Dict]
-    ) -> Iterable[Tuple[str, Optional[str], Dict[str, object]]]:
-        for event in events:
-            parsed = self._parse_exec_bind(event)
-            if parsed:
-                yield parsed
-
     def _parse_exec_bind(
         self, event: Dict
     ) -> Optional[Tuple[str, Optional[str], Dict[str, object]]]:
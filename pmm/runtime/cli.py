@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
 import subprocess
 from typing import Dict, Optional
@@ -615,7 +616,7 @@ def handle_rsm_command(command: str, eventlog: EventLog) -> Optional[str]:
             event_id = int(args[0])
             if event_id < 0:
                 return "Event ids must be non-negative integers."
-            historical = mirror._rebuild_up_to(event_id).rsm_snapshot()
+            historical = mirror.rsm_snapshot_at(event_id)
             return _format_snapshot(historical, event_id, current=False)
         if len(args) == 3 and args[0].lower() == "diff":
             start = int(args[1])
@@ -749,6 +750,12 @@ def handle_pm_command(command: str, eventlog: EventLog) -> Optional[str]:
                 return "Forbidden by policy."
         if rest == ["status"]:
             return _handle_retrieval_status(eventlog)
+        if rest[:1] == ["stages"]:
+            try:
+                n = int(rest[1]) if len(rest) >= 2 else 200
+            except ValueError:
+                return "Stages N must be an integer"
+            return _handle_retrieval_stages(eventlog, n)
         if len(rest) == 2 and rest[0] == "verify" and rest[1].isdigit():
             turn_id = int(rest[1])
             return _handle_retrieval_verify(eventlog, turn_id)
@@ -766,7 +773,7 @@ def handle_pm_command(command: str, eventlog: EventLog) -> Optional[str]:
             except Exception:
                 data = {}
             return f"retrieval_selection turn_id={data.get('turn_id')} selected={data.get('selected')} scores={data.get('scores')}"
-        return "Usage: /pm retrieval config fixed limit <N> | config vector … | last | index backfill <N> | status | verify <turn_id>"
+        return "Usage: /pm retrieval config fixed limit <N> | config vector … | last | index backfill <N> | status | stages [N] | verify <turn_id>"
     if topic == "config":
         # autonomy thresholds: key=value pairs
         if rest and rest[0].lower() == "autonomy":
@@ -892,6 +899,69 @@ def _handle_retrieval_backfill_owned(eventlog: EventLog, n: int) -> str:
     return f"Backfill appended: {appended}"
 
 
+def _handle_retrieval_stages(eventlog: EventLog, limit: int = 200) -> str:
+    """Aggregate per-stage retrieval cost over the last ``limit`` selections.
+
+    Wall time is reported only for turns recorded with stage timings enabled;
+    otherwise stages are ranked by their event reads plus embeddings.
+    """
+    totals: Dict[str, Dict[str, float]] = {}
+    walls: Dict[str, list] = {}
+    counts: Dict[str, int] = {}
+    turns = 0
+    for e in eventlog.read_by_kind(
+        "retrieval_selection", reverse=True, limit=max(1, int(limit))
+    ):
+        stages = (e.get("meta") or {}).get("stage_metrics")
+        if not isinstance(stages, dict) or not stages:
+            continue
+        turns += 1
+        for name, metrics in stages.items():
+            if not isinstance(metrics, dict):
+                continue
+            row = totals.setdefault(
+                name, {"eventlog_gets": 0, "events_embedded": 0, "candidates": 0}
+            )
+            for key in row:
+                row[key] += int(metrics.get(key) or 0)
+            counts[name] = counts.get(name, 0) + 1
+            if "wall_ms" in metrics:
+                walls.setdefault(name, []).append(float(metrics["wall_ms"] or 0.0))
+    if not turns:
+        return "No retrieval stage metrics recorded yet."
+
+    if walls:
+        lines = [f"retrieval stages over {turns} turns (slowest first)"]
+        ranked = sorted(totals, key=lambda name: (-sum(walls.get(name, [])), name))
+    else:
+        lines = [f"retrieval stages over {turns} turns (costliest first)"]
+        ranked = sorted(
+            totals,
+            key=lambda name: (
+                -(totals[name]["eventlog_gets"] + totals[name]["events_embedded"]),
+                name,
+            ),
+        )
+    for name in ranked:
+        count = counts[name]
+        row = totals[name]
+        timing = ""
+        samples = sorted(walls.get(name, []))
+        if samples:
+            p95 = samples[max(0, math.ceil(0.95 * len(samples)) - 1)]
+            timing = (
+                f"total_ms={sum(samples):.3f} "
+                f"mean_ms={sum(samples) / len(samples):.3f} p95_ms={p95:.3f} "
+            )
+        lines.append(
+            f"{name}: turns={count} {timing}"
+            f"gets={int(row['eventlog_gets'])} "
+            f"embedded={int(row['events_embedded'])} "
+            f"candidates_avg={row['candidates'] / count:.1f}"
+        )
+    return "\n".join(lines)
+
+
 def _handle_retrieval_status(eventlog: EventLog) -> str:
     cfg = _last_retrieval_config(eventlog) or {}
     model = str(cfg.get("model", "hash64"))
@@ -950,15 +1020,8 @@ def _handle_checkpoint(eventlog: EventLog) -> str:
     if not last_summary:
         return "No summary_update found to anchor checkpoint."
     up_to = int(last_summary.get("id", 0))
-    events = eventlog.read_up_to(up_to)
-    if up_to > 100000:
-        return "Checkpoint creation blocked: ledger too large for unbounded hash. Use segmented checkpoints."
-    # Compute root hash over hash sequence up to anchor
-    hashes = [e.get("hash") or "" for e in events if int(e.get("id", 0)) <= up_to]
-    root_blob = json.dumps(hashes, separators=(",", ":"))
-    import hashlib as _hl
-
-    digest = _hl.sha256(root_blob.encode("utf-8")).hexdigest()
+    # Merkle root over the hash chain up to the anchor: O(log N) node reads
+    checkpoint = eventlog.merkle_checkpoint(up_to)
     # Idempotent: check last manifest
     last_manifest = next(
         iter(eventlog.read_by_kind("checkpoint_manifest", reverse=True, limit=1)),
@@ -969,13 +1032,18 @@ def _handle_checkpoint(eventlog: EventLog) -> str:
             data = json.loads(last_manifest.get("content") or "{}")
         except Exception:
             data = {}
-        if int(data.get("up_to_id", 0)) == up_to and data.get("root_hash") == digest:
+        if (
+            int(data.get("up_to_id", 0)) == up_to
+            and data.get("root_hash") == checkpoint["root_hash"]
+        ):
             return "No change (idempotent)"
     content = json.dumps(
         {
             "up_to_id": up_to,
             "covers": ["rsm_state", "open_commitments"],
-            "root_hash": digest,
+            "root_hash": checkpoint["root_hash"],
+            "root_scheme": checkpoint["root_scheme"],
+            "leaf_count": checkpoint["leaf_count"],
         },
         sort_keys=True,
         separators=(",", ":"),
@@ -1044,7 +1112,7 @@ def handle_graph_command(command: str, eventlog: EventLog) -> Optional[str]:
 
 
 def _last_retrieval_config(eventlog: EventLog) -> Optional[Dict]:
-    for ev in eventlog.read_by_kind("config", reverse=True):
+    for ev in eventlog.read_by_index("config_type", "retrieval", reverse=True):
         try:
             data = json.loads(ev.get("content") or "{}")
         except Exception:
@@ -315,6 +315,7 @@ def _render_threads(
         return ""
 
     lines = ["## Threads"]
+    open_events = eventlog.get_many(result.episode_selections)
 
     for cid in sorted(result.relevant_cids):
         selected_episodes = [
@@ -340,7 +341,7 @@ def _render_threads(
                 episode = mg.episode_for_open(open_event_id)
                 if episode is None:
                     continue
-                open_event = eventlog.get(open_event_id) or {}
+                open_event = open_events.get(open_event_id) or {}
                 open_meta = open_event.get("meta") or {}
                 goal = open_meta.get("text") or open_meta.get("goal") or "Unknown goal"
                 role_label = (
@@ -388,8 +389,9 @@ def _render_threads(
         status = "Active"
 
         # Scan events in thread
+        thread_events = eventlog.get_many(thread_ids)
         for eid in thread_ids:
-            evt = eventlog.get(eid)
+            evt = thread_events.get(eid)
             kind = evt.get("kind")
             meta = evt.get("meta", {})
 
@@ -568,8 +570,9 @@ def _render_evidence(
 
     lines = ["## Evidence"]
 
+    events = eventlog.get_many(chron_ids)
     for eid in chron_ids:
-        evt = eventlog.get(eid)
+        evt = events.get(eid)
         kind = evt.get("kind")
         content = evt.get("content") or ""
 
@@ -16,6 +16,13 @@ if TYPE_CHECKING:
     from pmm.core.concept_graph import ConceptGraph
 
 
+def _shared_projection(eventlog: EventLog, name: str) -> Any:
+    """Live projection the runtime published as ``name``, if any."""
+    if not isinstance(eventlog, EventLog):
+        return None
+    return eventlog.projection(name)
+
+
 def render_identity_claims(eventlog: EventLog) -> str:
     """Render identity claims (e.g., name) from ledger claim events."""
     # Use kind-indexed scan instead of full ledger read to keep the
@@ -96,8 +103,11 @@ def render_graph_context(
     eventlog: EventLog, meme_graph: Optional[MemeGraph] = None
 ) -> str:
     """Render memegraph structural context for model introspection."""
-    mg = meme_graph or MemeGraph(eventlog)
-    if meme_graph is None:
+    mg = meme_graph
+    if mg is None:
+        mg = _shared_projection(eventlog, "runtime.memegraph")
+    if mg is None:
+        mg = MemeGraph(eventlog)
         mg.rebuild(eventlog.read_all())
     stats = mg.graph_stats()
 
@@ -158,9 +168,10 @@ def render_concept_context(
     """
     from pmm.core.concept_graph import ConceptGraph
 
-    if concept_graph is not None:
-        cg = concept_graph
-    else:
+    cg = concept_graph
+    if cg is None:
+        cg = _shared_projection(eventlog, "runtime.concept_graph")
+    if cg is None:
         cg = ConceptGraph(eventlog)
         cg.rebuild(eventlog.read_all())
 
@@ -9,7 +9,7 @@ import json
 
 from pmm.core.event_log import EventLog
 from pmm.core.commitment_outcome import is_governed_commitment_reflection_protocol
-from pmm.core.mirror import Mirror
+from pmm.core.mirror import shared_rsm_mirror
 
 
 def _events_since_last(events: List[Dict], kind: str) -> List[Dict]:
@@ -37,7 +37,7 @@ def maybe_append_summary(eventlog: EventLog) -> Optional[int]:
         and not is_governed_commitment_reflection_protocol(e)
     ]
     # Derive open commitments via Mirror for canonical meta-based state
-    mirror = Mirror(eventlog, enable_rsm=True, listen=False)
+    mirror = shared_rsm_mirror(eventlog)
     open_commitments = len(mirror.get_open_commitment_events())
 
     # Observable ledger facts only (no psychometrics):
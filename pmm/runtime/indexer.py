@@ -17,6 +17,7 @@ from pmm.core.binding_attribution import binding_attribution_meta
 from pmm.core.event_log import EventLog
 from pmm.core.concept_graph import ConceptGraph
 from pmm.core.meme_graph import MemeGraph
+from pmm.retrieval.embedding_store import EmbeddingStore
 
 
 class SemanticExtractor:
@@ -138,6 +139,7 @@ class Indexer:
         self.concept_graph.rebuild()
         # Track progress for embedding backfill to stay incremental
         self._last_embedded_id: int = 0
+        self.embeddings = EmbeddingStore(eventlog)
         self._last_cbt_id: int = 0  # concept_bind_thread backfill cursor
 
     def run_indexing_cycle(self, limit: int = 50) -> int:
@@ -251,29 +253,23 @@ class Indexer:
         if not candidates:
             return 0
 
-        # Build existing embedding set for this model/dims
-        existing = set()
-        for ev in self.eventlog.read_by_kind("embedding_add"):
-            try:
-                data = json.loads(ev.get("content") or "{}")
-            except Exception:
-                continue
-            if (data or {}).get("model") == model and int(
-                (data or {}).get("dims", 0)
-            ) == int(dims):
-                try:
-                    existing.add(int((data or {}).get("event_id", 0)))
-                except Exception:
-                    continue
-
         from pmm.retrieval.vector import build_embedding_content
 
+        messages = [
+            ev
+            for ev in candidates
+            if ev.get("kind") in ("user_message", "assistant_message")
+        ]
+        # One store refresh for the whole batch, then membership lookups.
+        missing = set(
+            self.embeddings.missing(
+                (int(ev.get("id", 0)) for ev in messages), model=model, dims=dims
+            )
+        )
         appended = 0
-        for ev in candidates:
+        for ev in messages:
             eid = int(ev.get("id", 0))
-            if ev.get("kind") not in ("user_message", "assistant_message"):
-                continue
-            if eid in existing:
+            if eid not in missing:
                 continue
             payload = build_embedding_content(
                 event_id=eid, text=ev.get("content") or "", model=model, dims=dims
@@ -350,9 +346,7 @@ class Indexer:
                             kind="concept_bind_thread",
                             content=bind_content,
                             origin_event_id=origin_event_id,
-                            derived_from_binding_event_id=item.get(
-                                "binding_event_id"
-                            ),
+                            derived_from_binding_event_id=item.get("binding_event_id"),
                         )
                         existing_ids = {
                             existing.get("attribution_id")
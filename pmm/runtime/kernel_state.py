@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/runtime/kernel_state.py
+"""Incremental ledger facts consulted by the AutonomyKernel on every tick.
+
+The state is folded one event at a time from the kernel's ledger cursor, so a
+tick reads counters and pointers instead of rescanning the whole ledger. It is
+a pure projection: replaying the same events always rebuilds the same state.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from pmm.core.commitment_outcome import is_governed_commitment_reflection_protocol
+
+MESSAGE_KINDS = ("user_message", "assistant_message")
+
+
+def _json_content(event: Dict[str, Any]) -> Any:
+    try:
+        return json.loads(event.get("content") or "{}")
+    except (TypeError, ValueError):
+        return None
+
+
+class KernelLedgerState:
+    """Per-kind counts, last-of-kind pointers and bounded recent windows.
+
+    Pointers carry the event's ordinal (1-based position in the ledger), so
+    "events after X" is ``event_count - ordinal`` rather than a scan.
+    """
+
+    def __init__(self, *, goals: Iterable[str] = (), recent_window: int = 200) -> None:
+        self.event_count = 0
+        self.last_event_id = 0
+        self.counts: Dict[str, int] = {}
+        self._last: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=max(1, int(recent_window)))
+        # autonomy_tick totals
+        self.idle_ticks = 0
+        self.ticks_since_index = 0
+        # Non-governed reflections, as counted by autonomy_metrics
+        self.reflect_count = 0
+        self.intention_reflect_count = 0
+        self.last_reflection_id = 0
+        self.last_autonomy_reflection: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Latest open per tracked internal goal; cleared by a close of its cid
+        self._goal_opens: Dict[str, Optional[Dict[str, Any]]] = {
+            goal: None for goal in goals
+        }
+        # Message ids (not events) for embedding coverage and overlap checks
+        self.message_ids = array("q")
+        self.user_message_ids = array("q")
+        self._embedded: Dict[Tuple[Any, int], Set[int]] = {}
+
+    def observe(self, event: Dict[str, Any]) -> None:
+        """Fold one event; events must arrive in id order."""
+        kind = event.get("kind")
+        self.event_count += 1
+        self.last_event_id = int(event.get("id", 0))
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        self._last[kind] = (self.event_count, event)
+        self._recent.append(event)
+
+        if kind in MESSAGE_KINDS:
+            self.message_ids.append(self.last_event_id)
+            if kind == "user_message":
+                self.user_message_ids.append(self.last_event_id)
+        elif kind == "autonomy_tick":
+            self._observe_tick(event)
+        elif kind == "reflection":
+            self._observe_reflection(event)
+        elif kind == "embedding_add":
+            self._observe_embedding(event)
+        elif kind == "commitment_open":
+            goal = event.get("meta", {}).get("goal")
+            if isinstance(goal, str) and goal in self._goal_opens:
+                self._goal_opens[goal] = event
+        elif kind == "commitment_close":
+            cid = event.get("meta", {}).get("cid")
+            for goal, open_event in self._goal_opens.items():
+                if open_event and cid == open_event.get("meta", {}).get("cid"):
+                    self._goal_opens[goal] = None
+
+    def _observe_tick(self, event: Dict[str, Any]) -> None:
+        data = _json_content(event)
+        decision = data.get("decision") if isinstance(data, dict) else None
+        if decision == "idle":
+            self.idle_ticks += 1
+        if decision == "index":
+            self.ticks_since_index = 0
+        else:
+            self.ticks_since_index += 1
+
+    def _observe_reflection(self, event: Dict[str, Any]) -> None:
+        if event.get("meta", {}).get("source") == "autonomy_kernel":
+            self.last_autonomy_reflection = (self.event_count, event)
+        if is_governed_commitment_reflection_protocol(event):
+            return
+        self.reflect_count += 1
+        self.last_reflection_id = int(event.get("id", 0))
+        data = _json_content(event)
+        if isinstance(data, dict) and "intent" in data:
+            self.intention_reflect_count += 1
+
+    def _observe_embedding(self, event: Dict[str, Any]) -> None:
+        data = _json_content(event)
+        if not isinstance(data, dict):
+            return
+        try:
+            key = (data.get("model"), int(data.get("dims", 0)))
+            target = int(data.get("event_id", 0))
+            self._embedded.setdefault(key, set()).add(target)
+        except (TypeError, ValueError):
+            return
+
+    # Queries
+    def count(self, kind: str) -> int:
+        return self.counts.get(kind, 0)
+
+    def last(self, kind: str) -> Optional[Dict[str, Any]]:
+        entry = self._last.get(kind)
+        return entry[1] if entry else None
+
+    def ordinal(self, kind: str) -> int:
+        """Ordinal of the latest ``kind`` event, or 0 when there is none."""
+        entry = self._last.get(kind)
+        return entry[0] if entry else 0
+
+    def last_within(self, kind: str, window: int) -> Optional[Dict[str, Any]]:
+        """Latest ``kind`` event among the final ``window`` events."""
+        entry = self._last.get(kind)
+        if entry is None or entry[0] <= self.event_count - int(window):
+            return None
+        return entry[1]
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Up to the last ``limit`` events (bounded by the recent window)."""
+        limit = int(limit)
+        if limit <= 0:
+            return []
+        window = list(self._recent)
+        return window[-limit:]
+
+    def open_goal(self, goal: str) -> Optional[Dict[str, Any]]:
+        return self._goal_opens.get(goal)
+
+    def embedded_ids(self, model: Any, dims: int) -> Set[int]:
+        return self._embedded.get((model, int(dims)), set())
+
+    def message_ids_before(self, event_id: int, limit: int) -> List[int]:
+        """Ids of the last ``limit`` messages with id below ``event_id``."""
+        end = bisect_left(self.message_ids, int(event_id))
+        return list(self.message_ids[max(0, end - int(limit)) : end])
+
+    def last_user_message_before(self, event_id: int) -> Optional[int]:
+        end = bisect_left(self.user_message_ids, int(event_id))
+        return self.user_message_ids[end - 1] if end else None
@@ -10,7 +10,7 @@ import json
 from typing import Any, Dict, List, Optional
 
 from pmm.adapters import AdapterTransportError, normalize_generation_result
-from pmm.core.event_log import EventLog, TERMINAL_OUTCOME_PROTOCOL
+from pmm.core.event_log import EventLog, TERMINAL_OUTCOME_PROTOCOL, open_cursor
 from pmm.core.writer_session import WriterOwnershipLost
 from pmm.core.mirror import Mirror
 from pmm.core.meme_graph import MemeGraph
@@ -43,6 +43,8 @@ from pmm.core.identity_adoption import (
 from pmm.core.identity_manager import maybe_append_identity_adoptions
 from pmm.runtime.reflection import TurnDelta, build_reflection_text
 from pmm.retrieval.pipeline import run_retrieval_pipeline, RetrievalConfig
+from pmm.retrieval.result_cache import RetrievalCache
+from pmm.retrieval.summary_index import SummaryIndex
 from pmm.runtime.context_renderer import (
     PriorConversationRenderResult,
     render_context_with_metrics,
@@ -53,6 +55,7 @@ from pmm.retrieval.vector import (
     selection_digest,
     ensure_embedding_for_event,
 )
+from pmm.retrieval.embedding_store import EmbeddingStore
 from pmm.runtime.bindings import ExecBindRouter
 from pmm.runtime.autonomy_supervisor import AutonomySupervisor
 from pmm.core.autonomy_tracker import AutonomyTracker
@@ -69,10 +72,19 @@ from pmm.runtime.ctl_injector import CTLLookupInjector
 import asyncio
 import threading
 import time
+from contextlib import nullcontext
 
 DEBUG = False  # Set to True for debugging
 
 
+def _latest_of_kind(eventlog: Any, kind: str) -> Optional[Dict[str, Any]]:
+    """Latest event of ``kind`` via the indexed lookup when the log has one."""
+    finder = getattr(eventlog, "last_of_kind", None)
+    if callable(finder):
+        return finder(kind)
+    return next((e for e in reversed(eventlog.read_all()) if e["kind"] == kind), None)
+
+
 class RuntimeLoop:
     _PROMPT_MEASUREMENT_TRANSPORT_FIELDS = {
         "adapter_system_primer_insertions",
@@ -209,6 +221,8 @@ class RuntimeLoop:
         thresholds: Optional[Dict[str, int]] = None,
         output_budget_tokens: int | None = None,
         output_budget_source: str | None = None,
+        retrieval_cache: RetrievalCache | None = None,
+        record_stage_timings: bool = False,
     ) -> None:
         configured_budget = (
             output_budget_tokens
@@ -226,6 +240,11 @@ class RuntimeLoop:
                 raise ValueError("selected adapter did not accept the output budget")
         self.eventlog = eventlog
         self._run_turn_lock = threading.Lock()
+        # Opt-in: identical queries over unchanged inputs reuse their selection.
+        self.retrieval_cache = retrieval_cache
+        # Opt-in: wall time is not reproducible, so it stays out of the hashed
+        # ledger unless asked for; stage counters are always recorded.
+        self.record_stage_timings = bool(record_stage_timings)
         self.output_budget_source = output_budget_source or getattr(
             adapter,
             "output_budget_source",
@@ -283,6 +302,8 @@ class RuntimeLoop:
             self.memegraph.add_event,
             name="runtime.memegraph",
             required=True,
+            projection=self.memegraph,
+            snapshot=self.memegraph.projection_snapshot(),
         )
 
         self.mirror = Mirror(eventlog, auto_rebuild=False)
@@ -291,6 +312,8 @@ class RuntimeLoop:
             self.mirror.sync,
             name="runtime.mirror",
             required=True,
+            projection=self.mirror,
+            snapshot=self.mirror.projection_snapshot(),
         )
         # ConceptGraph projection for CTL (rebuildable and listener-backed)
         self.concept_graph = ConceptGraph(eventlog)
@@ -299,12 +322,24 @@ class RuntimeLoop:
             self.concept_graph.sync,
             name="runtime.concept_graph",
             required=True,
+            projection=self.concept_graph,
+            snapshot=self.concept_graph.projection_snapshot(),
+        )
+        # Summary embeddings and concept spans for the summary retrieval stages
+        self.summary_index = SummaryIndex(eventlog)
+        self.eventlog.rebuild_and_register_listener(
+            self.summary_index.rebuild,
+            self.summary_index.sync,
+            name="runtime.summary_index",
+            projection=self.summary_index,
+            snapshot=self.summary_index.projection_snapshot(),
         )
         self.eventlog.projection_barrier()
         if not replay:
             self._recover_latest_interrupted_turn()
             self.eventlog.projection_barrier()
         self.commitments = CommitmentManager(eventlog)
+        self.embeddings = EmbeddingStore(eventlog)
         self.adapter = adapter
         self.replay = replay
         self.tracker = AutonomyTracker(eventlog)
@@ -317,9 +352,7 @@ class RuntimeLoop:
         if not self.replay:
             self.autonomy = AutonomyKernel(eventlog, thresholds=thresholds)
             self.exec_router = ExecBindRouter(eventlog)
-            if not any(
-                e["kind"] == "autonomy_rule_table" for e in self.eventlog.read_all()
-            ):
+            if _latest_of_kind(self.eventlog, "autonomy_rule_table") is None:
                 self.autonomy.ensure_rule_table_event()
 
             if autonomy:
@@ -338,24 +371,17 @@ class RuntimeLoop:
     def _recover_latest_interrupted_turn(self) -> int | None:
         """Recover only an unambiguous latest managed turn, if one exists."""
 
-        events = self.eventlog.read_all()
-        latest_user_index = next(
-            (
-                index
-                for index in range(len(events) - 1, -1, -1)
-                if events[index].get("kind") == "user_message"
-            ),
-            None,
-        )
-        if latest_user_index is None:
+        user_event = _latest_of_kind(self.eventlog, "user_message")
+        if user_event is None:
             return None
-        user_event = events[latest_user_index]
         user_meta = user_event.get("meta") or {}
         if user_meta.get("turn_protocol") != TERMINAL_OUTCOME_PROTOCOL:
             return None
 
         user_event_id = int(user_event["id"])
-        suffix = events[latest_user_index + 1 :]
+        suffix = open_cursor(
+            self.eventlog, "runtime.turn_recovery", applied_through=user_event_id
+        ).poll()
         for event in suffix:
             meta = event.get("meta") or {}
             if (
@@ -645,6 +671,7 @@ class RuntimeLoop:
                 text=user_input,
                 model=model,
                 dims=dims,
+                store=self.embeddings,
             )
 
         # 2. Build prompts
@@ -684,6 +711,9 @@ class RuntimeLoop:
         self.eventlog.projection_barrier()
         prior_pair = self.memegraph.prior_managed_pair(user_event_id)
 
+        cache_hits = (
+            self.retrieval_cache.hits if self.retrieval_cache is not None else 0
+        )
         retrieval_result = run_retrieval_pipeline(
             query_text=user_input,
             eventlog=self.eventlog,
@@ -691,11 +721,27 @@ class RuntimeLoop:
             meme_graph=self.memegraph,
             config=pipeline_config,
             user_event=user_event,
+            cache=self.retrieval_cache,
+            summary_index=self.summary_index,
         )
+        retrieval_cache_telemetry: Dict[str, Any] | None = None
+        if self.retrieval_cache is not None:
+            retrieval_cache_telemetry = dict(
+                self.retrieval_cache.stats(),
+                hit=self.retrieval_cache.hits > cache_hits,
+            )
 
         selection_ids = retrieval_result.event_ids
         selection_provenance = retrieval_result.provenance
         selection_vector_uses = list(retrieval_result.vector_embedding_uses)
+        selection_stage_metrics = {
+            name: {
+                key: value
+                for key, value in metrics.items()
+                if key != "wall_ms" or self.record_stage_timings
+            }
+            for name, metrics in retrieval_result.stage_metrics.items()
+        }
         selection_scores = [
             float(
                 (selection_provenance.get(event_id, {}).get("scores") or {}).get(
@@ -1024,94 +1070,102 @@ class RuntimeLoop:
                 self.concept_graph,
                 assistant_event,
             )
-        # If vector retrieval, append embedding for assistant message (idempotent)
-        if retrieval_cfg and retrieval_cfg.get("strategy") == "vector":
-            model = str(retrieval_cfg.get("model", "hash64"))
-            dims = int(retrieval_cfg.get("dims", 64))
-            ensure_embedding_for_event(
-                events=[],
-                eventlog=self.eventlog,
-                event_id=ai_event_id,
-                text=assistant_reply,
-                model=model,
-                dims=dims,
-            )
+        # Steps 4-4c only append (no projection reads in between), so they
+        # share one transaction; listeners see them in order after commit.
+        batch = getattr(self.eventlog, "batch", None)
+        with batch() if callable(batch) else nullcontext():
+            # If vector retrieval, append embedding for assistant message (idempotent)
+            if retrieval_cfg and retrieval_cfg.get("strategy") == "vector":
+                model = str(retrieval_cfg.get("model", "hash64"))
+                dims = int(retrieval_cfg.get("dims", 64))
+                ensure_embedding_for_event(
+                    events=[],
+                    eventlog=self.eventlog,
+                    event_id=ai_event_id,
+                    text=assistant_reply,
+                    model=model,
+                    dims=dims,
+                    store=self.embeddings,
+                )
 
-        # 4a. Parse REF: lines and append inter_ledger_ref events
-        self._parse_ref_lines(assistant_reply)
-
-        # 4b. Append retrieval_selection whenever retrieval produced a selection.
-        # This includes turns where no vector stage ran; vector_embedding_uses
-        # distinguishes those, and an empty list carries no digest.
-        if selection_ids is not None and selection_scores is not None:
-            sel_payload = {
-                "turn_id": ai_event_id,
-                "selected": selection_ids,
-                "scores": selection_scores,
-                "provenance": [
-                    {
-                        "event_id": event_id,
-                        **selection_provenance.get(
-                            event_id, {"reasons": [], "scores": {}}
-                        ),
-                    }
-                    for event_id in selection_ids
-                ],
-                "strategy": "hybrid",
-                "record_version": 2,
-                "vector_embedding_uses": selection_vector_uses,
-            }
-            sel_meta: Dict[str, Any] = {}
-            if selection_vector_uses:
-                # Every stage applies the same embedding parameters, so the
-                # digest describes them all. vector_embedding_uses remains the
-                # exhaustive per-invocation record.
-                applied_model = str(selection_vector_uses[0]["model"])
-                applied_dims = int(selection_vector_uses[0]["dims"])
-                sel_payload["model"] = applied_model
-                sel_payload["dims"] = applied_dims
-                sel_meta["digest"] = selection_digest(
-                    selected=selection_ids,
-                    scores=selection_scores,
-                    model=applied_model,
-                    dims=applied_dims,
-                    query_text=user_input,
+            # 4a. Parse REF: lines and append inter_ledger_ref events
+            self._parse_ref_lines(assistant_reply)
+
+            # 4b. Append retrieval_selection whenever retrieval produced a selection.
+            # This includes turns where no vector stage ran; vector_embedding_uses
+            # distinguishes those, and an empty list carries no digest.
+            if selection_ids is not None and selection_scores is not None:
+                sel_payload = {
+                    "turn_id": ai_event_id,
+                    "selected": selection_ids,
+                    "scores": selection_scores,
+                    "provenance": [
+                        {
+                            "event_id": event_id,
+                            **selection_provenance.get(
+                                event_id, {"reasons": [], "scores": {}}
+                            ),
+                        }
+                        for event_id in selection_ids
+                    ],
+                    "strategy": "hybrid",
+                    "record_version": 2,
+                    "vector_embedding_uses": selection_vector_uses,
+                }
+                sel_meta: Dict[str, Any] = {}
+                if selection_stage_metrics:
+                    sel_meta["stage_metrics"] = selection_stage_metrics
+                if selection_vector_uses:
+                    # Every stage applies the same embedding parameters, so the
+                    # digest describes them all. vector_embedding_uses remains the
+                    # exhaustive per-invocation record.
+                    applied_model = str(selection_vector_uses[0]["model"])
+                    applied_dims = int(selection_vector_uses[0]["dims"])
+                    sel_payload["model"] = applied_model
+                    sel_payload["dims"] = applied_dims
+                    sel_meta["digest"] = selection_digest(
+                        selected=selection_ids,
+                        scores=selection_scores,
+                        model=applied_model,
+                        dims=applied_dims,
+                        query_text=user_input,
+                    )
+                sel_content = json.dumps(
+                    sel_payload,
+                    sort_keys=True,
+                    separators=(",", ":"),
                 )
-            sel_content = json.dumps(
-                sel_payload,
-                sort_keys=True,
-                separators=(",", ":"),
+                self.eventlog.append(
+                    kind="retrieval_selection", content=sel_content, meta=sel_meta
+                )
+
+            # 4c. Per-turn diagnostics (deterministic formatting)
+            prov = "dummy"
+            cls = type(self.adapter).__name__.lower()
+            if "openai" in cls:
+                prov = "openai"
+            elif "ollama" in cls:
+                prov = "ollama"
+            model_name = getattr(self.adapter, "model", "") or ""
+            in_tokens = len((system_prompt or "").split()) + len(
+                (user_input or "").split()
             )
-            self.eventlog.append(
-                kind="retrieval_selection", content=sel_content, meta=sel_meta
+            out_tokens = len((assistant_reply or "").split())
+            # Use adapter-provided deterministic latency if present (e.g., DummyAdapter)
+            lat_ms = getattr(self.adapter, "deterministic_latency_ms", None)
+            if lat_ms is None:
+                lat_ms = int((t1 - t0) * 1000)
+            diag = (
+                f"provider:{prov},model:{model_name},"
+                f"in_tokens:{in_tokens},out_tokens:{out_tokens},lat_ms:{lat_ms}"
             )
-
-        # 4c. Per-turn diagnostics (deterministic formatting)
-        prov = "dummy"
-        cls = type(self.adapter).__name__.lower()
-        if "openai" in cls:
-            prov = "openai"
-        elif "ollama" in cls:
-            prov = "ollama"
-        model_name = getattr(self.adapter, "model", "") or ""
-        in_tokens = len((system_prompt or "").split()) + len((user_input or "").split())
-        out_tokens = len((assistant_reply or "").split())
-        # Use adapter-provided deterministic latency if present (e.g., DummyAdapter)
-        lat_ms = getattr(self.adapter, "deterministic_latency_ms", None)
-        if lat_ms is None:
-            lat_ms = int((t1 - t0) * 1000)
-        diag = (
-            f"provider:{prov},model:{model_name},"
-            f"in_tokens:{in_tokens},out_tokens:{out_tokens},lat_ms:{lat_ms}"
-        )
-        self.eventlog.append(
-            kind="metrics_turn",
-            content=diag,
-            meta={
+            turn_meta: Dict[str, Any] = {
                 "prompt_telemetry": prompt_telemetry,
                 "output_telemetry": output_telemetry,
-            },
-        )
+            }
+            if retrieval_cache_telemetry is not None:
+                turn_meta["retrieval_cache"] = retrieval_cache_telemetry
+            self.eventlog.append(kind="metrics_turn", content=diag, meta=turn_meta)
 
         # 4d. Synthesize deterministic reflection and maybe append summary
         synthesize_reflection(self.eventlog, mirror=self.mirror)
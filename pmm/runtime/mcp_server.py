@@ -9,13 +9,19 @@ Exposes PMM execution tools to Codex or other MCP-compatible clients.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import os
 import subprocess
 import sys
 import threading
-from typing import Any, Dict, Optional
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from pmm.adapters import resolve_output_budget_tokens
 
@@ -26,9 +32,187 @@ mcp = FastMCP("pmm")
 # the cross-process authority.
 _turn_lock = threading.Lock()
 
+# Resident mode keeps one writer EventLog and a warm RuntimeLoop in this process
+# instead of spawning oneshot_cli per turn.
+RESIDENT_ENV = "PMM_MCP_RESIDENT"
+QUEUE_DEPTH_ENV = "PMM_MCP_QUEUE_DEPTH"
+ADMISSION_TIMEOUT_ENV = "PMM_MCP_ADMISSION_TIMEOUT"
+DEFAULT_QUEUE_DEPTH = 8
+DEFAULT_ADMISSION_TIMEOUT = 240.0
+
+
+class AdmissionQueue:
+    """Bounded FIFO admission for serialized turns.
+
+    At most ``depth`` callers wait behind the active turn; further contenders
+    are rejected immediately, and waiters give up after ``timeout`` seconds.
+    """
+
+    def __init__(self, depth: int) -> None:
+        if depth < 0:
+            raise ValueError("admission queue depth must be non-negative")
+        self.depth = depth
+        self._cond = threading.Condition()
+        self._waiting: Deque[object] = deque()
+        self._active = False
+
+    @contextmanager
+    def admit(self, timeout: float) -> Iterator[None]:
+        ticket = object()
+        with self._cond:
+            if self._active and len(self._waiting) >= self.depth:
+                raise RuntimeError("MCP admission queue full; contender rejected")
+            self._waiting.append(ticket)
+            deadline = time.monotonic() + timeout
+            try:
+                while self._active or self._waiting[0] is not ticket:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"MCP turn admission timed out after {timeout:g} seconds"
+                        )
+                    self._cond.wait(remaining)
+            except BaseException:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+                raise
+            self._waiting.popleft()
+            self._active = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active = False
+                self._cond.notify_all()
+
+
+class ResidentRuntime:
+    """Writer EventLog and warm RuntimeLoop reused across MCP turns.
+
+    The writer lease is renewed by the session heartbeat for as long as the
+    runtime stays open. A failed turn, an unhealthy session, or a different
+    model/budget selection discards the runtime; the next turn reopens it.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._eventlog: Any = None
+        self._loop: Any = None
+        self._key: Optional[Tuple[str, Optional[int]]] = None
+
+    @property
+    def warm(self) -> bool:
+        return self._eventlog is not None
+
+    def run(
+        self,
+        *,
+        prompt: str,
+        model: str,
+        include_events: bool = False,
+        output_budget_tokens: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        from pmm.runtime.oneshot_cli import run_loop_turn
+
+        prompt = (prompt or "").strip()
+        if not prompt:
+            raise ValueError("Prompt cannot be empty")
+        self._ensure_open((model, output_budget_tokens))
+        try:
+            return run_loop_turn(
+                elog=self._eventlog,
+                loop=self._loop,
+                prompt=prompt,
+                include_events=include_events,
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def _ensure_open(self, key: Tuple[str, Optional[int]]) -> None:
+        if self._eventlog is not None:
+            session = self._eventlog.writer_session
+            if key == self._key and session is not None and session.healthy:
+                return
+            self.close()
+
+        from pmm.core.event_log import EventLog
+        from pmm.runtime.oneshot_cli import build_turn_loop
+
+        db_path = self.db_path
+        if db_path != ":memory:":
+            db_path = os.path.abspath(db_path)
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        elog = EventLog(db_path, mode="writer", writer_role="mcp_resident")
+        try:
+            loop = build_turn_loop(elog=elog, model=key[0], output_budget_tokens=key[1])
+        except BaseException:
+            elog.close()
+            raise
+        self._eventlog, self._loop, self._key = elog, loop, key
+
+    def close(self) -> None:
+        elog = self._eventlog
+        self._eventlog, self._loop, self._key = None, None, None
+        if elog is not None:
+            elog.close()
+
+
+_resident_lock = threading.Lock()
+_resident: Optional[ResidentRuntime] = None
+_admission: Optional[AdmissionQueue] = None
+
+
+def _resident_enabled() -> bool:
+    return os.environ.get(RESIDENT_ENV, "").strip().lower() in {"1", "true", "yes"}
+
+
+def _admission_queue() -> AdmissionQueue:
+    global _admission
+    with _resident_lock:
+        if _admission is None:
+            depth = int(os.environ.get(QUEUE_DEPTH_ENV, DEFAULT_QUEUE_DEPTH))
+            _admission = AdmissionQueue(depth)
+        return _admission
+
+
+def _resident_runtime(db_path: str) -> ResidentRuntime:
+    """Return the runtime for ``db_path``; callers hold admission, so none is busy."""
+    global _resident
+    with _resident_lock:
+        previous = _resident
+        if previous is not None and previous.db_path == db_path:
+            return previous
+        _resident = runtime = ResidentRuntime(db_path)
+    if previous is not None:
+        previous.close()
+    return runtime
+
+
+def _resident_turn(db_path: str, **kwargs: Any) -> Dict[str, Any]:
+    """Run one turn on the resident runtime once the admission queue admits it."""
+    with _admission_queue().admit(_admission_timeout()):
+        return _resident_runtime(db_path).run(**kwargs)
+
+
+def _admission_timeout() -> float:
+    return float(os.environ.get(ADMISSION_TIMEOUT_ENV, DEFAULT_ADMISSION_TIMEOUT))
+
+
+def shutdown_resident_runtime() -> None:
+    """Close the resident runtime, storing snapshots and releasing the lease."""
+    global _resident, _admission
+    with _resident_lock:
+        runtime, _resident, _admission = _resident, None, None
+    if runtime is not None:
+        runtime.close()
+
+
+atexit.register(shutdown_resident_runtime)
+
 
 @mcp.tool()
-def pmm_turn(
+async def pmm_turn(
     prompt: str,
     model: Optional[str] = None,
     include_events: bool = False,
@@ -42,6 +226,10 @@ def pmm_turn(
                Defaults to PMM_MCP_MODEL env variable or 'ornith:9b'.
         include_events: If True, includes full generated event logs in the response.
         output_budget_tokens: Optional provider-enforced generated-token limit.
+
+    With PMM_MCP_RESIDENT=1 the turn runs on a warm in-process runtime behind a
+    bounded admission queue instead of a fresh oneshot_cli subprocess. Either
+    way the turn runs in a worker thread, so the server loop stays responsive.
     """
     db_path = os.environ.get("PMM_MCP_DB")
     if not db_path:
@@ -55,6 +243,18 @@ def pmm_turn(
         else None
     )
 
+    if _resident_enabled():
+        return await anyio.to_thread.run_sync(
+            functools.partial(
+                _resident_turn,
+                db_path,
+                prompt=prompt,
+                model=target_model,
+                include_events=include_events,
+                output_budget_tokens=resolved_output_budget,
+            )
+        )
+
     cmd = [
         sys.executable,
         "-m",
@@ -68,7 +268,11 @@ def pmm_turn(
         cmd.append("--include-events")
     if resolved_output_budget is not None:
         cmd.extend(["--output-budget-tokens", str(resolved_output_budget)])
+    return await anyio.to_thread.run_sync(_oneshot_turn, cmd, prompt)
+
 
+def _oneshot_turn(cmd: List[str], prompt: str) -> Dict[str, Any]:
+    """Run one turn in a oneshot_cli subprocess and decode its JSON payload."""
     if not _turn_lock.acquire(blocking=False):
         raise RuntimeError("MCP managed turn already active; contender rejected")
     try:
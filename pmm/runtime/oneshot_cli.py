@@ -148,6 +148,30 @@ def _run_one_turn_owned(
     output_budget_tokens: int | None = None,
 ) -> Dict[str, Any]:
     """Run one turn while the caller retains fenced writer ownership."""
+    loop = build_turn_loop(
+        elog=elog,
+        model=model,
+        provider=provider,
+        adapter=adapter,
+        output_budget_tokens=output_budget_tokens,
+    )
+    return run_loop_turn(
+        elog=elog, loop=loop, prompt=prompt, include_events=include_events
+    )
+
+
+def build_turn_loop(
+    *,
+    elog: EventLog,
+    model: Optional[str] = None,
+    provider: Optional[str] = None,
+    adapter: Optional[Any] = None,
+    output_budget_tokens: int | None = None,
+) -> RuntimeLoop:
+    """Resolve the adapter and build a non-autonomous loop over ``elog``.
+
+    The returned loop may serve several turns while ``elog`` keeps ownership.
+    """
 
     # 1. Resolve LLM Adapter if not injected (for testing compatibility)
     if adapter is None:
@@ -178,7 +202,7 @@ def _run_one_turn_owned(
         )
 
     # 2. Instantiate Loop (autonomy=False prevents background supervisor thread)
-    loop = RuntimeLoop(
+    return RuntimeLoop(
         eventlog=elog,
         adapter=adapter,
         autonomy=False,
@@ -186,6 +210,16 @@ def _run_one_turn_owned(
         output_budget_source=output_budget_source,
     )
 
+
+def run_loop_turn(
+    *,
+    elog: EventLog,
+    loop: RuntimeLoop,
+    prompt: str,
+    include_events: bool = False,
+) -> Dict[str, Any]:
+    """Run one turn on a built loop and return the structured turn result."""
+
     # 3. Snapshot the actual tail event ID AFTER loop initialization
     tail_before = elog.read_tail(1)
     last_id_before = int(tail_before[-1]["id"]) if tail_before else 0
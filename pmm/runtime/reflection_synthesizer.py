@@ -9,7 +9,7 @@ import json
 
 from pmm.core.event_log import EventLog
 from pmm.core.commitment_outcome import is_governed_commitment_reflection_protocol
-from pmm.core.mirror import Mirror
+from pmm.core.mirror import Mirror, shared_rsm_mirror
 from pmm.core.commitment_manager import CommitmentManager
 from pmm.core.enhancements.meta_reflection_engine import MetaReflectionEngine
 
@@ -76,8 +76,7 @@ def synthesize_reflection(
             and not is_governed_commitment_reflection_protocol(e)
         )
         if reflection_count >= 5:
-            mirror = Mirror(eventlog, enable_rsm=True, listen=False)
-            snapshot = mirror.rsm_snapshot()
+            snapshot = shared_rsm_mirror(eventlog).rsm_snapshot()
 
             # Add graph structure awareness
             from pmm.core.meme_graph import MemeGraph
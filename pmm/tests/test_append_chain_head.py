@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.event_log import EventLog
+
+
+def _chain_ok(events) -> bool:
+    return all(
+        events[i]["prev_hash"] == events[i - 1]["hash"] for i in range(1, len(events))
+    )
+
+
+def test_steady_state_append_skips_head_select():
+    log = EventLog(":memory:")
+    log.append(kind="test_event", content="seed", meta={})
+    statements: list[str] = []
+    log._conn.set_trace_callback(statements.append)
+    try:
+        for i in range(3):
+            log.append(kind="test_event", content=f"e{i}", meta={})
+    finally:
+        log._conn.set_trace_callback(None)
+
+    assert not [s for s in statements if "ORDER BY id DESC" in s]
+    assert _chain_ok(log.read_all())
+
+
+def test_interleaved_same_owner_connections_keep_chain(tmp_path):
+    path = str(tmp_path / "head.db")
+    first = EventLog(path)
+    second = EventLog(path, writer_session=first.writer_session)
+    for i in range(4):
+        first.append(kind="test_event", content=f"a{i}", meta={})
+        second.append(kind="test_event", content=f"b{i}", meta={})
+        first.append_commitment_open(content=f"c{i}", meta={"cid": f"c{i}"})
+
+    events = first.read_all()
+    assert len(events) == 12
+    assert _chain_ok(events)
+    second.close()
+    first.close()
+
+
+def test_policy_index_tracks_latest_policy_config(tmp_path):
+    path = str(tmp_path / "policy.db")
+    log = EventLog(path)
+    log.append(
+        kind="config",
+        content=json.dumps({"type": "policy", "forbid_sources": {"cli": ["config"]}}),
+        meta={"source": "handshake"},
+    )
+    with pytest.raises(PermissionError):
+        log.append(kind="config", content="{}", meta={"source": "cli"})
+    assert log.read_all()[-1]["kind"] == "violation"
+
+    # A policy written through another connection is picked up on catch-up.
+    other = EventLog(path, writer_session=log.writer_session)
+    other.append(
+        kind="config",
+        content=json.dumps({"type": "policy", "forbid_sources": {}}),
+        meta={"source": "handshake"},
+    )
+    log.append(kind="config", content='{"type":"x"}', meta={"source": "cli"})
+    assert log._latest_config("x") == {"type": "x"}
+    assert _chain_ok(log.read_all())
+    other.close()
+    log.close()
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_compact_graph.py
+"""CompactDiGraph behaves like the DiGraph subset MemeGraph relies on."""
+
+from __future__ import annotations
+
+import random
+from operator import itemgetter
+
+import pytest
+
+from pmm.core.compact_graph import CompactDiGraph
+
+KINDS = ["user_message", "assistant_message", "commitment_open", "reflection"]
+LABELS = ["replies_to", "commits_to", "closes", "reflects_on"]
+
+
+def _operations(seed: int = 3):
+    rng = random.Random(seed)
+    ids = rng.sample(range(1, 400), 150)
+    nodes = [
+        (eid, {"kind": rng.choice(KINDS), "turn_protocol": rng.choice([None, "v1"])})
+        for eid in ids
+    ]
+    for eid, data in nodes[::7]:
+        data["cid"] = f"c{eid % 5}"
+    edges = []
+    for _ in range(300):
+        (source, _), (target, _) = rng.sample(nodes, 2)
+        edges.append((source, target, rng.choice(LABELS)))
+    return nodes, edges
+
+
+def _build(graph, nodes, edges):
+    for node, data in nodes:
+        graph.add_node(node, **dict(data))
+    for source, target, label in edges:
+        graph.add_edge(source, target, label=label)
+    return graph
+
+
+def test_out_of_order_nodes_and_edges_round_trip():
+    nodes, edges = _operations()
+    graph = _build(CompactDiGraph(), nodes, edges)
+
+    assert list(graph.nodes) == sorted(node for node, _ in nodes)
+    assert list(reversed(graph.nodes)) == sorted(
+        (node for node, _ in nodes), reverse=True
+    )
+    expected = {}
+    for source, target, label in edges:
+        expected[(source, target)] = label
+    assert graph.number_of_edges() == len(expected)
+    assert {(s, t): label for s, t, label in graph.edges(data="label")} == expected
+    for (source, target), label in expected.items():
+        assert graph.has_edge(source, target)
+        assert graph.get_edge_data(source, target) == {"label": label}
+        assert graph[source][target]["label"] == label
+        assert (source, label) in graph.labeled_predecessors(target)
+        assert source in graph.predecessors(target)
+        assert target in graph.successors(source)
+    for node, data in nodes:
+        assert graph.nodes[node] == data
+        assert graph.kind(node) == data["kind"]
+    assert graph.count_by_kind() == {
+        kind: sum(1 for _, data in nodes if data["kind"] == kind)
+        for kind in KINDS
+        if any(data["kind"] == kind for _, data in nodes)
+    }
+
+
+def test_lookups_reject_unknown_and_non_integer_nodes():
+    graph = CompactDiGraph()
+    graph.add_node(5, kind="user_message", turn_protocol=None)
+    for probe in (4, 6, 10_000, -1, True, "5", None, 5.0, [5]):
+        assert not graph.has_node(probe)
+    assert graph.kind(6) is None
+    assert graph.get_edge_data(5, 6) is None
+    with pytest.raises(KeyError):
+        graph.add_edge(5, 6, label="replies_to")
+    with pytest.raises(KeyError):
+        graph.successors(6)
+    graph.add_node(5, cid="c1")
+    assert graph.nodes[5] == {
+        "kind": "user_message",
+        "turn_protocol": None,
+        "cid": "c1",
+    }
+    graph.clear()
+    assert graph.number_of_nodes() == 0 and not graph.has_node(5)
+
+
+def test_matches_networkx_digraph():
+    nx = pytest.importorskip("networkx")
+    nodes, edges = _operations(seed=9)
+    compact = _build(CompactDiGraph(), nodes, edges)
+    reference = _build(nx.DiGraph(), nodes, edges)
+
+    by_id = itemgetter(0)
+    assert sorted(compact.nodes(data=True), key=by_id) == sorted(
+        reference.nodes(data=True), key=by_id
+    )
+    assert sorted(compact.edges(data="label")) == sorted(reference.edges(data="label"))
+    for node in reference.nodes:
+        assert compact.nodes[node] == reference.nodes[node]
+        assert list(compact.successors(node)) == list(reference.successors(node))
+        assert list(compact.predecessors(node)) == list(reference.predecessors(node))
+        assert compact.out_edges(node, data=True) == list(
+            reference.out_edges(node, data=True)
+        )
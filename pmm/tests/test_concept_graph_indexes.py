@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_concept_graph_indexes.py
+"""ConceptGraph adjacency and relation indexes agree with full edge scans."""
+
+import json
+import random
+
+from pmm.core.concept_graph import ConceptGraph
+from pmm.core.concept_schemas import (
+    create_concept_bind_event_payload,
+    create_concept_relate_payload,
+)
+from pmm.core.event_log import EventLog
+
+TOKENS = [f"topic.t{i}" for i in range(8)]
+RELATIONS = ["relates_to", "part_of", "evidence"]
+
+
+def _seeded_graph() -> ConceptGraph:
+    rng = random.Random(7)
+    log = EventLog()
+    for _ in range(60):
+        src, dst = rng.choice(TOKENS), rng.choice(TOKENS)
+        content, meta = create_concept_relate_payload(
+            src, dst, rng.choice(RELATIONS[:2])
+        )
+        log.append(kind="concept_relate", content=content, meta=meta)
+        eid = log.append(kind="user_message", content="x", meta={})
+        content, meta = create_concept_bind_event_payload(
+            eid, rng.sample(TOKENS, 2), relation=rng.choice(RELATIONS)
+        )
+        log.append(kind="concept_bind_event", content=content, meta=meta)
+    log.append(
+        kind="concept_bind_thread",
+        content=json.dumps({"cid": "c1", "tokens": [TOKENS[0]], "relation": "part_of"}),
+        meta={},
+    )
+    graph = ConceptGraph(log)
+    graph.rebuild()
+    return graph
+
+
+def _scan_neighbors(graph, token, relation, *, out=True, inc=True):
+    found = set()
+    for src, dst, rel in graph.concept_edges:
+        if relation is not None and rel != relation:
+            continue
+        if out and src == token:
+            found.add(dst)
+        if inc and dst == token:
+            found.add(src)
+    return sorted(found)
+
+
+def _assert_matches_scan(graph: ConceptGraph) -> None:
+    for token in TOKENS + ["missing"]:
+        for relation in RELATIONS + [None]:
+            assert graph.neighbors(token, relation) == _scan_neighbors(
+                graph, token, relation
+            )
+            assert graph.outgoing_neighbors(token, relation) == _scan_neighbors(
+                graph, token, relation, inc=False
+            )
+            assert graph.incoming_neighbors(token, relation) == _scan_neighbors(
+                graph, token, relation, out=False
+            )
+            if relation is not None:
+                assert graph.events_for_concept(token, relation) == sorted(
+                    eid
+                    for tok, eid, rel in graph.event_binding_relations
+                    if tok == token and rel == relation
+                )
+
+
+def test_indexed_queries_match_edge_scans():
+    graph = _seeded_graph()
+    _assert_matches_scan(graph)
+    assert -1 in graph.events_for_concept(TOKENS[0], "part_of")
+
+
+def test_indexes_survive_snapshot_round_trip_and_rebuild():
+    graph = _seeded_graph()
+    restored = ConceptGraph(graph.eventlog)
+    restored._load_state(json.loads(json.dumps(graph._dump_state())))
+    _assert_matches_scan(restored)
+
+    graph.rebuild([])
+    assert graph.neighbors(TOKENS[0]) == []
+    assert graph.events_for_concept(TOKENS[0], "evidence") == []
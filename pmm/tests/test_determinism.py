@@ -19,3 +19,17 @@ def test_reproducible_ledger(tmp_path):
     seq1 = run_loop_dummy(str(tmp_path / "run1.db"))
     seq2 = run_loop_dummy(str(tmp_path / "run2.db"))
     assert seq1 == seq2
+
+
+def run_managed_loop_dummy(db_path: str) -> list[str]:
+    log = EventLog(db_path)
+    loop = RuntimeLoop(eventlog=log, adapter=DummyAdapter(), autonomy=False)
+    loop.run_turn("hello determinism")
+    loop.run_turn("tell me more")
+    return log.hash_sequence()
+
+
+def test_reproducible_managed_ledger(tmp_path):
+    seq1 = run_managed_loop_dummy(str(tmp_path / "run1.db"))
+    seq2 = run_managed_loop_dummy(str(tmp_path / "run2.db"))
+    assert seq1 == seq2
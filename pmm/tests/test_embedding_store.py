@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.event_log import EventLog
+from pmm.retrieval.embedding_store import EmbeddingStore
+from pmm.retrieval.vector import (
+    DeterministicEmbedder,
+    build_embedding_content,
+    build_index,
+    cosine,
+    ensure_embedding_for_event,
+    select_by_vector,
+)
+
+
+def _seed(log: EventLog, texts, *, dims: int = 16):
+    ids = []
+    for text in texts:
+        eid = log.append(kind="user_message", content=text, meta={})
+        log.append(
+            kind="embedding_add",
+            content=build_embedding_content(
+                event_id=eid, text=text, model="hash64", dims=dims
+            ),
+            meta={},
+        )
+        ids.append(eid)
+    return ids
+
+
+def test_store_matches_build_index_and_tracks_appends():
+    log = EventLog(":memory:")
+    ids = _seed(log, ["alpha beta", "gamma", "delta epsilon zeta"])
+    store = EmbeddingStore(log)
+
+    assert store.index(model="hash64", dims=16) == build_index(
+        log.read_all(), model="hash64", dims=16
+    )
+    assert store.has(ids[0], model="hash64", dims=16)
+    assert not store.has(ids[0], model="hash64", dims=64)
+    assert not store.has(ids[0], model="other", dims=16)
+
+    (late,) = _seed(log, ["late text"])
+    assert store.has(late, model="hash64", dims=16)
+    assert len(store.matrix("hash64", 16)) == 4
+
+
+def test_store_ignores_malformed_records_and_replaces_duplicates():
+    log = EventLog(":memory:")
+    log.append(kind="embedding_add", content="not json", meta={})
+    log.append(
+        kind="embedding_add",
+        content=json.dumps(
+            {"event_id": 1, "model": "hash64", "dims": 2, "vector": [1]}
+        ),
+        meta={},
+    )
+    for scale, vec in ((0.5, [1, 2]), (0.25, [3, 4])):
+        log.append(
+            kind="embedding_add",
+            content=json.dumps(
+                {
+                    "event_id": 7,
+                    "model": "hash64",
+                    "dims": 2,
+                    "scale": scale,
+                    "vector": vec,
+                }
+            ),
+            meta={},
+        )
+    store = EmbeddingStore(log)
+
+    assert not store.has(1, model="hash64", dims=2)
+    assert store.vector(7, model="hash64", dims=2) == [0.75, 1.0]
+    assert len(store.matrix("hash64", 2)) == 1
+
+
+def test_matrix_scores_equal_dequantized_cosine():
+    log = EventLog(":memory:")
+    ids = _seed(log, ["apples and pears", "oranges", "apples again"], dims=32)
+    store = EmbeddingStore(log)
+    query = DeterministicEmbedder(dims=32).embed("apples")
+
+    scores = store.scores(query, model="hash64", dims=32)
+    index = build_index(log.read_all(), model="hash64", dims=32)
+    assert set(scores) == set(ids)
+    for eid in ids:
+        assert scores[eid] == pytest.approx(cosine(query, index[eid]), abs=1e-12)
+    subset = store.scores(query, model="hash64", dims=32, ids=[ids[1], 999])
+    assert set(subset) == {ids[1]}
+
+
+def test_select_by_vector_uses_stored_rows_and_embeds_the_rest():
+    log = EventLog(":memory:")
+    ids = _seed(log, ["apples and pears", "oranges"], dims=64)
+    extra = log.append(kind="assistant_message", content="apples", meta={})
+    store = EmbeddingStore(log)
+    events = log.read_all()
+
+    got_ids, got_scores = select_by_vector(
+        events=events, query_text="apples", limit=3, store=store
+    )
+    exact_ids, exact_scores = select_by_vector(
+        events=events, query_text="apples", limit=3
+    )
+    assert got_ids == exact_ids
+    assert got_ids[0] == extra
+    assert got_scores[0] == exact_scores[0]
+    for got, exact in zip(got_scores[1:], exact_scores[1:]):
+        assert got == pytest.approx(exact, abs=0.02)
+    assert set(got_ids[1:]) == set(ids)
+
+
+def test_ensure_embedding_uses_store_for_existence():
+    log = EventLog(":memory:")
+    (eid,) = _seed(log, ["hello"], dims=64)
+    store = EmbeddingStore(log)
+
+    ensure_embedding_for_event(
+        events=[],
+        eventlog=log,
+        event_id=eid,
+        text="hello",
+        model="hash64",
+        dims=16,
+        store=store,
+    )
+    before = log.count()
+    ensure_embedding_for_event(
+        events=[],
+        eventlog=log,
+        event_id=eid,
+        text="hello",
+        model="hash64",
+        dims=64,
+        store=store,
+    )
+    ensure_embedding_for_event(
+        events=[],
+        eventlog=log,
+        event_id=eid,
+        text="hello",
+        model="hash64",
+        dims=16,
+        store=store,
+    )
+    assert log.count() == before
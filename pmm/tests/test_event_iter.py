@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import pytest
+
+from pmm.core.event_log import EventLog, EventRow
+
+
+def _seed(log: EventLog, n: int) -> None:
+    for i in range(n):
+        kind = "user_message" if i % 2 == 0 else "assistant_message"
+        log.append(kind=kind, content=f"m{i}", meta={"i": i})
+
+
+def test_iter_events_matches_read_all_across_batches():
+    log = EventLog(":memory:")
+    _seed(log, 7)
+
+    rows = list(log.iter_events(batch_size=3))
+
+    assert all(isinstance(row, EventRow) for row in rows)
+    assert [row.to_dict() for row in rows] == log.read_all()
+    assert rows[0] == log.read_all()[0]
+
+
+def test_iter_events_range_and_kind_filters():
+    log = EventLog(":memory:")
+    _seed(log, 10)
+
+    ids = [row["id"] for row in log.iter_events(3, end_id=8, batch_size=2)]
+    assert ids == [3, 4, 5, 6, 7, 8]
+
+    users = list(log.iter_events(kinds=["user_message"], batch_size=2))
+    assert [row["id"] for row in users] == [1, 3, 5, 7, 9]
+    assert list(log.iter_events(kinds=[])) == []
+
+
+def test_iter_events_columns_and_lazy_meta():
+    log = EventLog(":memory:")
+    _seed(log, 2)
+
+    row = next(log.iter_events(columns=["kind"]))
+    assert set(row) == {"id", "kind"}
+    assert row.get("content") is None
+    with pytest.raises(KeyError):
+        row["meta"]
+
+    full = next(log.iter_events())
+    assert full["meta"] == {"i": 0}
+    assert full["meta"] is full["meta"]
+
+    with pytest.raises(ValueError):
+        next(log.iter_events(columns=["bogus"]))
+    with pytest.raises(ValueError):
+        next(log.iter_events(batch_size=0))
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.event_log import EventLog
+
+
+def _chain_ok(events) -> bool:
+    return all(
+        events[i]["prev_hash"] == events[i - 1]["hash"] for i in range(1, len(events))
+    )
+
+
+def test_batch_commits_once_and_delivers_in_order(tmp_path):
+    log = EventLog(str(tmp_path / "batch.db"))
+    seen: list[int] = []
+    log.register_listener(lambda ev: seen.append(ev["id"]))
+    statements: list[str] = []
+    log._conn.set_trace_callback(statements.append)
+
+    with log.batch():
+        ids = [
+            log.append(kind="test_event", content=f"e{i}", meta={}) for i in range(3)
+        ]
+        log.append_commitment_open(content="c", meta={"cid": "c1"})
+        assert seen == []
+    log._conn.set_trace_callback(None)
+
+    assert seen == ids + [4]
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert sum("FROM pmm_writer_lease" in s for s in statements) == 1
+    assert _chain_ok(log.read_all())
+    log.close()
+
+
+def test_batch_keeps_completed_appends_and_failure_records(tmp_path):
+    log = EventLog(str(tmp_path / "policy.db"))
+    log.append(
+        kind="config",
+        content=json.dumps({"type": "policy", "forbid_sources": {"cli": ["config"]}}),
+        meta={"source": "handshake"},
+    )
+    with pytest.raises(PermissionError):
+        with log.batch():
+            log.append(kind="test_event", content="kept", meta={})
+            log.append(kind="config", content="{}", meta={"source": "cli"})
+
+    kinds = [e["kind"] for e in log.read_all()]
+    assert kinds == ["config", "test_event", "violation"]
+    # The log remains usable and chained after the failed batch.
+    log.append(kind="test_event", content="after", meta={})
+    assert _chain_ok(log.read_all())
+    log.close()
+
+
+def test_rejected_append_rolls_back_only_its_savepoint():
+    log = EventLog(":memory:")
+    with log.batch():
+        log.append(kind="test_event", content="a", meta={})
+        with pytest.raises(ValueError):
+            log.append(kind="commitment_close", content="x", meta={"cid": "nope"})
+        with log.batch():
+            log.append(kind="test_event", content="b", meta={})
+
+    assert [e["content"] for e in log.read_all()] == ["a", "b"]
+    assert _chain_ok(log.read_all())
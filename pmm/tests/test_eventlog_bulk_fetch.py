@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_eventlog_bulk_fetch.py
+"""get_many/exists_many fetch events in chunked statements behind a hot LRU."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from pmm.core import event_log as event_log_module
+from pmm.core.event_log import EventLog
+from pmm.runtime.context_renderer import _render_evidence
+
+
+def _fill(log: EventLog, count: int) -> None:
+    for i in range(count):
+        log.append(kind="user_message", content=f"m{i}", meta={"n": i})
+
+
+@contextmanager
+def _statements(log: EventLog):
+    seen = []
+    log._conn.set_trace_callback(
+        lambda sql: seen.append(sql) if sql.lstrip().startswith("SELECT") else None
+    )
+    try:
+        yield seen
+    finally:
+        log._conn.set_trace_callback(None)
+
+
+def test_get_many_matches_get_and_omits_missing_ids():
+    log = EventLog(":memory:")
+    _fill(log, 30)
+    wanted = [29, 3, 3, 17, 999, 0, -4]
+    fetched = log.get_many(wanted)
+    assert list(fetched) == [3, 17, 29]
+    for event_id, event in fetched.items():
+        assert event == log.get(event_id)
+    assert log.exists_many(wanted) == {3, 17, 29}
+    assert log.get_many([]) == {}
+    assert log.exists_many([]) == set()
+
+
+def test_large_requests_are_chunked_and_repeats_skip_sqlite(monkeypatch):
+    monkeypatch.setattr(event_log_module, "_BULK_FETCH_CHUNK", 40)
+    log = EventLog(":memory:")
+    _fill(log, 130)
+    with _statements(log) as seen:
+        first = log.get_many(range(1, 131))
+    assert len(seen) == 4
+    with _statements(log) as seen:
+        again = log.get_many(range(1, 131))
+    assert seen == []
+    assert again == first
+
+    # Callers may mutate what they get back without corrupting the LRU.
+    again[5]["meta"]["n"] = "changed"
+    assert log.get_many([5])[5]["meta"] == {"n": 4}
+
+
+def test_rows_read_inside_an_open_write_are_not_cached():
+    log = EventLog(":memory:")
+    _fill(log, 2)
+    with log.batch():
+        new_id = log.append(kind="user_message", content="pending", meta={})
+        assert log.get_many([new_id])[new_id]["content"] == "pending"
+        assert new_id not in log._hot_events
+    assert log.get_many([new_id])[new_id]["content"] == "pending"
+    assert new_id in log._hot_events
+
+
+def test_evidence_rendering_uses_one_statement():
+    log = EventLog(":memory:")
+    _fill(log, 240)
+    with _statements(log) as seen:
+        text = _render_evidence(list(range(1, 241)), log)
+    assert len(seen) == 1
+    assert text.count("\n[") == 240
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_kernel_ledger_state.py
+"""AutonomyKernel ticks consult incremental ledger state, not full reads."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from pmm.core.commitment_manager import CommitmentManager
+from pmm.core.event_log import EventLog
+from pmm.runtime.autonomy_kernel import AutonomyKernel
+from pmm.runtime.kernel_state import KernelLedgerState
+
+
+def _populate(log: EventLog, steps: int, seed: int = 1) -> None:
+    rng = random.Random(seed)
+    manager = CommitmentManager(log)
+    for step in range(steps):
+        roll = rng.random()
+        if roll < 0.3:
+            log.append(kind="user_message", content=f"u{step}", meta={})
+        elif roll < 0.5:
+            log.append(kind="assistant_message", content=f"a{step}", meta={})
+        elif roll < 0.6:
+            manager.open_commitment(f"task {rng.randint(0, 4)}", source="user")
+        elif roll < 0.65:
+            manager.open_internal(AutonomyKernel.INTERNAL_GOAL_ANALYZE_GAPS)
+        elif roll < 0.7:
+            log.append(kind="metrics_turn", content="m", meta={})
+        elif roll < 0.75:
+            log.append(kind="summary_update", content="{}", meta={})
+        elif roll < 0.85:
+            decision = rng.choice(["idle", "reflect", "index"])
+            log.append(
+                kind="autonomy_tick",
+                content=json.dumps({"decision": decision}),
+                meta={"source": "autonomy_kernel"},
+            )
+        else:
+            log.append(
+                kind="reflection",
+                content=json.dumps({"intent": "x"}),
+                meta={"source": "autonomy_kernel"},
+            )
+
+
+def _replayed(events) -> KernelLedgerState:
+    state = KernelLedgerState(goals=(AutonomyKernel.INTERNAL_GOAL_ANALYZE_GAPS,))
+    for event in events:
+        state.observe(event)
+    return state
+
+
+def test_incremental_state_matches_replay_and_brute_force():
+    log = EventLog(":memory:")
+    _populate(log, 40)
+    kernel = AutonomyKernel(log)
+    _populate(log, 200, seed=2)
+    state = kernel._sync_state()
+    events = log.read_all()
+    replayed = _replayed(events)
+
+    assert state.counts == replayed.counts
+    assert state.event_count == len(events)
+    assert state.last_event_id == events[-1]["id"]
+    ticks = [e for e in events if e["kind"] == "autonomy_tick"]
+    assert state.count("autonomy_tick") == len(ticks)
+    assert state.idle_ticks == sum(
+        json.loads(e["content"])["decision"] == "idle" for e in ticks
+    )
+    assert (
+        state.last("summary_update")
+        == [e for e in events if e["kind"] == "summary_update"][-1]
+    )
+    assert state.recent(50) == events[-50:]
+    messages = [e["id"] for e in events if e["kind"].endswith("_message")]
+    assert list(state.message_ids) == messages
+    assert state.message_ids_before(messages[-1], 3) == messages[-4:-1]
+    users = [e["id"] for e in events if e["kind"] == "user_message"]
+    assert state.last_user_message_before(users[-1] + 1) == users[-1]
+    assert state.last_user_message_before(users[0]) is None
+    tail = events[-200:]
+    for kind in ("metrics_turn", "summary_update", "missing"):
+        found = [e for e in tail if e["kind"] == kind]
+        assert state.last_within(kind, 200) == (found[-1] if found else None)
+    gap_goal = AutonomyKernel.INTERNAL_GOAL_ANALYZE_GAPS
+    assert state.open_goal(gap_goal) == replayed.open_goal(gap_goal)
+
+
+def test_ticks_do_not_read_the_whole_ledger():
+    log = EventLog(":memory:")
+    _populate(log, 300)
+    kernel = AutonomyKernel(log)
+
+    def _forbidden():
+        raise AssertionError("read_all() during an autonomy tick")
+
+    log.read_all = _forbidden
+    for _ in range(3):
+        decision = kernel.decide_next_action()
+        log.append(
+            kind="autonomy_tick",
+            content=json.dumps(decision.as_dict()),
+            meta={"source": "autonomy_kernel"},
+        )
+        kernel._maybe_emit_autonomy_metrics()
+        kernel._maybe_append_checkpoint(M=1)
+        kernel._maybe_tune_thresholds()
+        kernel._maybe_emit_coherence_check()
+        kernel._maybe_emit_policy_update()
+        kernel._maintain_embeddings()
+        kernel._verify_recent_selections()
+    assert kernel._sync_state().count("autonomy_tick") > 0
+    # Embedding backfill fetched the missing messages by id.
+    assert kernel._sync_state().count("embedding_add") > 0
@@ -1,14 +1,24 @@
 # SPDX-License-Identifier: PMM-1.0
 # Copyright (c) 2025 Scott O'Nanski
 
+import functools
 import os
 import subprocess
 import threading
 import time
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
-from pmm.runtime.mcp_server import pmm_turn
+from pmm.core.event_log import EventLog
+from pmm.core.writer_session import WriterOwnershipError
+from pmm.runtime import mcp_server
+from pmm.runtime.mcp_server import AdmissionQueue, pmm_turn
+from pmm.runtime.oneshot_cli import build_turn_loop
+
+
+def _turn(**kwargs):
+    return anyio.run(functools.partial(pmm_turn, **kwargs))
 
 
 def test_pmm_turn_success():
@@ -24,7 +34,7 @@ def test_pmm_turn_success():
             os.environ, {"PMM_MCP_DB": "/path/to/pmm.db", "PMM_MCP_MODEL": "ornith:9b"}
         ),
     ):
-        result = pmm_turn(prompt="Hello", model=None, include_events=False)
+        result = _turn(prompt="Hello", model=None, include_events=False)
 
         assert result["assistant"] == "Bridge online"
         assert mock_run.called
@@ -51,7 +61,7 @@ def test_pmm_turn_model_override():
         patch.dict(os.environ, {"PMM_MCP_DB": "/path/to/pmm.db"}),
     ):
         # Override model explicitly
-        pmm_turn(prompt="Test", model="openai:gpt-4", include_events=True)
+        _turn(prompt="Test", model="openai:gpt-4", include_events=True)
 
         args, kwargs = mock_run.call_args
         cmd = kwargs.get("args") or args[0]
@@ -68,7 +78,7 @@ def test_pmm_turn_forwards_explicit_output_budget():
         patch("subprocess.run", mock_run),
         patch.dict(os.environ, {"PMM_MCP_DB": "/path/to/pmm.db"}),
     ):
-        pmm_turn(prompt="Test", output_budget_tokens=32)
+        _turn(prompt="Test", output_budget_tokens=32)
 
     cmd = mock_run.call_args.args[0]
     assert cmd[cmd.index("--output-budget-tokens") + 1] == "32"
@@ -80,7 +90,7 @@ def test_pmm_turn_rejects_invalid_output_budget_before_subprocess():
         patch.dict(os.environ, {"PMM_MCP_DB": "/path/to/pmm.db"}),
         pytest.raises(ValueError, match="positive integer"),
     ):
-        pmm_turn(prompt="Test", output_budget_tokens=0)
+        _turn(prompt="Test", output_budget_tokens=0)
     run.assert_not_called()
 
 
@@ -99,7 +109,7 @@ def test_pmm_turn_leaves_environment_output_budget_for_child_resolution():
             },
         ),
     ):
-        pmm_turn(prompt="Test")
+        _turn(prompt="Test")
 
     cmd = mock_run.call_args.args[0]
     assert "--output-budget-tokens" not in cmd
@@ -110,7 +120,7 @@ def test_pmm_turn_missing_env():
         with pytest.raises(
             ValueError, match="Environment variable PMM_MCP_DB is required"
         ):
-            pmm_turn(prompt="Test")
+            _turn(prompt="Test")
 
 
 def test_pmm_turn_nonzero_exit():
@@ -125,7 +135,7 @@ def test_pmm_turn_nonzero_exit():
         with pytest.raises(
             RuntimeError, match="PMM turn failed \\(exit 1\\): database is locked"
         ):
-            pmm_turn(prompt="Test")
+            _turn(prompt="Test")
 
 
 def test_pmm_turn_malformed_json():
@@ -140,7 +150,7 @@ def test_pmm_turn_malformed_json():
         with pytest.raises(
             RuntimeError, match="Failed to parse PMM turn response as JSON"
         ):
-            pmm_turn(prompt="Test")
+            _turn(prompt="Test")
 
 
 def test_pmm_turn_timeout():
@@ -154,7 +164,7 @@ def test_pmm_turn_timeout():
         with pytest.raises(
             RuntimeError, match="PMM turn execution timed out after 240 seconds"
         ):
-            pmm_turn(prompt="Test")
+            _turn(prompt="Test")
 
 
 def test_pmm_turn_contention_is_rejected_without_hidden_waiting():
@@ -181,7 +191,7 @@ def test_pmm_turn_contention_is_rejected_without_hidden_waiting():
 
         def invoke():
             try:
-                pmm_turn(prompt="hello")
+                _turn(prompt="hello")
             except RuntimeError as exc:
                 errors.append(exc)
 
@@ -197,3 +207,153 @@ def test_pmm_turn_contention_is_rejected_without_hidden_waiting():
         assert max_concurrent == 1
         assert len(errors) == 4
         assert all("contender rejected" in str(error) for error in errors)
+
+
+@pytest.fixture
+def resident_env(tmp_path):
+    db_path = str(tmp_path / "resident.db")
+    with patch.dict(
+        os.environ,
+        {"PMM_MCP_DB": db_path, "PMM_MCP_MODEL": "dummy", "PMM_MCP_RESIDENT": "1"},
+    ):
+        try:
+            yield db_path
+        finally:
+            mcp_server.shutdown_resident_runtime()
+
+
+def test_resident_pmm_turn_reuses_warm_runtime_without_subprocess(resident_env):
+    with (
+        patch("subprocess.run") as run,
+        patch(
+            "pmm.runtime.oneshot_cli.build_turn_loop",
+            wraps=build_turn_loop,
+        ) as build,
+    ):
+        first = _turn(prompt="Hello", model="dummy")
+        second = _turn(prompt="Hello again", model="dummy")
+
+    run.assert_not_called()
+    assert build.call_count == 1
+    assert first["event_range"]["last"] < second["event_range"]["first"]
+    assert mcp_server._resident is not None and mcp_server._resident.warm
+
+
+def test_resident_runtime_holds_lease_until_shutdown(resident_env):
+    _turn(prompt="Hello", model="dummy")
+    with pytest.raises(WriterOwnershipError):
+        EventLog(resident_env, writer_role="contender")
+
+    mcp_server.shutdown_resident_runtime()
+    successor = EventLog(resident_env, writer_role="successor")
+    assert successor.read_tail(1)
+    successor.close()
+
+
+def test_resident_runtime_reopens_on_model_change(resident_env):
+    _turn(prompt="Hello", model="dummy")
+    first_log = mcp_server._resident._eventlog
+    _turn(prompt="Hello", model="dummy:")
+    assert mcp_server._resident._eventlog is not first_log
+    assert first_log._closed
+
+
+def test_resident_pmm_turn_rejects_empty_prompt(resident_env):
+    with pytest.raises(ValueError, match="Prompt cannot be empty"):
+        _turn(prompt="   ", model="dummy")
+
+
+def test_resident_turns_queue_off_the_event_loop(resident_env):
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def fake_run(self, *, prompt, **kwargs):
+        order.append(prompt)
+        started.set()
+        release.wait(5)
+        return {"prompt": prompt}
+
+    async def main():
+        results = []
+
+        async def turn(prompt):
+            results.append(await pmm_turn(prompt=prompt, model="dummy"))
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(turn, "first")
+            await anyio.to_thread.run_sync(started.wait, 5)
+            tg.start_soon(turn, "second")
+            # The loop keeps running while the second turn waits in the queue.
+            while not mcp_server._admission._waiting:
+                await anyio.sleep(0.001)
+            # Waiting for admission does not hold the resident lock.
+            assert mcp_server._resident_lock.acquire(timeout=1)
+            mcp_server._resident_lock.release()
+            release.set()
+        return results
+
+    with patch.object(mcp_server.ResidentRuntime, "run", fake_run):
+        results = anyio.run(main)
+    assert order == ["first", "second"]
+    assert results == [{"prompt": "first"}, {"prompt": "second"}]
+
+
+def test_resident_runtime_switches_databases_between_turns(resident_env, tmp_path):
+    _turn(prompt="Hello", model="dummy")
+    first = mcp_server._resident
+    other = str(tmp_path / "other.db")
+    with patch.dict(os.environ, {"PMM_MCP_DB": other}):
+        _turn(prompt="Hello", model="dummy")
+    assert mcp_server._resident.db_path == other
+    assert not first.warm
+
+
+def test_admission_queue_serializes_in_fifo_order_and_bounds_waiters():
+    queue = AdmissionQueue(depth=2)
+    release = threading.Event()
+    order = []
+    errors = []
+
+    def hold():
+        with queue.admit(5):
+            order.append("active")
+            release.wait(5)
+
+    def wait(label):
+        try:
+            with queue.admit(5):
+                order.append(label)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    while not order:
+        time.sleep(0.001)
+    waiters = []
+    for label in ("first", "second"):
+        t = threading.Thread(target=wait, args=(label,))
+        t.start()
+        waiters.append(t)
+        while len(queue._waiting) < len(waiters):
+            time.sleep(0.001)
+    wait("third")
+    release.set()
+    holder.join()
+    for t in waiters:
+        t.join()
+
+    assert order == ["active", "first", "second"]
+    assert errors == ["MCP admission queue full; contender rejected"]
+
+
+def test_admission_queue_times_out_waiters():
+    queue = AdmissionQueue(depth=1)
+    with queue.admit(1):
+        with pytest.raises(RuntimeError, match="admission timed out"):
+            with queue.admit(0.05):
+                pass
+    assert not queue._waiting
+    with queue.admit(0.05):
+        pass
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_meme_graph_episode_index.py
+"""Materialized MemeGraph episodes stay equal to on-demand reconstruction."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+
+
+def _events() -> list[dict]:
+    """Mixed explicit and legacy episodes with late reflections and reopens."""
+    rng = random.Random(5)
+    events: list[dict] = []
+    assistants: list[int] = []
+
+    def add(kind: str, content: str, meta: dict) -> int:
+        events.append(
+            {"id": len(events) + 1, "kind": kind, "content": content, "meta": meta}
+        )
+        return len(events)
+
+    for _ in range(80):
+        cid = f"c{rng.randint(0, 2)}"
+        roll = rng.random()
+        if roll < 0.3:
+            assistants.append(
+                add("assistant_message", f"COMMIT: task {cid}\nCLOSE: {cid}", {})
+            )
+        elif roll < 0.5:
+            meta = {"cid": cid, "text": f"task {cid}"}
+            if assistants and rng.random() < 0.5:
+                meta["origin_event_id"] = rng.choice(assistants)
+            add("commitment_open", f"Commitment opened: task {cid}", meta)
+        elif roll < 0.7:
+            meta = {"cid": cid}
+            if assistants and rng.random() < 0.5:
+                meta["origin_event_id"] = assistants[-1]
+            add("commitment_close", f"Commitment closed: {cid}", meta)
+        elif assistants:
+            add("reflection", "{}", {"about_event": rng.choice(assistants)})
+    return events
+
+
+def _scan_episodes_for_event(graph: MemeGraph, event_id: int):
+    found = []
+    for cid in graph.cids_for_event(event_id):
+        opens = sorted(
+            node
+            for node, data in graph.graph.nodes(data=True)
+            if data["kind"] == "commitment_open" and data.get("cid") == cid
+        )
+        for open_id in opens:
+            episode = graph._episode_for_open_locked(open_id)
+            if episode is not None and event_id in episode.event_ids:
+                found.append(episode)
+    return sorted(found, key=lambda episode: episode.open_event_id)
+
+
+def _assert_table_fresh(graph: MemeGraph, events) -> None:
+    for event in events:
+        eid = event["id"]
+        if event["kind"] == "commitment_open":
+            assert graph.episode_for_open(eid) == graph._episode_for_open_locked(eid)
+        assert graph.episodes_for_event(eid) == _scan_episodes_for_event(graph, eid)
+    for cid in ("c0", "c1", "c2", "c3", "c4", "missing"):
+        history = graph.history_for_cid(cid)
+        assert [e.open_event_id for e in history] == sorted(
+            e.open_event_id for e in history
+        )
+        assert graph.current_episode_for_cid(cid) == (history[-1] if history else None)
+
+
+def test_incremental_table_matches_reconstruction_after_every_event():
+    events = _events()
+    graph = MemeGraph(EventLog(":memory:"))
+    for position, event in enumerate(events):
+        graph.add_event(event)
+        if position % 10 == 0:
+            _assert_table_fresh(graph, events[: position + 1])
+    _assert_table_fresh(graph, events)
+    assert any(
+        episode.status == "closed" and episode.reflection_event_ids
+        for episode in graph._episodes.values()
+    )
+
+
+def test_rebuild_and_snapshot_load_materialize_the_same_table():
+    events = _events()
+    log = EventLog(":memory:")
+    live = MemeGraph(log)
+    for event in events:
+        live.add_event(event)
+
+    rebuilt = MemeGraph(log)
+    rebuilt.rebuild(events)
+    restored = MemeGraph(log)
+    restored._load_state(json.loads(json.dumps(live._dump_state())))
+
+    assert rebuilt._episodes == live._episodes
+    assert restored._episodes == live._episodes
+    assert restored._episodes_by_event == live._episodes_by_event
+    assert live.episode_for_open(True) is None
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_meme_graph_node_attributes.py
+"""MemeGraph queries read captured node attributes instead of the ledger."""
+
+from __future__ import annotations
+
+import json
+
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+
+
+def _ledger() -> EventLog:
+    log = EventLog(":memory:")
+    for cid, text in (("c1", "finish the audit"), ("c2", "write the report")):
+        assistant = log.append(
+            kind="assistant_message",
+            content=f"Working.\nCOMMIT: {text}",
+            meta={"role": "assistant"},
+        )
+        log.append(
+            kind="commitment_open",
+            content=f"Commitment opened: {text}",
+            meta={
+                "cid": cid,
+                "origin": "assistant",
+                "source": "assistant",
+                "text": text,
+                "origin_event_id": assistant,
+            },
+        )
+        log.append(
+            kind="reflection",
+            content="{}",
+            meta={"about_event": assistant},
+        )
+    closer = log.append(
+        kind="assistant_message",
+        content="Done.\nCLOSE: c1",
+        meta={"role": "assistant"},
+    )
+    log.append(
+        kind="commitment_close",
+        content="Commitment closed: c1",
+        meta={"cid": "c1", "source": "assistant", "origin_event_id": closer},
+    )
+    return log
+
+
+def _query_all(graph: MemeGraph):
+    ids = sorted(graph.graph.nodes)
+    return {
+        "cids": [graph.cids_for_event(eid) for eid in ids],
+        "containing": [graph.cids_containing_event(eid) for eid in ids],
+        "episodes": [graph.episodes_for_event(eid) for eid in ids],
+        "history": [graph.history_for_cid(cid) for cid in ("c1", "c2", "c3")],
+        "slices": [graph.get_thread_slice(cid) for cid in ("c1", "c2")],
+    }
+
+
+def test_queries_never_fetch_from_eventlog():
+    log = _ledger()
+    graph = MemeGraph(log)
+    graph.rebuild(log.read_all())
+
+    def _forbidden(event_id):
+        raise AssertionError(f"eventlog.get({event_id}) during a graph query")
+
+    log.get = _forbidden
+    results = _query_all(graph)
+
+    assert graph.eventlog_fetches_avoided > 0
+    (episode,) = results["history"][0]
+    assert episode.status == "closed"
+    assert episode.opening_origin.attribution == "explicit"
+    assert episode.closures[0].origin.attribution == "explicit"
+    assert len(episode.reflection_event_ids) == 1
+    assert results["history"][2] == []
+    open_c2 = graph.current_episode_for_cid("c2").open_event_id
+    assert results["cids"][sorted(graph.graph.nodes).index(open_c2)] == ["c2"]
+
+
+def test_snapshot_round_trip_preserves_captured_attributes():
+    log = _ledger()
+    graph = MemeGraph(log)
+    graph.rebuild(log.read_all())
+    expected = _query_all(graph)
+
+    restored = MemeGraph(log)
+    restored._load_state(json.loads(json.dumps(graph._dump_state())))
+    assert _query_all(restored) == expected
+    attrs = restored.graph.nodes[1]
+    assert attrs["commitments"] == ["finish the audit"]
+    assert "origin_event_id" not in restored.graph.nodes[3]
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_meme_graph_replay_indexes.py
+"""Legacy MemeGraph replay resolves links through indexes, not node scans."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+
+TEXTS = ["write tests", "ship docs", "fix bug"]
+
+
+def _legacy_events() -> list[dict]:
+    """Historical rows predating explicit provenance metadata."""
+    rng = random.Random(11)
+    events: list[dict] = []
+
+    def add(kind: str, content: str, meta: dict) -> None:
+        events.append(
+            {"id": len(events) + 1, "kind": kind, "content": content, "meta": meta}
+        )
+
+    for i in range(40):
+        add("user_message", f"turn {i}", {})
+        lines = [f"reply {i}"]
+        for text in rng.sample(TEXTS, rng.randint(0, 2)):
+            lines.append(f"COMMIT: {text}")
+        add("assistant_message", "\n".join(lines), {})
+        if rng.random() < 0.5:
+            text = rng.choice(TEXTS + ["never said"])
+            add(
+                "commitment_open",
+                f"Commitment opened: {text}",
+                {"cid": f"c{rng.randint(0, 3)}", "text": text},
+            )
+        if rng.random() < 0.3:
+            add(
+                "commitment_close",
+                "Commitment closed",
+                {"cid": f"c{rng.randint(0, 4)}"},
+            )
+    return events
+
+
+def _expected_edges(events):
+    """Brute-force oracle mirroring the historical per-event node scans."""
+    edges = set()
+    seen = []
+    for event in events:
+        eid, kind, meta = event["id"], event["kind"], event["meta"]
+        if kind == "assistant_message":
+            users = [e["id"] for e in seen if e["kind"] == "user_message"]
+            if users:
+                edges.add((eid, max(users), "replies_to"))
+        elif kind == "commitment_open":
+            for prior in reversed(seen):
+                if prior["kind"] == "assistant_message" and any(
+                    line.startswith("COMMIT:")
+                    and line.split("COMMIT:", 1)[1].strip() == meta["text"]
+                    for line in prior["content"].splitlines()
+                ):
+                    edges.add((eid, prior["id"], "commits_to"))
+                    break
+        elif kind == "commitment_close":
+            opens = [
+                e["id"]
+                for e in seen
+                if e["kind"] == "commitment_open" and e["meta"]["cid"] == meta["cid"]
+            ]
+            if opens:
+                edges.add((eid, max(opens), "closes"))
+        seen.append(event)
+    return edges
+
+
+def test_legacy_rebuild_matches_scan_oracle_without_eventlog_reads():
+    log = EventLog(":memory:")
+    events = _legacy_events()
+    graph = MemeGraph(log)
+    calls = []
+    original_get = log.get
+    log.get = lambda eid: calls.append(eid) or original_get(eid)
+
+    graph.rebuild(events)
+
+    assert calls == []
+    got = {(s, t, d["label"]) for s, t, d in graph.graph.edges(data=True)}
+    assert got == _expected_edges(events)
+    assert any(label == "commits_to" for _, _, label in got)
+    assert any(label == "closes" for _, _, label in got)
+
+
+def test_incremental_and_snapshot_paths_keep_indexes_consistent():
+    log = EventLog(":memory:")
+    events = _legacy_events()
+    live = MemeGraph(log)
+    for event in events[: len(events) // 2]:
+        live.add_event(event)
+
+    restored = MemeGraph(log)
+    restored._load_state(json.loads(json.dumps(live._dump_state())))
+    for event in events[len(events) // 2 :]:
+        live.add_event(event)
+        restored.add_event(event)
+
+    full = MemeGraph(log)
+    full.rebuild(events)
+    assert live._dump_state() == full._dump_state()
+    assert restored._dump_state() == full._dump_state()
+    for cid in ("c0", "c1", "c2", "c3", "c4"):
+        latest = [
+            e["id"]
+            for e in events
+            if e["kind"] == "commitment_open" and e["meta"]["cid"] == cid
+        ]
+        assert full._find_commitment_open_by_cid(cid) == (
+            max(latest) if latest else None
+        )
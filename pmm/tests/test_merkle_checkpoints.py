@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_merkle_checkpoints.py
+"""Checkpoint roots come from an incrementally maintained Merkle mountain range."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+
+import pytest
+
+from pmm.core import merkle
+from pmm.core.event_log import EventLog
+from pmm.runtime.autonomy_kernel import AutonomyKernel
+from pmm.runtime.cli import _handle_checkpoint
+
+
+def _fill(log: EventLog, count: int) -> None:
+    for i in range(count):
+        log.append(kind="user_message", content=f"m{i}", meta={})
+
+
+def _reference_root(hashes) -> str:
+    nodes = merkle.nodes_from_hashes(hashes)
+    return merkle.root_at(lambda level, index: nodes.get((level, index)), len(hashes))
+
+
+def test_stored_root_matches_reference_at_every_prefix():
+    log = EventLog(":memory:")
+    assert log.merkle_checkpoint()["root_hash"] == merkle.EMPTY_ROOT
+    _fill(log, 45)
+    hashes = [e["hash"] for e in log.read_all()]
+    for n in range(len(hashes) + 1):
+        checkpoint = log.merkle_checkpoint(n)
+        assert checkpoint["leaf_count"] == n
+        assert checkpoint["root_hash"] == _reference_root(hashes[:n])
+    assert log.merkle_checkpoint()["up_to_id"] == 45
+
+
+def test_inclusion_proofs_verify_and_reject_tampering():
+    log = EventLog(":memory:")
+    _fill(log, 23)
+    root = log.merkle_checkpoint(19)["root_hash"]
+    for event in log.read_up_to(19):
+        proof = log.inclusion_proof(event["id"], up_to_id=19)
+        assert proof.event_hash == event["hash"]
+        assert merkle.verify_inclusion(proof.as_dict(), root)
+        assert not merkle.verify_inclusion(
+            dict(proof.as_dict(), event_hash="0" * 64), root
+        )
+        if proof.siblings:
+            swapped = list(reversed(proof.siblings)) + ["0" * 64]
+            assert not merkle.verify_inclusion(
+                dict(proof.as_dict(), siblings=swapped[1:]), root
+            )
+    assert log.inclusion_proof(20, up_to_id=19) is None
+    assert log.inclusion_proof(999) is None
+
+
+def test_batched_appends_are_covered_even_when_the_block_raises():
+    log = EventLog(":memory:")
+    _fill(log, 5)
+    with pytest.raises(RuntimeError):
+        with log.batch():
+            _fill(log, 4)
+            raise RuntimeError("abort")
+    with log.batch():
+        _fill(log, 7)
+    hashes = [e["hash"] for e in log.read_all()]
+    assert len(hashes) == 16
+    assert log.merkle_checkpoint()["root_hash"] == _reference_root(hashes)
+    stored = log._conn.execute("SELECT COUNT(*) FROM pmm_merkle_nodes").fetchone()[0]
+    assert stored == len(merkle.nodes_from_hashes(hashes))
+
+
+def test_ledger_without_tables_is_backfilled_or_hashed_in_memory(tmp_path):
+    path = tmp_path / "ledger.db"
+    log = EventLog(str(path))
+    _fill(log, 30)
+    expected = log.merkle_checkpoint(17)
+    log.close()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE pmm_merkle_nodes")
+    conn.execute("DROP TABLE pmm_merkle_leaves")
+    conn.commit()
+    conn.close()
+
+    reader = EventLog(str(path), mode="reader")
+    assert reader.merkle_checkpoint(17) == expected
+    proof = reader.inclusion_proof(3, up_to_id=17)
+    assert merkle.verify_inclusion(proof, expected["root_hash"])
+    reader.close()
+
+    reopened = EventLog(str(path))
+    assert reopened.merkle_checkpoint(17) == expected
+
+
+def test_manifests_carry_merkle_root_and_legacy_manifests_still_verify():
+    log = EventLog(":memory:")
+    _fill(log, 12)
+    summary_id = log.append(
+        kind="summary_update", content=json.dumps({"rsm_triggered": True}), meta={}
+    )
+    kernel = AutonomyKernel(log)
+    kernel._maybe_append_checkpoint(M=1)
+    manifest = log.last_of_kind("checkpoint_manifest")
+    data = json.loads(manifest["content"])
+    assert data["up_to_id"] == summary_id
+    assert data["root_scheme"] == merkle.MERKLE_SCHEME
+    assert data["leaf_count"] == summary_id
+    assert log.verify_checkpoint(manifest)
+    assert _handle_checkpoint(log) == "No change (idempotent)"
+
+    hashes = [e["hash"] for e in log.read_up_to(summary_id)]
+    legacy = {
+        "up_to_id": summary_id,
+        "covers": ["rsm_state", "open_commitments"],
+        "root_hash": hashlib.sha256(
+            json.dumps(hashes, separators=(",", ":")).encode("utf-8")
+        ).hexdigest(),
+    }
+    assert log.verify_checkpoint(legacy)
+    assert not log.verify_checkpoint(dict(data, root_hash=legacy["root_hash"]))
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_open_commitments_table.py
+"""The open-commitment side table tracks lifecycle events transactionally."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+
+from pmm.core.commitment_manager import CommitmentManager
+from pmm.core.event_log import EventLog
+from pmm.runtime.autonomy_kernel import _unclosed_opens
+
+
+def _replayed_open_ids(log: EventLog) -> list[int]:
+    opens: dict[str, int] = {}
+    for event in log.read_all():
+        cid = (event.get("meta") or {}).get("cid")
+        if not isinstance(cid, str) or not cid:
+            continue
+        if event["kind"] == "commitment_open":
+            opens[cid] = event["id"]
+        elif event["kind"] == "commitment_close":
+            opens.pop(cid, None)
+    return sorted(opens.values())
+
+
+def _churn(log: EventLog, seed: int = 11) -> CommitmentManager:
+    rng = random.Random(seed)
+    manager = CommitmentManager(log)
+    for step in range(60):
+        roll = rng.random()
+        if roll < 0.4:
+            manager.open_commitment(f"task {rng.randint(0, 6)}", source="user")
+        elif roll < 0.6:
+            manager.open_internal(f"goal {rng.randint(0, 3)}")
+        elif roll < 0.85:
+            opens = manager.get_open_commitments()
+            if opens:
+                cid = rng.choice(opens)["meta"]["cid"]
+                manager.close_commitment(cid, source="user")
+        else:
+            log.append(kind="user_message", content=f"m{step}", meta={})
+    return manager
+
+
+def test_table_matches_replay_and_filters_by_origin_goal(tmp_path):
+    log = EventLog(str(tmp_path / "ledger.db"))
+    manager = _churn(log)
+
+    opens = log.open_commitments()
+    assert [e["id"] for e in opens] == _replayed_open_ids(log)
+    assert manager.get_open_commitments() == opens
+    internal = manager.get_open_commitments(origin="autonomy_kernel")
+    assert internal and all(e["meta"]["origin"] == "autonomy_kernel" for e in internal)
+    goal = internal[0]["meta"]["goal"]
+    assert manager._find_open_commitment(("autonomy_kernel", goal)) == internal[0]
+    assert manager.open_internal(goal) == internal[0]["meta"]["cid"]
+    assert log.open_commitments(cid=internal[0]["meta"]["cid"]) == [internal[0]]
+
+    # Reopening after the table is dropped backfills it from history.
+    with log._lock:
+        log._conn.execute("DROP TABLE pmm_open_commitments")
+        log._conn.commit()
+    log.close()
+    reopened = EventLog(str(tmp_path / "ledger.db"))
+    assert reopened.open_commitments() == opens
+
+
+def test_read_only_ledger_without_table_falls_back_to_replay(tmp_path):
+    path = tmp_path / "ledger.db"
+    log = EventLog(str(path))
+    _churn(log, seed=4)
+    expected = log.open_commitments(origin="user")
+    log.close()
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE pmm_open_commitments")
+    conn.commit()
+    conn.close()
+
+    reader = EventLog(str(path), mode="reader")
+    assert reader.open_commitments(origin="user") == expected
+
+
+def test_kernel_unclosed_opens_match_quadratic_definition():
+    rng = random.Random(2)
+    events = []
+    for eid in range(1, 400):
+        kind = rng.choice(["commitment_open", "commitment_close", "user_message"])
+        meta = {"cid": rng.choice(["a", "b", "c", None])} if rng.random() < 0.9 else {}
+        events.append({"id": eid, "kind": kind, "meta": meta})
+    expected = [
+        (e, sum(1 for later in events if later["id"] > e["id"]))
+        for e in events
+        if e["kind"] == "commitment_open"
+        and not any(
+            c["kind"] == "commitment_close"
+            and c.get("meta", {}).get("cid") == e.get("meta", {}).get("cid")
+            for c in events
+            if c["id"] > e["id"]
+        )
+    ]
+    assert expected
+    assert _unclosed_opens(events) == expected
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import pytest
+
+from pmm.coherence.claim_parser import ClaimTracker
+from pmm.core.commitment_manager import CommitmentManager
+from pmm.core.event_log import EventLog
+
+
+def test_cursor_folds_only_new_events_across_batches():
+    log = EventLog(":memory:")
+    for i in range(5):
+        log.append(kind="user_message", content=f"m{i}", meta={})
+    cursor = log.open_cursor("test.fold", batch_size=2)
+
+    seen = [e["id"] for e in cursor.poll()]
+    assert seen == [1, 2, 3, 4, 5]
+    assert cursor.poll() == []
+
+    log.append(kind="user_message", content="m5", meta={})
+    assert [e["id"] for e in cursor.poll()] == [6]
+    assert cursor.applied_through == 6
+
+
+def test_cursor_reoffers_event_whose_apply_raised():
+    log = EventLog(":memory:")
+    log.append(kind="user_message", content="a", meta={})
+    log.append(kind="user_message", content="b", meta={})
+    cursor = log.open_cursor("test.retry")
+
+    def fail_on_second(event):
+        if event["id"] == 2:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cursor.fold(fail_on_second)
+    assert cursor.applied_through == 1
+    assert [e["id"] for e in cursor.poll()] == [2]
+
+
+def test_cursor_watermarks_report_lowest_position_per_name():
+    log = EventLog(":memory:")
+    log.append(kind="user_message", content="a", meta={})
+    ahead = log.open_cursor("shared")
+    ahead.poll()
+    behind = log.open_cursor("shared")
+    other = log.open_cursor("other", applied_through=1)
+
+    assert log.cursor_watermarks() == {"other": 1, "shared": 0}
+    assert behind.applied_through == 0 and other.applied_through == 1
+
+    with pytest.raises(ValueError):
+        log.open_cursor("bad", batch_size=0)
+
+
+def test_commitment_manager_tracks_lifecycle_incrementally():
+    log = EventLog(":memory:")
+    manager = CommitmentManager(log)
+    cid = manager.open_internal("monitor_rsm")
+    assert [e["meta"]["cid"] for e in manager.get_open_commitments()] == [cid]
+
+    manager.close_internal(cid, outcome="done")
+    assert manager.get_open_commitments() == []
+    # Served by the EventLog open-commitment table, not a cursor replay.
+    assert log.open_commitments() == [] and manager._cursor.applied_through == 0
+
+
+def test_claim_tracker_accumulates_new_claims_only():
+    log = EventLog(":memory:")
+    tracker = ClaimTracker(log)
+    assert tracker.claims() == []
+    first_id = log.append(
+        kind="assistant_message",
+        content='ok\nCLAIM:identity={"domain": "name", "value": "Echo"}',
+        meta={},
+    )
+    assert [(c.event_id, c.value) for c in tracker.claims()] == [(first_id, "Echo")]
+
+    log.append(kind="user_message", content="hello", meta={})
+    second_id = log.append(
+        kind="assistant_message",
+        content='CLAIM:identity={"domain": "name", "value": "Nova"}',
+        meta={},
+    )
+    claims = tracker.claims()
+    assert [(c.event_id, c.value) for c in claims] == [
+        (first_id, "Echo"),
+        (second_id, "Nova"),
+    ]
+    assert tracker.claims() == claims
+    assert tracker._cursor.applied_through == second_id
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_projection_registry.py
+"""Per-turn helpers share listener-fed projections instead of replaying."""
+
+from __future__ import annotations
+
+import json
+
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+from pmm.core.mirror import RSM_MIRROR_PROJECTION, Mirror, shared_rsm_mirror
+from pmm.runtime.context_utils import render_graph_context
+from pmm.runtime.identity_summary import maybe_append_summary
+
+
+def _history(log: EventLog, count: int) -> None:
+    for i in range(count):
+        log.append(kind="user_message", content=f"who are you {i}", meta={})
+        log.append(kind="assistant_message", content=f"determinism {i}", meta={})
+        log.append(
+            kind="reflection",
+            content=json.dumps({"intent": f"reflect {i}"}),
+            meta={"source": "user_turn"},
+        )
+
+
+def _forbid_full_reads(log: EventLog) -> None:
+    def _read_all():
+        raise AssertionError("read_all() after the projection was shared")
+
+    log.read_all = _read_all
+
+
+def test_factory_instance_is_built_once_and_kept_current():
+    log = EventLog(":memory:")
+    assert log.projection(RSM_MIRROR_PROJECTION) is None
+    _history(log, 3)
+    built = []
+
+    def factory():
+        built.append(Mirror(log, enable_rsm=True, auto_rebuild=False))
+        return built[-1]
+
+    mirror = log.projection(RSM_MIRROR_PROJECTION, factory)
+    assert built == [mirror]
+    assert log.projection(RSM_MIRROR_PROJECTION, factory) is mirror
+    assert shared_rsm_mirror(log) is mirror
+    assert len(built) == 1
+
+    _forbid_full_reads(log)
+    committed = log.count()
+    with log.batch():
+        _history(log, 2)
+        # Batched rows may still roll back, so they are not delivered early.
+        assert log.projection(RSM_MIRROR_PROJECTION).last_event_id == committed
+    assert mirror.last_event_id == log.count()
+    del log.read_all
+    fresh = Mirror(log, enable_rsm=True)
+    assert mirror.rsm_snapshot() == fresh.rsm_snapshot()
+    assert mirror.open_commitments == fresh.open_commitments
+
+
+class _Contents:
+    def __init__(self) -> None:
+        self.rows = []
+
+    def rebuild(self, events) -> None:
+        self.rows = [(int(e["id"]), e["content"]) for e in events]
+
+    def sync(self, event) -> None:
+        self.rows.append((int(event["id"]), event["content"]))
+
+
+def test_rolled_back_batch_rows_never_reach_a_shared_projection():
+    log = EventLog(":memory:")
+    log.append(kind="user_message", content="x", meta={})
+    contents = log.projection("test.contents", _Contents)
+    try:
+        with log.batch():
+            log.append(kind="user_message", content="y", meta={})
+            assert log.projection("test.contents").rows == [(1, "x")]
+            raise KeyboardInterrupt
+    except KeyboardInterrupt:
+        pass
+    log.append(kind="user_message", content="z", meta={})
+    assert [event["content"] for event in log.read_all()] == ["x", "z"]
+    assert log.projection("test.contents") is contents
+    assert contents.rows == [(1, "x"), (2, "z")]
+
+
+def test_summary_and_graph_context_reuse_shared_projections():
+    log = EventLog(":memory:")
+    graph = MemeGraph(log)
+    log.rebuild_and_register_listener(
+        graph.rebuild,
+        graph.add_event,
+        name="runtime.memegraph",
+        projection=graph,
+    )
+    _history(log, 4)
+    assert maybe_append_summary(log)
+    expected_graph = render_graph_context(log, meme_graph=graph)
+
+    _forbid_full_reads(log)
+    _history(log, 4)
+    assert maybe_append_summary(log)
+    assert render_graph_context(log) == render_graph_context(log, meme_graph=graph)
+    assert expected_graph
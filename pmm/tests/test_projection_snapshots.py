@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+from pmm.adapters.dummy_adapter import DummyAdapter
+from pmm.core.concept_graph import ConceptGraph
+from pmm.core.event_log import EventLog, ProjectionSnapshot
+from pmm.core.meme_graph import MemeGraph
+from pmm.core.mirror import Mirror
+from pmm.runtime.loop import RuntimeLoop
+
+
+def _seed(path: str) -> None:
+    log = EventLog(path)
+    loop = RuntimeLoop(eventlog=log, adapter=DummyAdapter(), autonomy=False)
+    for text in ("hello", "COMMIT: write tests", "how are you"):
+        loop.run_turn(text)
+    log.close()
+
+
+def _states(loop: RuntimeLoop):
+    return (
+        loop.memegraph._dump_state(),
+        loop.mirror._dump_state(),
+        loop.concept_graph._dump_state(),
+    )
+
+
+def _full_replay(log: EventLog):
+    events = log.read_all()
+    memegraph = MemeGraph(log)
+    memegraph.rebuild([e for e in events if e["kind"] in MemeGraph.TRACKED_KINDS])
+    mirror = Mirror(log, auto_rebuild=False)
+    mirror.rebuild(events)
+    concept_graph = ConceptGraph(log)
+    concept_graph.rebuild(events)
+    return (
+        memegraph._dump_state(),
+        mirror._dump_state(),
+        concept_graph._dump_state(),
+    )
+
+
+def _snapshot_rows(log: EventLog):
+    return {
+        row["projection_name"]: int(row["applied_through"])
+        for row in log._conn.execute(
+            "SELECT projection_name, applied_through FROM pmm_projection_snapshots"
+        )
+    }
+
+
+def test_close_persists_snapshots_and_startup_catches_up(tmp_path):
+    path = str(tmp_path / "snap.db")
+    _seed(path)
+
+    log = EventLog(path)
+    stored = _snapshot_rows(log)
+    assert set(stored) == {
+        "runtime.memegraph",
+        "runtime.mirror",
+        "runtime.concept_graph",
+        "runtime.summary_index",
+    }
+    # Events appended after the snapshot must be caught up on restore.
+    log.append(kind="user_message", content="late", meta={})
+    loop = RuntimeLoop(eventlog=log, adapter=DummyAdapter(), autonomy=False)
+
+    assert _states(loop) == _full_replay(log)
+    assert all(r.snapshot_through > 0 for r in log._listeners if r.snapshot)
+    log.close()
+
+
+def test_tampered_snapshot_falls_back_to_full_replay(tmp_path):
+    path = str(tmp_path / "tamper.db")
+    _seed(path)
+
+    log = EventLog(path)
+    with log._lock:
+        log._conn.execute(
+            "UPDATE pmm_projection_snapshots SET payload = "
+            '\'{"nodes":[],"edges":[],"managed_pairs":[]}\' '
+            "WHERE projection_name = 'runtime.memegraph'"
+        )
+        log._conn.execute(
+            "UPDATE pmm_projection_snapshots SET anchor_hash = 'x' "
+            "WHERE projection_name = 'runtime.mirror'"
+        )
+    loop = RuntimeLoop(eventlog=log, adapter=DummyAdapter(), autonomy=False)
+
+    assert _states(loop) == _full_replay(log)
+    snapshot_through = {r.name: r.snapshot_through for r in log._listeners}
+    assert snapshot_through["runtime.memegraph"] == 0
+    assert snapshot_through["runtime.mirror"] == 0
+    assert snapshot_through["runtime.concept_graph"] > 0
+    log.close()
+
+
+def test_barrier_snapshot_spacing_grows_with_the_watermark():
+    log = EventLog(":memory:")
+    log.SNAPSHOT_INTERVAL = 10
+    seen = []
+    dumps = []
+
+    def dump():
+        dumps.append(len(seen))
+        return {"seen": list(seen)}
+
+    log.rebuild_and_register_listener(
+        lambda events: seen.extend(e["id"] for e in events),
+        lambda event: seen.append(event["id"]),
+        name="test.seen",
+        required=True,
+        snapshot=ProjectionSnapshot(version=1, dump=dump, load=lambda state: None),
+    )
+    for i in range(400):
+        log.append(kind="user_message", content=f"m{i}", meta={})
+        log.projection_barrier()
+    # Each dump is proportional to the watermark, so re-serializing on a
+    # fixed interval would be quadratic; doubling gaps keep it linear.
+    assert dumps == [10, 20, 40, 80, 160, 320]
+    log.close()
+    assert dumps[-1] == 400
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_rebuild_fast_bounded.py
+"""rebuild_fast seeks to its anchors and replays only the ledger tail."""
+
+from __future__ import annotations
+
+from pmm.core.event_log import EventLog
+from pmm.core.ledger_mirror import LedgerMirror
+from pmm.core.mirror import Mirror
+from pmm.core.rsm import RecursiveSelfModel
+from pmm.runtime.cli import _handle_checkpoint
+from pmm.runtime.identity_summary import maybe_append_summary
+
+
+def _history(log: EventLog, start: int, count: int) -> None:
+    for i in range(start, start + count):
+        log.append(kind="user_message", content=f"who are you {i}", meta={})
+        log.append(kind="assistant_message", content=f"determinism {i}", meta={})
+
+
+def _forbid_full_reads(log: EventLog) -> None:
+    def _read_all():
+        raise AssertionError("read_all() during rebuild_fast")
+
+    log.read_all = _read_all
+
+
+def test_rebuild_fast_matches_full_rebuild_without_reading_whole_ledger():
+    log = EventLog(":memory:")
+    _history(log, 0, 15)
+    assert maybe_append_summary(log)
+    assert "appended" in _handle_checkpoint(log)
+    _history(log, 15, 5)
+
+    # Concept metrics are derived from a full read; compare the RSM state itself.
+    full = Mirror(log, enable_rsm=True)
+    expected = full._rsm.snapshot(include_concept_metrics=False)
+    assert expected["uniqueness"]["through_id"] == log.count()
+    ledger_mirror = LedgerMirror(log, listen=False)
+    expected_ledger = ledger_mirror.rsm_snapshot()
+    _forbid_full_reads(log)
+
+    fast = Mirror(log, enable_rsm=True, auto_rebuild=False)
+    fast.rebuild_fast()
+    assert fast._rsm.snapshot(include_concept_metrics=False) == expected
+    ledger_mirror.rebuild_fast()
+    assert ledger_mirror.rsm_snapshot() == expected_ledger
+
+
+def test_restored_uniqueness_probes_the_ledger_for_prefix_collisions():
+    log = EventLog(":memory:")
+    _history(log, 0, 10)
+    events = log.read_all()
+    rsm = RecursiveSelfModel(eventlog=log)
+    rsm.load_snapshot({"uniqueness": {"through_id": 20, "events": 20, "prefixes": 20}})
+
+    # Reuses an 8-char prefix already in the restored range: not distinct.
+    rsm.observe(
+        {"id": 21, "kind": "test_event", "content": "", "hash": events[3]["hash"]}
+    )
+    assert rsm.snapshot()["uniqueness"] == {
+        "through_id": 21,
+        "events": 21,
+        "prefixes": 20,
+    }
+    assert rsm.behavioral_tendencies["uniqueness_emphasis"] == 9
+
+    rsm.observe({"id": 22, "kind": "test_event", "content": "", "hash": "f" * 64})
+    assert rsm.snapshot()["uniqueness"]["prefixes"] == 21
+    # Events at or before the restored range are not folded twice.
+    rsm.observe({"id": 5, "kind": "test_event", "content": "", "hash": "e" * 64})
+    assert rsm.snapshot()["uniqueness"]["events"] == 22
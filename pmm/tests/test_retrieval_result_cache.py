@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_retrieval_result_cache.py
+"""Retrieval results are reused until an appended event touches their inputs."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.concept_graph import ConceptGraph
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+from pmm.retrieval.pipeline import RetrievalConfig, run_retrieval_pipeline
+from pmm.retrieval.result_cache import RetrievalCache
+from pmm.runtime.loop import RuntimeLoop
+
+
+def _setup():
+    log = EventLog(":memory:")
+    mg = MemeGraph(log)
+    cg = ConceptGraph(log)
+    log.rebuild_and_register_listener(mg.rebuild, mg.add_event, name="test.mg")
+    log.rebuild_and_register_listener(cg.rebuild, cg.sync, name="test.cg")
+    log.append(
+        kind="concept_define",
+        content=json.dumps({"token": "topic.test", "concept_kind": "topic"}),
+        meta={},
+    )
+    log.append(kind="assistant_message", content="I commit.\n\nCOMMIT: X", meta={})
+    open_id = log.append(
+        kind="commitment_open", content="req", meta={"cid": "c1", "text": "X"}
+    )
+    log.append(
+        kind="concept_bind_event",
+        content=json.dumps({"event_id": open_id, "tokens": ["topic.test"]}),
+        meta={},
+    )
+    return log, mg, cg
+
+
+def _run(log, mg, cg, cache=None, query="what about X?"):
+    config = RetrievalConfig(
+        always_include_concepts=["topic.test"], dynamic_cap_growth=False
+    )
+    return run_retrieval_pipeline(
+        query_text=query,
+        eventlog=log,
+        concept_graph=cg,
+        meme_graph=mg,
+        config=config,
+        cache=cache,
+    )
+
+
+def test_unrelated_appends_keep_entries_and_touching_appends_evict():
+    log, mg, cg = _setup()
+    cache = RetrievalCache(maxsize=4)
+    first = _run(log, mg, cg, cache)
+    assert first.relevant_cids == ["c1"]
+    assert _run(log, mg, cg, cache) == first
+    assert cache.stats()["hits"] == 1
+
+    # Chatter that links to nothing the selection used leaves the entry valid.
+    log.append(kind="user_message", content="unrelated", meta={})
+    log.append(kind="test_event", content="noise", meta={})
+    assert _run(log, mg, cg, cache) == _run(log, mg, cg) == first
+    assert cache.stats()["hits"] == 2
+
+    # The returned result is a copy; callers cannot corrupt the entry.
+    _run(log, mg, cg, cache).event_ids.clear()
+    assert _run(log, mg, cg, cache) == first
+
+    # A new binding for a seed concept changes the selection.
+    bound = log.append(kind="user_message", content="bound", meta={})
+    log.append(
+        kind="concept_bind_event",
+        content=json.dumps({"event_id": bound, "tokens": ["topic.test"]}),
+        meta={},
+    )
+    fresh = _run(log, mg, cg, cache)
+    assert bound in fresh.event_ids
+    assert fresh == _run(log, mg, cg)
+    assert cache.stats()["invalidations"] == 1
+
+    # An event on a selected CID invalidates as well.
+    log.append(
+        kind="commitment_close", content="done", meta={"cid": "c1", "source": "user"}
+    )
+    assert _run(log, mg, cg, cache) == _run(log, mg, cg)
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_distinct_queries_are_separate_lru_entries():
+    log, mg, cg = _setup()
+    cache = RetrievalCache(maxsize=2)
+    for query in ("a", "b", "c"):
+        _run(log, mg, cg, cache, query=query)
+    assert len(cache) == 2
+    _run(log, mg, cg, cache, query="a")
+    assert cache.stats()["hits"] == 0
+    _run(log, mg, cg, cache, query="c")
+    assert cache.stats()["hits"] == 1
+    with pytest.raises(ValueError):
+        RetrievalCache(maxsize=0)
+
+
+class _Adapter:
+    def generate_reply(self, system_prompt: str, user_prompt: str) -> str:
+        return "OK"
+
+
+def test_turn_telemetry_reports_cache_counters_only_when_enabled():
+    log = EventLog(":memory:")
+    RuntimeLoop(eventlog=log, adapter=_Adapter(), autonomy=False).run_turn("hi")
+    assert "retrieval_cache" not in log.read_by_kind("metrics_turn")[-1]["meta"]
+
+    cache = RetrievalCache()
+    loop = RuntimeLoop(
+        eventlog=log, adapter=_Adapter(), autonomy=False, retrieval_cache=cache
+    )
+    loop.run_turn("hello there")
+    telemetry = log.read_by_kind("metrics_turn")[-1]["meta"]["retrieval_cache"]
+    assert telemetry["misses"] == 1
+    assert telemetry["hit"] is False
+    loop.run_turn("hello there")
+    telemetry = log.read_by_kind("metrics_turn")[-1]["meta"]["retrieval_cache"]
+    assert telemetry["hits"] + telemetry["misses"] == 2
+    assert telemetry["hit"] is (telemetry["hits"] == 1)
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_rsm_snapshot_ladder.py
+"""Historical RSM states are served from a snapshot ladder plus a gap replay."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from pmm.core import ledger_mirror
+from pmm.core.event_log import EventLog
+from pmm.core.mirror import Mirror
+from pmm.core.rsm import RecursiveSelfModel, RSMSnapshotLadder
+
+_TEXTS = [
+    "who are you?",
+    "Determinism keeps me stable.",
+    "CLAIM: failed to recall",
+    "unknown topic, adapt",
+    "an entity of instantiation",
+    "plain words",
+]
+
+
+def _populate(log: EventLog, count: int, seed: int = 5) -> None:
+    rng = random.Random(seed)
+    for _ in range(count):
+        roll = rng.random()
+        text = rng.choice(_TEXTS)
+        if roll < 0.4:
+            log.append(kind="user_message", content=text, meta={})
+        elif roll < 0.85:
+            log.append(
+                kind="assistant_message",
+                content=text,
+                meta={"topic": rng.choice(["memory", "identity"])},
+            )
+        else:
+            log.append(
+                kind="reflection",
+                content=json.dumps({"intent": text}),
+                meta={"source": "autonomy_kernel"},
+            )
+
+
+def _replayed(log: EventLog, event_id: int):
+    rsm = RecursiveSelfModel(eventlog=log)
+    rsm.rebuild(log.read_up_to(event_id))
+    return rsm.snapshot(include_concept_metrics=False)
+
+
+def test_ladder_states_match_full_replay_in_any_order():
+    log = EventLog(":memory:")
+    _populate(log, 700)
+    ladder = RSMSnapshotLadder(log, interval=50, max_rungs=4)
+    targets = [650, 10, 333, 334, 700, 0, 699, 120, 5000]
+    targets += random.Random(1).sample(range(1, 701), 15)
+    for target in targets:
+        state = ladder.state_at(target).snapshot(include_concept_metrics=False)
+        assert state == _replayed(log, target), target
+    assert len(ladder._rungs) <= 4
+
+    # A rung taken at the ledger end stays exact once more events arrive.
+    _populate(log, 80, seed=6)
+    assert ladder.state_at(760).snapshot(include_concept_metrics=False) == _replayed(
+        log, 760
+    )
+
+
+def test_diff_replays_only_the_gap_between_checks():
+    log = EventLog(":memory:")
+    _populate(log, 400)
+    mirror = Mirror(log, enable_rsm=True, auto_rebuild=False)
+    first = mirror.diff_rsm(100, 300)
+
+    expected = {
+        "tendencies_delta": {},
+        "gaps_added": [],
+        "gaps_resolved": [],
+    }
+    a = _replayed(log, 100)
+    b = _replayed(log, 300)
+    for key in sorted(
+        set(a["behavioral_tendencies"]) | set(b["behavioral_tendencies"])
+    ):
+        change = b["behavioral_tendencies"].get(key, 0) - a[
+            "behavioral_tendencies"
+        ].get(key, 0)
+        if change:
+            expected["tendencies_delta"][key] = change
+    expected["gaps_added"] = sorted(set(b["knowledge_gaps"]) - set(a["knowledge_gaps"]))
+    expected["gaps_resolved"] = sorted(
+        set(a["knowledge_gaps"]) - set(b["knowledge_gaps"])
+    )
+    assert first == expected
+
+    starts = []
+    original = log.iter_events
+
+    def _recording(start_id=0, **kwargs):
+        starts.append(start_id)
+        return original(start_id, **kwargs)
+
+    log.iter_events = _recording
+    Mirror(log, enable_rsm=True, auto_rebuild=False).diff_rsm(300, 380)
+    assert starts and min(starts) > 300
+
+
+def test_ledger_mirror_diff_matches_prefix_rebuilds():
+    log = EventLog(":memory:")
+    _populate(log, 300, seed=9)
+    mirror = ledger_mirror.LedgerMirror(log, listen=False)
+    a = mirror._rebuild_up_to(90).rsm_snapshot()
+    b = mirror._rebuild_up_to(260).rsm_snapshot()
+    diff = mirror.diff_rsm(90, 260)
+    for key, change in diff["tendencies_delta"].items():
+        assert (
+            b["behavioral_tendencies"].get(key, 0)
+            - a["behavioral_tendencies"].get(key, 0)
+            == change
+        )
+    assert diff["gaps_added"] == sorted(
+        set(b["knowledge_gaps"]) - set(a["knowledge_gaps"])
+    )
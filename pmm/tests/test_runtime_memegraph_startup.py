@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import threading
 from unittest.mock import patch
 
+import anyio
 import pytest
 
 from pmm.adapters.dummy_adapter import DummyAdapter
@@ -304,11 +306,21 @@ def test_consecutive_mcp_invocations_restore_history(tmp_path) -> None:
     seed_log.close()
 
     with patch.dict(os.environ, {"PMM_MCP_DB": db_path}):
-        first = pmm_turn(
-            prompt="Use topic.restore", model="dummy:", include_events=True
+        first = anyio.run(
+            functools.partial(
+                pmm_turn,
+                prompt="Use topic.restore",
+                model="dummy:",
+                include_events=True,
+            )
         )
-        second = pmm_turn(
-            prompt="Use topic.restore again", model="dummy:", include_events=True
+        second = anyio.run(
+            functools.partial(
+                pmm_turn,
+                prompt="Use topic.restore again",
+                model="dummy:",
+                include_events=True,
+            )
         )
 
     required = {int(ids["assistant"]), int(ids["open"]), int(ids["close"])}
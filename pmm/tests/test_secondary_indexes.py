@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.event_log import SECONDARY_INDEXES, EventLog
+from pmm.runtime.cli import _last_retrieval_config
+
+
+def _config(log: EventLog, **data) -> int:
+    return log.append(kind="config", content=json.dumps(data), meta={})
+
+
+def test_indexes_are_created_and_used_by_point_queries():
+    log = EventLog(":memory:")
+    names = {
+        row[0]
+        for row in log._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )
+    }
+    for spec in SECONDARY_INDEXES.values():
+        assert f"idx_events_{spec.name}" in names
+        plan = log._conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM events WHERE {spec.predicate} "
+            f"AND {spec.expression} = ? ORDER BY id DESC LIMIT 1",
+            ("x",),
+        ).fetchall()
+        assert any(f"idx_events_{spec.name}" in row[3] for row in plan)
+
+
+def test_read_by_index_matches_python_scan():
+    log = EventLog(":memory:")
+    log.append(kind="config", content="free text config", meta={})
+    first = _config(log, type="retrieval", strategy="fixed", limit=3)
+    _config(log, type="policy")
+    last = _config(log, type="retrieval", strategy="vector", limit=5)
+    log.append(kind="autonomy_stimulus", content="{}", meta={"slot_id": "s1"})
+    tick = log.append(kind="autonomy_tick", content="{}", meta={"slot_id": "s1"})
+    msg = log.append(kind="user_message", content="hi", meta={})
+    emb = log.append(
+        kind="embedding_add", content=json.dumps({"event_id": msg}), meta={}
+    )
+
+    assert [e["id"] for e in log.read_by_index("config_type", "retrieval")] == [
+        first,
+        last,
+    ]
+    latest = log.read_by_index("config_type", "retrieval", limit=1, reverse=True)
+    assert [e["id"] for e in latest] == [last]
+    assert _last_retrieval_config(log)["strategy"] == "vector"
+    ticks = log.read_by_index("autonomy_slot_id", "s1", kind="autonomy_tick")
+    assert [e["id"] for e in ticks] == [tick]
+    assert len(log.read_by_index("autonomy_slot_id", "s1")) == 2
+    assert log.read_by_index("autonomy_slot_id", "s1", kind="config") == []
+    assert [e["id"] for e in log.read_by_index("embedding_event_id", msg)] == [emb]
+    with pytest.raises(ValueError, match="unknown secondary index"):
+        log.read_by_index("missing", 1)
+
+
+def test_commitment_cid_index_and_exec_bind_lookup():
+    log = EventLog(":memory:")
+    log.append(
+        kind="commitment_open",
+        content="Commitment opened: x",
+        meta={"cid": "c1", "text": "x", "source": "user"},
+    )
+    log.append(
+        kind="commitment_close",
+        content="Commitment closed: c1",
+        meta={"cid": "c1", "source": "user"},
+    )
+    assert [e["kind"] for e in log.read_by_index("commitment_cid", "c1")] == [
+        "commitment_open",
+        "commitment_close",
+    ]
+
+    assert not log.has_exec_bind("c1")
+    _config(log, type="exec_bind", cid="c1", exec="idle_monitor")
+    assert log.has_exec_bind("c1")
+    assert not log.has_exec_bind("c2")
+
+
+def test_reopened_ledger_builds_indexes_over_existing_rows(tmp_path):
+    path = str(tmp_path / "idx.db")
+    log = EventLog(path)
+    cfg = _config(log, type="retrieval", strategy="fixed", limit=1)
+    with log._lock:
+        for spec in SECONDARY_INDEXES.values():
+            log._conn.execute(f"DROP INDEX idx_events_{spec.name}")
+    log.close()
+
+    reopened = EventLog(path)
+    assert [e["id"] for e in reopened.read_by_index("config_type", "retrieval")] == [
+        cfg
+    ]
+    reopened.close()
+    reader = EventLog(path, mode="reader")
+    assert reader.read_by_index("config_type", "retrieval")[0]["id"] == cfg
+    reader.close()
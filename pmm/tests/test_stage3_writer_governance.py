@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import sqlite3
 import subprocess
 import sys
@@ -8,6 +9,7 @@ import time
 from pathlib import Path
 from unittest.mock import patch
 
+import anyio
 import pytest
 
 from pmm.core.event_log import (
@@ -184,7 +186,7 @@ def test_mcp_one_shot_contender_fails_explicitly_then_acquires_after_release(
             clear=False,
         ):
             with pytest.raises(RuntimeError, match="live writer"):
-                pmm_turn("contender", model="dummy")
+                anyio.run(functools.partial(pmm_turn, "contender", model="dummy"))
         assert time.monotonic() - started < 5
     finally:
         assert owner_process.stdin is not None
@@ -196,7 +198,7 @@ def test_mcp_one_shot_contender_fails_explicitly_then_acquires_after_release(
         {"PMM_MCP_DB": path, "PMM_MCP_MODEL": "dummy"},
         clear=False,
     ):
-        result = pmm_turn("successor", model="dummy")
+        result = anyio.run(functools.partial(pmm_turn, "successor", model="dummy"))
     assert result["event_range"]["first"] is not None
 
 
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from pmm.core.event_log import WAL_STORAGE_PROFILE, EventLog, StorageProfile
+from pmm.core.writer_session import WriterOwnershipConflict
+
+
+def test_wal_profile_applies_pragmas_and_keeps_lease(tmp_path):
+    path = str(tmp_path / "wal.db")
+    log = EventLog(path, storage=WAL_STORAGE_PROFILE)
+    mode = log._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    log.append(kind="test_event", content="a", meta={})
+
+    with pytest.raises(WriterOwnershipConflict):
+        EventLog(path, storage=WAL_STORAGE_PROFILE)
+
+    reader = EventLog(path, mode="reader", storage=WAL_STORAGE_PROFILE)
+    assert [e["content"] for e in reader.read_all()] == ["a"]
+    reader.close()
+    log.close()
+
+
+def test_pooled_reads_do_not_wait_for_open_batch(tmp_path):
+    log = EventLog(str(tmp_path / "pool.db"), storage=StorageProfile(read_pool_size=2))
+    log.append(kind="test_event", content="committed", meta={})
+    seen: list[list[str]] = []
+
+    with log.batch():
+        log.append(kind="test_event", content="pending", meta={})
+        # The batch thread reads its own uncommitted rows...
+        assert [e["content"] for e in log.read_all()] == ["committed", "pending"]
+        # ...while another thread reads committed state without blocking.
+        reader = threading.Thread(
+            target=lambda: seen.append([e["content"] for e in log.read_all()])
+        )
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    assert seen == [["committed"]]
+    assert log.count() == 2
+    log.close()
+
+
+def test_storage_profile_validation():
+    with pytest.raises(ValueError):
+        StorageProfile(journal_mode="memory; DROP TABLE events")
+    with pytest.raises(ValueError):
+        EventLog(":memory:", storage=WAL_STORAGE_PROFILE)
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: pmm/tests/test_summary_index.py
+"""The summary index serves summary stages without rescanning or re-embedding."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pmm.core.concept_graph import ConceptGraph
+from pmm.core.event_log import EventLog
+from pmm.core.meme_graph import MemeGraph
+from pmm.retrieval import vector as vector_module
+from pmm.retrieval.pipeline import RetrievalConfig, run_retrieval_pipeline
+from pmm.retrieval.summary_index import SummaryIndex
+
+
+def _setup():
+    log = EventLog(":memory:")
+    mg = MemeGraph(log)
+    cg = ConceptGraph(log)
+    index = SummaryIndex(log)
+    log.rebuild_and_register_listener(mg.rebuild, mg.add_event, name="test.mg")
+    log.rebuild_and_register_listener(cg.rebuild, cg.sync, name="test.cg")
+    log.rebuild_and_register_listener(
+        index.rebuild,
+        index.sync,
+        name="test.summary_index",
+        snapshot=index.projection_snapshot(),
+    )
+    for i in range(3):
+        uid = log.append(kind="user_message", content=f"talk about alpha {i}", meta={})
+        log.append(
+            kind="lifetime_memory",
+            content=f"alpha summary {i}",
+            meta={"sample_ids": [uid], "concepts": ["topic.alpha", f"topic.c{i}"]},
+        )
+    return log, mg, cg, index
+
+
+def _run(log, mg, cg, index=None, seeds=("topic.c2",)):
+    config = RetrievalConfig(always_include_concepts=list(seeds))
+    return run_retrieval_pipeline(
+        query_text="alpha summary",
+        eventlog=log,
+        concept_graph=cg,
+        meme_graph=mg,
+        config=config,
+        summary_index=index,
+    )
+
+
+def test_indexed_results_match_the_scanning_pipeline():
+    log, mg, cg, index = _setup()
+    indexed = _run(log, mg, cg, index, seeds=("topic.alpha", "topic.c2"))
+    assert indexed == _run(log, mg, cg, seeds=("topic.alpha", "topic.c2"))
+    lm_ids = [ev["id"] for ev in log.read_by_kind("lifetime_memory")]
+    assert lm_ids[0] in indexed.event_ids
+    assert indexed.stage_metrics["summary_vector"]["events_embedded"] == 0
+    assert index.concept_span("topic.alpha", cg) == (lm_ids[0], lm_ids[-1])
+
+
+def test_turns_neither_scan_nor_reembed_summaries(monkeypatch):
+    log, mg, cg, index = _setup()
+    real_read_by_kind = EventLog.read_by_kind
+
+    def guarded(self, kind, limit=None, reverse=False):
+        # Pinning the newest summaries is a bounded read and stays allowed.
+        if kind == "lifetime_memory" and not reverse:
+            raise AssertionError("full lifetime_memory scan")
+        return real_read_by_kind(self, kind, limit=limit, reverse=reverse)
+
+    monkeypatch.setattr(EventLog, "read_by_kind", guarded)
+    embedded = []
+    real_text_vector = vector_module._text_vector
+
+    def counting(model, dims, text):
+        embedded.append(text)
+        return real_text_vector(model, dims, text)
+
+    monkeypatch.setattr(vector_module, "_text_vector", counting)
+    _run(log, mg, cg, index)
+    assert not any(text.startswith("alpha summary") for text in embedded)
+    with pytest.raises(AssertionError):
+        _run(log, mg, cg)
+
+
+def test_concept_spans_follow_later_aliases():
+    log, mg, cg, index = _setup()
+    lm_ids = [ev["id"] for ev in log.read_by_kind("lifetime_memory")]
+    assert index.concept_span("topic.c0", cg) == (lm_ids[0], lm_ids[0])
+    assert index.concept_span("topic.c2", cg) == (lm_ids[2], lm_ids[2])
+
+    log.append(
+        kind="concept_alias",
+        content=json.dumps({"from": "topic.c0", "to": "topic.c2"}),
+        meta={},
+    )
+    assert index.concept_span("topic.c2", cg) == (lm_ids[0], lm_ids[2])
+    result = _run(log, mg, cg, index)
+    assert result == _run(log, mg, cg)
+    assert lm_ids[0] in result.event_ids
+
+    later = log.append(
+        kind="lifetime_memory",
+        content="newest",
+        meta={"concepts": ["topic.c0"]},
+    )
+    assert index.concept_span("topic.c2", cg) == (lm_ids[0], later)
+
+
+def test_snapshot_round_trip_restores_the_index():
+    log, _mg, cg, index = _setup()
+    state = json.loads(json.dumps(index.projection_snapshot().dump()))
+    restored = SummaryIndex(log)
+    restored.projection_snapshot().load(state)
+    assert restored.last_event_id == index.last_event_id
+    assert restored.events("lifetime_memory") == index.events("lifetime_memory")
+    assert restored.concept_span("topic.alpha", cg) == index.concept_span(
+        "topic.alpha", cg
+    )
+    query = vector_module.DeterministicEmbedder().embed("alpha")
+    assert restored.scores(query, model="hash64", dims=64) == index.scores(
+        query, model="hash64", dims=64
+    )
+    assert index.scores(query, model="hash64", dims=32) == {}
+    with pytest.raises(ValueError):
+        SummaryIndex(log, dims=32).projection_snapshot().load(state)
@@ -36,3 +36,22 @@ def test_backfill_embeddings_appends_missing_and_advances_cursor() -> None:
         if e.get("meta", {}).get("source") == "indexer.backfill"
     ]
     assert len(emb_events) == 2
+
+
+def test_backfill_refreshes_the_embedding_store_once_per_batch(monkeypatch) -> None:
+    log = EventLog(":memory:")
+    for i in range(20):
+        log.append(kind="user_message", content=f"message {i}", meta={})
+    indexer = Indexer(log)
+    refreshes = []
+    real_refresh = indexer.embeddings.refresh
+
+    def counting_refresh():
+        refreshes.append(1)
+        return real_refresh()
+
+    monkeypatch.setattr(indexer.embeddings, "refresh", counting_refresh)
+    assert indexer.backfill_embeddings(model="hash64", dims=16, batch=20) == 20
+    assert len(refreshes) == 1
+    # Rows appended by the batch are seen on the next pass, not duplicated.
+    assert indexer.embeddings.missing(range(1, 21), model="hash64", dims=16) == []
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+from __future__ import annotations
+
+import math
+from hashlib import sha256
+from typing import Dict, List
+
+from pmm.retrieval.vector import (
+    DeterministicEmbedder,
+    build_embedding_content,
+    cosine,
+    select_by_vector,
+)
+
+
+def _reference_embed(
+    text: str,
+    *,
+    model: str = "hash64",
+    dims: int = 64,
+    idf: Dict[str, float] | None = None,
+    extra_tokens: List[str] | None = None,
+) -> List[float]:
+    # Original per-index hashing and accumulation, kept as the compatibility oracle.
+    dims = max(8, int(dims))
+    toks = list(extra_tokens or []) + [t for t in (text or "").split() if t]
+    if not toks:
+        return [0.0] * dims
+    agg = [0.0] * dims
+    for t in toks:
+        v = []
+        for i in range(dims):
+            h = sha256(f"{t}:{i}".encode("utf-8")).digest()
+            n = int.from_bytes(h[:4], byteorder="big", signed=False)
+            v.append((n / 2**32) * 2.0 - 1.0)
+        weight = 1.0
+        if model == "hash64_tfidf" and idf is not None:
+            weight = float(idf.get(t, 1.0))
+        for i in range(dims):
+            agg[i] += weight * v[i]
+    norm = math.sqrt(sum(x * x for x in agg))
+    if norm == 0.0:
+        return [0.0] * dims
+    return [x / norm for x in agg]
+
+
+TEXTS = [
+    "",
+    "hello",
+    "repeat repeat repeat tokens",
+    "Unicode naïve café ✓ tokens",
+    "the quick brown fox jumps over the lazy dog " * 20,
+]
+
+
+def test_embed_is_bit_identical_to_reference():
+    for dims in (8, 16, 64, 100):
+        embedder = DeterministicEmbedder(dims=dims)
+        for text in TEXTS:
+            assert embedder.embed(text) == _reference_embed(text, dims=dims)
+            assert embedder.embed(text) == _reference_embed(text, dims=dims)
+        assert embedder.embed_many(TEXTS) == [
+            _reference_embed(t, dims=dims) for t in TEXTS
+        ]
+
+
+def test_tfidf_embed_is_bit_identical_to_reference():
+    idf = {"repeat": 0.25, "tokens": 1.5, "KIND:user_message": 0.0}
+    embedder = DeterministicEmbedder(model="hash64_tfidf", dims=64)
+    for text in TEXTS:
+        got = embedder.embed(text, idf=idf, extra_tokens=["KIND:user_message"])
+        want = _reference_embed(
+            text,
+            model="hash64_tfidf",
+            idf=idf,
+            extra_tokens=["KIND:user_message"],
+        )
+        assert got == want
+
+
+def test_cached_vectors_are_not_shared_mutable_state():
+    embedder = DeterministicEmbedder()
+    first = embedder.embed_many(["shared text"])[0]
+    first[0] = 99.0
+    assert embedder.embed_many(["shared text"])[0] == _reference_embed("shared text")
+    tok = embedder._tok_vec("shared")
+    tok[0] = 99.0
+    assert embedder._tok_vec("shared")[0] != 99.0
+
+
+def test_select_by_vector_scores_match_reference_and_embedding_content_stable():
+    events = [
+        {"id": i + 1, "kind": "user_message", "content": f"apples topic {i}"}
+        for i in range(12)
+    ]
+    ids, scores = select_by_vector(events=events, query_text="apples topic 3", limit=4)
+    q = _reference_embed("apples topic 3")
+    expected = sorted(
+        ((e["id"], cosine(q, _reference_embed(e["content"]))) for e in events),
+        key=lambda t: (-t[1], t[0]),
+    )[:4]
+    assert ids == [eid for eid, _ in expected]
+    assert scores == [float(f"{s:.6f}") for _, s in expected]
+    assert build_embedding_content(
+        event_id=1, text="apples topic 0", model="hash64", dims=64
+    ) == build_embedding_content(
+        event_id=1, text="apples topic 0", model="hash64", dims=64
+    )
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: scripts/bench_autonomy_tick.py
+"""
+Measure AutonomyKernel tick latency as the ledger grows.
+
+For each ledger size a synthetic history is written (messages with
+embeddings, metrics turns, reflections, summaries, ticks and commitments),
+then a kernel is started and timed over a run of ticks. A tick is
+``decide_next_action`` plus the tick append and the metrics/checkpoint/
+tuning/telemetry helpers the runtime loop calls afterwards. ``read_all`` time
+is printed alongside for scale: it is what each full-ledger scan costs.
+
+Usage:
+    python3 scripts/bench_autonomy_tick.py --sizes 2000 10000 40000 --ticks 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+
+from pmm.core.event_log import EventLog
+from pmm.retrieval.vector import build_embedding_content
+from pmm.runtime.autonomy_kernel import AutonomyKernel
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark AutonomyKernel tick latency against ledger size."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[2_000, 10_000, 40_000],
+        help="Approximate ledger sizes in events (default: 2000 10000 40000)",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=30,
+        help="Timed ticks per ledger size (default: 30)",
+    )
+    return parser.parse_args()
+
+
+def populate(log: EventLog, events: int) -> None:
+    turn = 0
+    with log.batch():
+        while log.count() < events:
+            turn += 1
+            for kind in ("user_message", "assistant_message"):
+                text = f"{kind} {turn}"
+                event_id = log.append(kind=kind, content=text, meta={})
+                log.append(
+                    kind="embedding_add",
+                    content=build_embedding_content(
+                        event_id=event_id, text=text, model="hash64", dims=64
+                    ),
+                    meta={"source": "bench"},
+                )
+            log.append(kind="metrics_turn", content=f"turn {turn}", meta={})
+            log.append(
+                kind="autonomy_tick",
+                content=json.dumps({"decision": "idle"}),
+                meta={"source": "autonomy_kernel"},
+            )
+            if turn % 5 == 0:
+                log.append(
+                    kind="reflection",
+                    content=json.dumps({"intent": f"turn {turn}"}),
+                    meta={"source": "autonomy_kernel"},
+                )
+            if turn % 25 == 0:
+                log.append(kind="summary_update", content="{}", meta={})
+            if turn % 10 == 0:
+                cid = f"bench{turn:06d}"
+                log.append(
+                    kind="commitment_open",
+                    content=f"Commitment opened: task {turn}",
+                    meta={"cid": cid, "origin": "user", "source": "user"},
+                )
+                if turn % 20 == 0:
+                    log.append(
+                        kind="commitment_close",
+                        content=f"Commitment closed: {cid}",
+                        meta={"cid": cid, "source": "user"},
+                    )
+
+
+def tick(kernel: AutonomyKernel, log: EventLog, slot: int) -> None:
+    decision = kernel.decide_next_action()
+    log.append(
+        kind="autonomy_tick",
+        content=json.dumps(decision.as_dict(), sort_keys=True),
+        meta={"source": "autonomy_kernel", "slot": slot},
+    )
+    kernel._maybe_emit_autonomy_metrics()
+    kernel._maybe_append_checkpoint()
+    kernel._maybe_tune_thresholds()
+    kernel._maybe_emit_stability_metrics()
+    kernel._maybe_emit_coherence_check()
+    kernel._maybe_emit_meta_policy_update()
+    kernel._maybe_emit_policy_update()
+
+
+def run(size: int, ticks: int) -> None:
+    log = EventLog(":memory:")
+    populate(log, size)
+    started = time.perf_counter()
+    log.read_all()
+    read_all = time.perf_counter() - started
+
+    started = time.perf_counter()
+    kernel = AutonomyKernel(log)
+    startup = time.perf_counter() - started
+    tick(kernel, log, 0)  # warm-up: first tick folds any startup appends
+
+    latencies = []
+    for slot in range(1, ticks + 1):
+        log.append(kind="user_message", content=f"tick {slot}", meta={})
+        started = time.perf_counter()
+        tick(kernel, log, slot)
+        latencies.append(time.perf_counter() - started)
+    print(
+        f"{log.count():>8} events: tick median {statistics.median(latencies) * 1e3:7.2f}ms"
+        f"  p90 {sorted(latencies)[int(0.9 * (len(latencies) - 1))] * 1e3:7.2f}ms"
+        f"  startup {startup:6.2f}s  read_all {read_all * 1e3:7.1f}ms"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    for size in args.sizes:
+        run(size, args.ticks)
+
+
+if __name__ == "__main__":
+    main()
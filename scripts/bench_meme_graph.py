@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: PMM-1.0
+# Copyright (c) 2025 Scott O'Nanski
+
+# Path: scripts/bench_meme_graph.py
+"""
+Compare memory and latency of CompactDiGraph against networkx.DiGraph.
+
+Both stores receive the same synthetic MemeGraph-shaped workload: one node
+per event (kind + turn_protocol), a ``replies_to`` edge per assistant turn,
+and a commitment open/close pair with ``commits_to``/``closes``/``reflects_on``
+edges every few turns. networkx is optional; without it only the compact
+graph is measured.
+
+Usage:
+    python3 scripts/bench_meme_graph.py --events 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from pmm.core.compact_graph import CompactDiGraph
+
+Node = Tuple[int, Dict]
+Edge = Tuple[int, int, str]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark MemeGraph graph stores on a synthetic ledger."
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=200_000,
+        help="Number of synthetic events (default: 200000)",
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=50_000,
+        help="Number of adjacency queries to time (default: 50000)",
+    )
+    return parser.parse_args()
+
+
+def workload(events: int) -> Tuple[List[Node], List[Edge]]:
+    nodes: List[Node] = []
+    edges: List[Edge] = []
+    event_id = 0
+    while event_id < events:
+        user = event_id + 1
+        assistant = user + 1
+        nodes.append((user, {"kind": "user_message", "turn_protocol": None}))
+        nodes.append((assistant, {"kind": "assistant_message", "turn_protocol": None}))
+        edges.append((assistant, user, "replies_to"))
+        event_id = assistant
+        if assistant % 10 == 0:
+            opened, closed, reflected = assistant + 1, assistant + 2, assistant + 3
+            nodes.append(
+                (opened, {"kind": "commitment_open", "turn_protocol": None, "cid": "c"})
+            )
+            nodes.append(
+                (
+                    closed,
+                    {"kind": "commitment_close", "turn_protocol": None, "cid": "c"},
+                )
+            )
+            nodes.append((reflected, {"kind": "reflection", "turn_protocol": None}))
+            edges.append((opened, assistant, "commits_to"))
+            edges.append((closed, opened, "closes"))
+            edges.append((reflected, assistant, "reflects_on"))
+            event_id = reflected
+    return nodes, edges
+
+
+def build(factory: Callable[[], object], nodes: List[Node], edges: List[Edge]):
+    graph = factory()
+    for node, data in nodes:
+        graph.add_node(node, **data)
+    for source, target, label in edges:
+        graph.add_edge(source, target, label=label)
+    return graph
+
+
+def measure(
+    factory: Callable[[], object], nodes: List[Node], edges: List[Edge]
+) -> Tuple[object, float, int]:
+    # Time and memory come from separate builds; tracemalloc skews timings.
+    gc.collect()
+    tracemalloc.start()
+    graph = build(factory, nodes, edges)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    gc.collect()
+    started = time.perf_counter()
+    graph = build(factory, nodes, edges)
+    return graph, time.perf_counter() - started, size
+
+
+def labeled_walk(graph, node: int) -> None:
+    """Read a node's kind plus labeled in/out edges, as MemeGraph queries do."""
+    if isinstance(graph, CompactDiGraph):
+        graph.kind(node)
+        graph.labeled_successors(node)
+        graph.labeled_predecessors(node)
+        return
+    graph.nodes[node].get("kind")
+    [(succ, data.get("label")) for succ, data in graph.succ[node].items()]
+    [(pred, data.get("label")) for pred, data in graph.pred[node].items()]
+
+
+def query_latency(graph, nodes: List[Node], queries: int) -> float:
+    step = max(1, len(nodes) // max(1, queries))
+    probes = [node for node, _ in nodes[::step]][:queries]
+    started = time.perf_counter()
+    for node in probes:
+        labeled_walk(graph, node)
+        graph.has_edge(node, node - 1)
+    return (time.perf_counter() - started) / max(1, len(probes))
+
+
+def import_seconds(module: str) -> float:
+    import subprocess
+    import sys
+
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip())
+
+
+def main() -> None:
+    args = parse_args()
+    nodes, edges = workload(args.events)
+    print(f"workload: {len(nodes)} nodes, {len(edges)} edges")
+
+    stores: Dict[str, Callable[[], object]] = {"compact": CompactDiGraph}
+    modules = {"compact": "pmm.core.compact_graph"}
+    try:
+        import networkx as nx
+    except ImportError:
+        print("networkx not installed; measuring the compact graph only")
+    else:
+        stores["networkx"] = nx.DiGraph
+        modules["networkx"] = "networkx"
+
+    for name, factory in stores.items():
+        graph, build, size = measure(factory, nodes, edges)
+        per_query = query_latency(graph, nodes, args.queries)
+        print(
+            f"{name:>9}: build {build:7.3f}s  memory {size / 2**20:8.1f} MiB  "
+            f"query {per_query * 1e6:6.2f}us  import {import_seconds(modules[name]):.3f}s"
+        )
+        del graph
+
+
+if __name__ == "__main__":
+    main()
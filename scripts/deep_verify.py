@@ -47,6 +47,14 @@ def analyze_db(name: str):
         print(f"Final RSM State: {rsm}")
     else:
         print("Final RSM State: None found")
+
+    # 3. Latest checkpoint manifest against the ledger
+    manifests = [e for e in events if e["kind"] == "checkpoint_manifest"]
+    if manifests:
+        ok = log.verify_checkpoint(manifests[-1])
+        print(f"Checkpoint #{manifests[-1]['id']}: {'verified' if ok else 'MISMATCH'}")
+    else:
+        print("Checkpoint: None found")
     log.close()
 
 